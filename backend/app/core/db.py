@@ -6,28 +6,48 @@ from beanie import init_beanie
 from app.services.auth_service.models.user import User
 from app.services.application.models.application import Application
 from app.services.job.models.job import Job
-from app.services.resume.models.resume import Resume
+from app.services.resume.models.resume import Resume, ResumeBlob
 from app.services.profile.models.profile import Profile
+from app.services.dashboard.models.dashboard import EmployerStats
+from app.services.analytics.models.analytics import AnalyticsEvent, AnalyticsRollup
+from app.services.notifications.models.outbox import OutboxMessage
+from app.services.localization.models.translation import Translation
 
 # Load .env variables
 load_dotenv()
 
 # ✅ Use the correct env key
+# The server should be a replica set (a single-node one is enough, e.g. mongodb://localhost:27017/?replicaSet=rs0):
+# the notification outbox writes in transactions, and on a standalone server it logs an error and can lose emails.
 MONGODB_URI = os.getenv("MONGODB_URL")  # Make sure your .env uses MONGODB_URL, not MONGODB_URI
 
 # ✅ Connect to MongoDB
 client = AsyncIOMotorClient(MONGODB_URI)
 db = client["jobboard"]  # Will use the db name you added in URL, e.g. /jobboard
 
-# ✅ Init Beanie with all models
-async def init_db():
+# ✅ Drop indexes that are no longer declared on a model (off by default)
+MONGODB_DROP_STALE_INDEXES = os.getenv("MONGODB_DROP_STALE_INDEXES", "false").lower() == "true"
+
+# ✅ All Beanie documents; each declares its indexes in Settings.indexes
+DOCUMENT_MODELS = [
+    User,
+    Application,
+    Job,
+    Resume,
+    ResumeBlob,
+    Profile,
+    EmployerStats,
+    AnalyticsEvent,
+    AnalyticsRollup,
+    OutboxMessage,
+    Translation,
+]
+
+# ✅ Init Beanie with all models, creating/reconciling declared indexes
+async def init_db(skip_indexes: bool = False):
     await init_beanie(
         database=db,
-        document_models=[
-            User,
-            Application,
-            Job,
-            Resume,
-            Profile,
-        ],
+        document_models=DOCUMENT_MODELS,
+        allow_index_dropping=MONGODB_DROP_STALE_INDEXES,
+        skip_indexes=skip_indexes,
     )
@@ -0,0 +1,35 @@
+# app/core/events.py
+"""
+Minimal in-process publish/subscribe used to fan out domain changes
+(e.g. "job.created") to caches and indexes without coupling the write
+paths to every consumer.
+"""
+import inspect
+import logging
+from collections import defaultdict
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+_subscribers: Dict[str, List[Callable[[Any], Any]]] = defaultdict(list)
+
+
+def subscribe(event: str, handler: Callable[[Any], Any]):
+    if handler not in _subscribers[event]:
+        _subscribers[event].append(handler)
+
+
+def unsubscribe(event: str, handler: Callable[[Any], Any]):
+    if handler in _subscribers[event]:
+        _subscribers[event].remove(handler)
+
+
+async def publish(event: str, payload: Any):
+    """Call every handler; a failing handler is logged and never fails the caller"""
+    for handler in list(_subscribers[event]):
+        try:
+            result = handler(payload)
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            logger.exception("Handler %r failed for event %s", handler, event)
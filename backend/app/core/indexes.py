@@ -0,0 +1,71 @@
+# app/core/indexes.py
+"""
+Index report for the Beanie documents registered in app.core.db.
+
+Indexes are declared per model in ``Settings.indexes`` and created (and,
+with MONGODB_DROP_STALE_INDEXES=true, reconciled) by ``init_db`` during
+the FastAPI lifespan. This module only inspects the live collections:
+
+    python -m app.core.indexes
+
+lists indexes that are declared but missing, present but undeclared,
+and present but never used since the last server restart ($indexStats).
+"""
+import asyncio
+import sys
+from typing import Any, Dict, List
+
+from app.core.db import DOCUMENT_MODELS, init_db
+
+
+def _key(spec) -> tuple:
+    # index_information() gives a list of pairs, IndexModel.document a SON
+    pairs = spec.items() if hasattr(spec, "items") else spec
+    return tuple((field, direction) for field, direction in pairs)
+
+
+async def index_report() -> List[Dict[str, Any]]:
+    report = []
+    for model in DOCUMENT_MODELS:
+        collection = model.get_motor_collection()
+        declared = {
+            index.name: _key(index.index.document["key"])
+            for index in (model.get_settings().indexes or [])
+        }
+        existing = {
+            name: _key(details["key"])
+            for name, details in (await collection.index_information()).items()
+            if name != "_id_"
+        }
+        usage = {}
+        try:
+            async for stat in collection.aggregate([{"$indexStats": {}}]):
+                usage[stat["name"]] = stat["accesses"]["ops"]
+        except Exception:
+            pass  # $indexStats needs the clusterMonitor role; report without usage
+
+        existing_keys = set(existing.values())
+        declared_keys = set(declared.values())
+        report.append({
+            "collection": collection.name,
+            "missing": [name for name, key in declared.items() if key not in existing_keys],
+            "undeclared": [name for name, key in existing.items() if key not in declared_keys],
+            "unused": [name for name in existing if usage.get(name) == 0],
+            "usage": usage,
+        })
+    return report
+
+
+async def main() -> int:
+    await init_db(skip_indexes=True)
+    report = await index_report()
+    for entry in report:
+        print(f"[{entry['collection']}]")
+        for label in ("missing", "undeclared", "unused"):
+            print(f"  {label:<10} {', '.join(entry[label]) or '-'}")
+    # Non-zero exit when a declared index is missing, so CI can gate on it
+    return 1 if any(entry["missing"] for entry in report) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,84 @@
+# app/core/raw_reads.py
+"""
+Read-only query layer on the Motor handle from app/core/db.py.
+
+List endpoints that only serialize their results can stream projected raw
+documents from here instead of hydrating Beanie Documents. Which endpoints
+do so is chosen with RAW_READ_ENDPOINTS (comma separated names, "all" or
+"none"), so each one can fall back to its Beanie path independently.
+"""
+import os
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+from beanie import Document
+from fastapi import Response
+from pydantic import TypeAdapter
+
+# ✅ Endpoint names: list_jobs, employer_jobs, candidate_applications, employer_applications, resumes
+RAW_READ_ENDPOINTS = {
+    name.strip() for name in os.getenv("RAW_READ_ENDPOINTS", "all").lower().split(",") if name.strip()
+}
+
+_document_adapter = TypeAdapter(Dict[str, Any])
+_documents_adapter = TypeAdapter(List[Dict[str, Any]])
+
+
+def raw_reads_enabled(endpoint: str) -> bool:
+    if "none" in RAW_READ_ENDPOINTS:
+        return False
+    return "all" in RAW_READ_ENDPOINTS or endpoint in RAW_READ_ENDPOINTS
+
+
+def collection(model: Type[Document]):
+    # Imported here: app.core.db loads every service's models, and those
+    # services import this module
+    from app.core import db as core_db
+
+    return core_db.db[model.get_collection_name()]
+
+
+def projection(fields: Iterable[str]) -> Dict[str, int]:
+    """Mongo projection for API field names ("id" maps to _id, which is always returned)"""
+    return {field: 1 for field in fields if field != "id"}
+
+
+async def stream(
+    model: Type[Document],
+    query: Dict[str, Any],
+    fields: Optional[Iterable[str]] = None,
+    sort: Optional[Sequence[Tuple[str, int]]] = None,
+    limit: int = 0,
+    batch_size: Optional[int] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield raw documents (with ObjectId _id) as the driver receives them"""
+    cursor = collection(model).find(query, projection(fields) if fields is not None else None)
+    if sort:
+        cursor = cursor.sort(list(sort))
+    if limit:
+        cursor = cursor.limit(limit)
+    if batch_size:
+        cursor = cursor.batch_size(batch_size)
+    async for doc in cursor:
+        yield doc
+
+
+async def find(model: Type[Document], query: Dict[str, Any], **kwargs) -> List[Dict[str, Any]]:
+    return [doc async for doc in stream(model, query, **kwargs)]
+
+
+def with_str_id(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace _id with the string "id" used by API payloads"""
+    doc["id"] = str(doc.pop("_id"))
+    return doc
+
+
+def encode_document(doc: Dict[str, Any]) -> bytes:
+    return _document_adapter.dump_json(doc)
+
+
+def encode_documents(docs: List[Dict[str, Any]]) -> bytes:
+    return _documents_adapter.dump_json(docs)
+
+
+def json_response(content: bytes, status_code: int = 200) -> Response:
+    return Response(content=content, status_code=status_code, media_type="application/json")
@@ -0,0 +1,181 @@
+# app/core/response_cache.py
+"""
+Cache of encoded JSON response bodies with ETag / If-None-Match support.
+
+Entries live in a namespace with a generation number: invalidating a whole
+namespace (every page of a listing) just bumps the generation, and stale
+entries age out through LRU/TTL eviction. Invalidating one entry deletes
+it and bumps the namespace's write counter; a miss only stores its body
+when that counter did not move while it rendered. Backends are pluggable; "memory"
+is per process, "redis" is shared between workers when redis is installed.
+"""
+import hashlib
+import os
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+
+from app.core.cache import TTLCache
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # the shared backend is optional
+    redis = None
+
+# ✅ memory | redis | none
+RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "memory")
+RESPONSE_CACHE_URL = os.getenv("RESPONSE_CACHE_URL", "redis://localhost:6379/0")
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "30"))
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "2048"))
+
+
+class MemoryBackend:
+    def __init__(self, maxsize: int = RESPONSE_CACHE_SIZE, ttl: float = RESPONSE_CACHE_TTL):
+        self.entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.generations: Dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.entries.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        self.entries.set(key, value, ttl=ttl)
+
+    async def delete(self, key: str):
+        self.entries.pop(key)
+
+    async def generation(self, namespace: str) -> int:
+        return self.generations.get(namespace, 0)
+
+    async def bump(self, namespace: str):
+        self.generations[namespace] = self.generations.get(namespace, 0) + 1
+
+
+class RedisBackend:
+    def __init__(self, url: str = RESPONSE_CACHE_URL):
+        if redis is None:
+            raise RuntimeError("RESPONSE_CACHE_BACKEND=redis requires the redis package")
+        self.client = redis.from_url(url)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(f"rc:{key}")
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        await self.client.set(f"rc:{key}", value, px=int(ttl * 1000))
+
+    async def delete(self, key: str):
+        await self.client.delete(f"rc:{key}")
+
+    async def generation(self, namespace: str) -> int:
+        return int(await self.client.get(f"rc:gen:{namespace}") or 0)
+
+    async def bump(self, namespace: str):
+        await self.client.incr(f"rc:gen:{namespace}")
+
+
+# Backend name -> factory; other shared stores register themselves here
+CACHE_BACKENDS: Dict[str, Callable[[], object]] = {
+    "memory": MemoryBackend,
+    "redis": RedisBackend,
+}
+
+
+def register_cache_backend(name: str, factory: Callable[[], object]):
+    CACHE_BACKENDS[name] = factory
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in tags or etag in tags
+
+
+class ResponseCache:
+    def __init__(self, backend_name: str = RESPONSE_CACHE_BACKEND, ttl: float = RESPONSE_CACHE_TTL):
+        self.backend_name = backend_name
+        self.enabled = backend_name != "none"
+        self.backend = CACHE_BACKENDS[backend_name]() if self.enabled else None
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.invalidations = 0
+
+    async def _key(self, namespace: str, key: str) -> str:
+        return f"{namespace}:{await self.backend.generation(namespace)}:{key}"
+
+    async def _writes(self, namespace: str) -> int:
+        """Counter of single-entry invalidations in the namespace"""
+        return await self.backend.generation(f"{namespace}:writes")
+
+    async def lookup(self, full_key: str) -> Optional[Tuple[str, bytes]]:
+        value = await self.backend.get(full_key)
+        if value is None:
+            return None
+        etag, _, body = value.partition(b"\n")
+        return etag.decode(), body
+
+    async def store(self, full_key: str, body: bytes) -> str:
+        etag = make_etag(body)
+        await self.backend.set(full_key, etag.encode() + b"\n" + body, self.ttl)
+        return etag
+
+    async def invalidate(self, namespace: str, key: Optional[str] = None):
+        """Drop one entry, or every entry of the namespace when key is None"""
+        if not self.enabled:
+            return
+        self.invalidations += 1
+        if key is None:
+            await self.backend.bump(namespace)
+        else:
+            # Bumped before the delete so a render already in flight cannot store afterwards
+            await self.backend.bump(f"{namespace}:writes")
+            await self.backend.delete(await self._key(namespace, key))
+
+    async def respond(self, request: Request, namespace: str, key: str,
+                      render: Callable[[], Awaitable[bytes]]) -> Response:
+        """Serve the cached body (or 304), rendering and storing it on a miss"""
+        if not self.enabled:
+            body = await render()
+            return self._response(request, body, make_etag(body), "BYPASS")
+
+        # Resolved before rendering: a body rendered across a namespace
+        # invalidation is stored under the old generation and never served
+        full_key = await self._key(namespace, key)
+        cached = await self.lookup(full_key)
+        if cached is not None:
+            self.hits += 1
+            etag, body = cached
+            return self._response(request, body, etag, "HIT")
+
+        self.misses += 1
+        writes = await self._writes(namespace)
+        body = await render()
+        if await self._writes(namespace) != writes:
+            # An entry of this namespace was invalidated mid-render: this body may predate it
+            return self._response(request, body, make_etag(body), "MISS")
+        etag = await self.store(full_key, body)
+        return self._response(request, body, etag, "MISS")
+
+    def _response(self, request: Request, body: bytes, etag: str, status: str) -> Response:
+        headers = {"ETag": etag, "X-Cache": status, "Cache-Control": "no-cache"}
+        if etag_matches(request, etag):
+            self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend_name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "not_modified": self.not_modified,
+            "invalidations": self.invalidations,
+        }
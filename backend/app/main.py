@@ -2,6 +2,14 @@ from fastapi import FastAPI
 from app.core.db import init_db
 from fastapi.middleware.cors import CORSMiddleware
 from app.routes import include_all_routers
+from app.services.auth_service.utils.password_hash import shutdown_password_executor
+from app.services.ai_search import main as ai_search_service
+from app.services.job import main as job_service
+from app.services.application import main as application_service
+from app.services.dashboard import main as dashboard_service
+from app.services.analytics import main as analytics_service
+from app.services.notifications import main as notifications_service
+from app.services.localization import main as localization_service
 from contextlib import asynccontextmanager
 import uvicorn
 
@@ -9,8 +17,22 @@ import uvicorn
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_db()
+    await job_service.startup()
+    await application_service.startup()
+    await dashboard_service.startup()
+    await analytics_service.startup()
+    await ai_search_service.startup()
+    await notifications_service.startup()
+    await localization_service.startup()
     yield
-    # Optional: cleanup logic can go here
+    await localization_service.shutdown()
+    await notifications_service.shutdown()
+    await ai_search_service.shutdown()
+    await job_service.shutdown()
+    await application_service.shutdown()
+    await dashboard_service.shutdown()
+    await analytics_service.shutdown()
+    shutdown_password_executor()
 
 # ✅ Create the FastAPI app with lifespan
 app = FastAPI(lifespan=lifespan)
@@ -22,6 +44,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],  # read by the frontend to revalidate cached bundles
 )
 
 # ✅ Register all routers
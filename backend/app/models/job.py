@@ -68,4 +68,5 @@ class JobSearchFilter(BaseModel):
     remote: Optional[bool] = None
     skills: Optional[List[str]] = None
     salary_min: Optional[int] = None
-    salary_max: Optional[int] = None
\ No newline at end of file
+    salary_max: Optional[int] = None
+    salary_currency: Optional[str] = None  # currency of salary_min/salary_max; USD when omitted
\ No newline at end of file
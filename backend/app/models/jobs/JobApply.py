@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class JobApply(BaseModel):
+    """Body of POST /api/jobs/{job_id}/apply; the job comes from the path"""
+    resume_url: str
+    cover_letter: str
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+from typing import List, Union
+
+class FacetCount(BaseModel):
+    value: Union[bool, str]
+    count: int
+
+class JobFacets(BaseModel):
+    """Counts of the jobs matching the current filters, per filter value"""
+    employment_type: List[FacetCount] = []
+    remote: List[FacetCount] = []
+    location: List[FacetCount] = []
+    skills: List[FacetCount] = []
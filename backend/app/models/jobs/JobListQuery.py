@@ -0,0 +1,11 @@
+from pydantic import Field
+from typing import Optional
+
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.models.job import JobSearchFilter
+
+class JobListQuery(JobSearchFilter):
+    """Query parameters of GET /api/jobs/"""
+    limit: int = Field(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+    cursor: Optional[str] = None
+    facets: bool = False
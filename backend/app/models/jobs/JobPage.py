@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+from typing import Optional, List
+
+from .JobFacets import JobFacets
+from .JobSummary import JobSummary
+
+class JobPage(BaseModel):
+    items: List[JobSummary] = []
+    next_cursor: Optional[str] = None
+    limit: int
+    facets: Optional[JobFacets] = None
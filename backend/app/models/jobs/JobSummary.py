@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from typing import Optional, List
+from datetime import datetime
+
+class JobSummary(BaseModel):
+    """List-view representation of a job (no description/requirements/benefits)"""
+    id: str
+    title: str
+    company: str
+    location: str
+    salary: str
+    employment_type: Optional[str] = "Full-time"
+    remote: Optional[bool] = False
+    status: Optional[str] = "active"
+    employer_id: str
+    skills_required: Optional[List[str]] = []
+    application_deadline: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
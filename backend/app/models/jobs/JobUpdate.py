@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import Optional, List
+from datetime import datetime
+
+class JobUpdate(BaseModel):
+    title: Optional[str] = None
+    company: Optional[str] = None
+    location: Optional[str] = None
+    salary: Optional[str] = None
+    description: Optional[str] = None
+    requirements: Optional[str] = None
+    employment_type: Optional[str] = None
+    remote: Optional[bool] = None
+    status: Optional[str] = None
+    skills_required: Optional[List[str]] = None
+    benefits: Optional[str] = None
+    application_deadline: Optional[datetime] = None
@@ -1,4 +1,10 @@
 from .JobCreate import JobCreate
 from .JobResponse import JobResponse
+from .JobUpdate import JobUpdate
+from .JobSummary import JobSummary
+from .JobFacets import FacetCount, JobFacets
+from .JobPage import JobPage
+from .JobListQuery import JobListQuery
+from .JobApply import JobApply
 
-__all__ = ["JobCreate", "JobResponse"]
\ No newline at end of file
+__all__ = ["JobCreate", "JobResponse", "JobUpdate", "JobSummary", "JobPage", "FacetCount", "JobFacets", "JobListQuery", "JobApply"]
@@ -3,6 +3,11 @@
 from fastapi import FastAPI
 from app.routes import auth, jobs, resume, dashboard
 from app.services.job.routes import job_routes
+from app.services.ai_search.routes import search_routes
+from app.services.application.routes import application_routes
+from app.services.analytics.routes import analytics_routes
+from app.services.notifications.routes import email_routes
+from app.services.localization.routes import localitzation_routes
 
 def include_all_routers(app: FastAPI):
     app.include_router(auth.router, prefix="/api/auth", tags=["Auth"])
@@ -10,3 +15,8 @@ def include_all_routers(app: FastAPI):
     app.include_router(resume.router, prefix="/api/resume", tags=["Resume"])
     app.include_router(dashboard.router, prefix="/api/dashboard", tags=["Dashboard"])
     app.include_router(job_routes.router, prefix="/api/jobs", tags=["jobs"])
+    app.include_router(search_routes.router, prefix="/api/search", tags=["Search"])
+    app.include_router(application_routes.router, prefix="/api/applications", tags=["Applications"])
+    app.include_router(analytics_routes.router, prefix="/api/analytics", tags=["Analytics"])
+    app.include_router(email_routes.router, prefix="/api/notifications", tags=["Notifications"])
+    app.include_router(localitzation_routes.router, prefix="/api/localization", tags=["Localization"])
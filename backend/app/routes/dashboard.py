@@ -1,23 +1,40 @@
 # backend/app/routes/dashboard.py
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Query
+from app.services.auth_service.services.jwt_handler import get_current_user
+from app.services.dashboard.config import DASHBOARD_MAX_RECENT_APPLICATIONS, DASHBOARD_RECENT_APPLICATIONS
 from app.services.dashboard.services.candidate_widgets import get_candidate_summary
-from app.services.dashboard.services.employer_widgets import get_employer_summary
+from app.services.dashboard.services.employer_widgets import get_employer_summary, get_recent_applications
 
 router = APIRouter()
 
+def require_employer(current_user=Depends(get_current_user)):
+    if current_user.get("role") != "employer":
+        raise HTTPException(status_code=403, detail="Only employers can view the employer dashboard")
+    return current_user
+
+def require_candidate(current_user=Depends(get_current_user)):
+    if current_user.get("role") != "candidate":
+        raise HTTPException(status_code=403, detail="Only candidates can view the candidate dashboard")
+    return current_user
+
 @router.get("/candidate")
-async def stats_candidate():
-    return await get_candidate_summary()
+async def stats_candidate(
+    recent: int = Query(DASHBOARD_RECENT_APPLICATIONS, ge=0, le=DASHBOARD_MAX_RECENT_APPLICATIONS),
+    current_user=Depends(require_candidate),
+):
+    return await get_candidate_summary(current_user["id"], recent_limit=recent)
 
 @router.get("/employer")
-async def stats_employer():
-    return await get_employer_summary()
+async def stats_employer(
+    recent: int = Query(DASHBOARD_RECENT_APPLICATIONS, ge=0, le=DASHBOARD_MAX_RECENT_APPLICATIONS),
+    current_user=Depends(require_employer),
+):
+    return await get_employer_summary(current_user["id"], recent_limit=recent)
+
 @router.get("/employer/recent-applications")
-async def recent_applications():
-    return {
-        "recent_applications": [
-            {"candidate": "John Doe", "job_title": "UX Designer", "status": "Pending"},
-            {"candidate": "Ayesha Khan", "job_title": "Backend Dev", "status": "Interview Scheduled"},
-        ]
-    }
\ No newline at end of file
+async def recent_applications(
+    limit: int = Query(DASHBOARD_RECENT_APPLICATIONS, ge=1, le=DASHBOARD_MAX_RECENT_APPLICATIONS),
+    current_user=Depends(require_employer),
+):
+    return await get_recent_applications(current_user["id"], limit)
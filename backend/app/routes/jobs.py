@@ -1,22 +1,46 @@
 # /backend/app/routes/jobs.py
-from fastapi import APIRouter, Depends, HTTPException
-from app.models.jobs import JobCreate, JobResponse
+from typing import Annotated
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from app.models.job import JobSearchFilter
+from app.models.jobs import JobApply, JobCreate, JobResponse, JobUpdate, JobPage, JobListQuery
 from app.services.auth_service.services.jwt_handler import get_current_user
 
-from app.services.job import list_jobs, get_job, create_job, apply_to_job
+from app.services.job import list_jobs, get_job, create_job, apply_to_job, bulk_create_jobs, update_job, close_job
+from app.services.job.services.bulk_import import iter_rows
+from app.core.raw_reads import json_response
+from app.services.job.serializers import encode_job, encode_job_page
+from app.services.analytics.eventhandlers.job_view_events import track_job_view
+from app.services.job.services.job_cache import DETAIL_NAMESPACE, LIST_NAMESPACE, job_cache, list_key
 from app.services.job.routes import job_routes as job_service_router
 
 router = APIRouter()
 
 # Mount the actual job service router
 router.include_router(job_service_router.router, prefix="/sample", tags=["Jobs"])
-@router.get("/", response_model=list[JobResponse])
-async def get_jobs():
-    return await list_jobs()
+@router.get("/", response_model=JobPage)
+async def get_jobs(request: Request, params: Annotated[JobListQuery, Query()]):
+    """Active jobs, newest first, filtered by any JobSearchFilter field; facets=true adds per-value counts"""
+    filters = JobSearchFilter(**params.model_dump(exclude={"limit", "cursor", "facets"}))
+    async def render():
+        return encode_job_page(await list_jobs(limit=params.limit, cursor=params.cursor, filters=filters, facets=params.facets))
+
+    key = list_key(params.limit, params.cursor, facets=params.facets or None, **filters.model_dump(mode="json"))
+    return await job_cache.respond(request, LIST_NAMESPACE, key, render)
+
+@router.get("/cache/stats")
+async def get_job_cache_stats(current_user=Depends(get_current_user)):
+    """Hit/miss counters of the job response cache (this worker)"""
+    return job_cache.stats()
 
 @router.get("/{job_id}", response_model=JobResponse)
-async def get_single_job(job_id: str):
-    return await get_job(job_id)
+async def get_single_job(request: Request, job_id: str):
+    async def render():
+        return encode_job(await get_job(job_id))
+
+    response = await job_cache.respond(request, DETAIL_NAMESPACE, job_id, render)
+    # Only jobs that exist are counted; a 404 from get_job never gets here
+    track_job_view(job_id)
+    return response
 
 @router.post("/", response_model=JobResponse)
 async def post_job(payload: JobCreate, current_user=Depends(get_current_user)):
@@ -24,11 +48,36 @@ async def post_job(payload: JobCreate, current_user=Depends(get_current_user)):
     if current_user.get("role") != "employer":
         raise HTTPException(status_code=403, detail="Only employers can post jobs")
     
-    return await create_job(payload, current_user["id"])
+    return json_response(encode_job(await create_job(payload, current_user["id"])))
+
+@router.post("/bulk")
+async def post_jobs_bulk(request: Request, current_user=Depends(get_current_user)):
+    """Create many jobs from a streamed NDJSON or JSON array body; returns per-row results"""
+    if current_user.get("role") != "employer":
+        raise HTTPException(status_code=403, detail="Only employers can post jobs")
+
+    return await bulk_create_jobs(iter_rows(request), current_user["id"])
+
+@router.put("/{job_id}", response_model=JobResponse)
+async def put_job(job_id: str, payload: JobUpdate, current_user=Depends(get_current_user)):
+    if current_user.get("role") != "employer":
+        raise HTTPException(status_code=403, detail="Only employers can update jobs")
+
+    return json_response(encode_job(await update_job(job_id, payload, current_user["id"])))
+
+@router.post("/{job_id}/close")
+async def post_close_job(job_id: str, current_user=Depends(get_current_user)):
+    if current_user.get("role") != "employer":
+        raise HTTPException(status_code=403, detail="Only employers can close jobs")
+
+    return await close_job(job_id, current_user["id"])
+
+@router.post("/{job_id}/apply", status_code=201)
+async def apply_job(job_id: str, application: JobApply, current_user=Depends(get_current_user)):
+    if current_user.get("role") != "candidate":
+        raise HTTPException(status_code=403, detail="Only candidates can apply.")
 
-@router.post("/{job_id}/apply")
-async def apply_job(job_id: str, application_data: dict):
-    return await apply_to_job(job_id, application_data)
+    return await apply_to_job(job_id, current_user["id"], application)
 # app/routes/jobs.py
 
 # from fastapi import APIRouter
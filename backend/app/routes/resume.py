@@ -1,17 +1,31 @@
-from fastapi import APIRouter, UploadFile, File
+from fastapi import APIRouter, UploadFile, File, Request, HTTPException
+from fastapi.routing import APIRoute
 from app.services.resume import upload_resume, list_resumes
+from app.services.resume.config import RESUME_MAX_BYTES
+from app.core.raw_reads import encode_documents, json_response
 
-router = APIRouter()
+# Allowance for multipart boundaries and part headers
+MULTIPART_OVERHEAD = 16 * 1024
+
+class UploadLimitRoute(APIRoute):
+    """Rejects oversized bodies from Content-Length before FastAPI parses the form"""
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def limited_handler(request: Request):
+            content_length = request.headers.get("content-length")
+            if content_length and content_length.isdigit() and int(content_length) > RESUME_MAX_BYTES + MULTIPART_OVERHEAD:
+                raise HTTPException(status_code=413, detail=f"File exceeds the {RESUME_MAX_BYTES} byte limit")
+            return await handler(request)
+
+        return limited_handler
+
+router = APIRouter(route_class=UploadLimitRoute)
 
 @router.post("/upload")
 async def upload(file: UploadFile = File(...)):
-    file_data = {
-        "filename": file.filename,
-        "content_type": file.content_type,
-        "content": await file.read()
-    }
-    return await upload_resume(file_data)
+    return await upload_resume(file)
 
 @router.get("/")
 async def get_uploaded(user_id: int):
-    return await list_resumes(str(user_id))
+    return json_response(encode_documents(await list_resumes(str(user_id))))
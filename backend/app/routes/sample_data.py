@@ -1,7 +1,9 @@
 from fastapi import APIRouter
 from app.services.job.models.job import Job, EmploymentType, JobStatus
 from app.services.auth_service.models.user import User
-from app.services.auth_service.services.auth_utils import hash_password
+from app.services.job.utils.filters import filter_fields
+from app.services.job.utils.salary import salary_fields
+from app.services.auth_service.utils.password_hash import hash_password_async
 from datetime import datetime, timedelta
 import random
 
@@ -47,7 +49,7 @@ async def create_sample_data():
                 email=user_data["email"],
                 full_name=user_data["full_name"],
                 role=user_data["role"],
-                hashed_password=hash_password(user_data["password"])
+                hashed_password=await hash_password_async(user_data["password"])
             )
             await user.insert()
             created_users.append(str(user.id))
@@ -141,6 +143,8 @@ async def create_sample_data():
             
             job = Job(
                 **job_data,
+                **salary_fields(job_data["salary"]),
+                **filter_fields(job_data["location"], job_data["skills_required"]),
                 employer_id=str(employer.id),
                 created_at=created_date,
                 updated_at=created_date
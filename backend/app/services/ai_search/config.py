@@ -0,0 +1,35 @@
+# app/services/ai_search/config.py
+
+import os
+
+# BM25 parameters for the in-process job index
+SEARCH_BM25_K1 = float(os.getenv("SEARCH_BM25_K1", "1.2"))
+SEARCH_BM25_B = float(os.getenv("SEARCH_BM25_B", "0.75"))
+# Extra weight of a term occurrence per indexed field
+SEARCH_FIELD_WEIGHTS = {
+    "title": 3.0,
+    "skills_required": 2.0,
+    "company": 2.0,
+    "description": 1.0,
+    "requirements": 1.0,
+}
+# Each worker re-reads jobs changed by other workers this often
+SEARCH_REFRESH_SECONDS = float(os.getenv("SEARCH_REFRESH_SECONDS", "30"))
+SEARCH_MAX_RESULTS = int(os.getenv("SEARCH_MAX_RESULTS", "100"))
+# Fuzzy lookup: most trigram-sharing terms checked with edit distance
+FUZZY_MAX_CANDIDATES = int(os.getenv("FUZZY_MAX_CANDIDATES", "200"))
+
+# Semantic search: "hashing" works offline; any other value is loaded as a
+# sentence-transformers model name when that package is installed
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "hashing")
+EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", "256"))  # hashing embedder only
+# Vectors are memory-mapped from this directory; empty (the default) keeps them in RAM.
+# The files have a single writer: set a directory per worker process. A worker that
+# finds the directory locked by another process keeps its vectors in RAM instead.
+SEMANTIC_INDEX_DIR = os.getenv("SEMANTIC_INDEX_DIR", "")
+SEMANTIC_BATCH_SIZE = int(os.getenv("SEMANTIC_BATCH_SIZE", "64"))
+SEMANTIC_BATCH_WAIT_SECONDS = float(os.getenv("SEMANTIC_BATCH_WAIT_SECONDS", "0.5"))
+SEMANTIC_QUEUE_SIZE = int(os.getenv("SEMANTIC_QUEUE_SIZE", "10000"))
+# Below this many vectors search is exact; above it an IVF index is trained
+SEMANTIC_IVF_MIN_VECTORS = int(os.getenv("SEMANTIC_IVF_MIN_VECTORS", "20000"))
+SEMANTIC_IVF_NPROBE = int(os.getenv("SEMANTIC_IVF_NPROBE", "8"))
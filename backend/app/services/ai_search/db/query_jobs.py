@@ -0,0 +1,19 @@
+# app/services/ai_search/db/query_jobs.py
+
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from app.services.job.models.job import Job
+
+
+async def iter_jobs(updated_since: Optional[datetime] = None) -> AsyncIterator[Job]:
+    """
+    Jobs to (re)index. With updated_since only jobs changed after it are
+    returned, closed ones included so they can be dropped from the index.
+    """
+    if updated_since is None:
+        query = Job.find(Job.status == "active")
+    else:
+        query = Job.find(Job.updated_at > updated_since)
+    async for job in query:
+        yield job
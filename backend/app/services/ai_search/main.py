@@ -0,0 +1,40 @@
+# app/services/ai_search/main.py
+
+import asyncio
+from typing import Optional
+
+from app.core.events import subscribe, unsubscribe
+from app.services.ai_search.services import classic_search, fuzzy_search, index_sync
+from app.services.ai_search.services.ai_semantic_search import semantic_search
+
+JOB_EVENTS = ("job.created", "job.updated", "job.closed", "job.reopened")
+
+_refresh_task: Optional[asyncio.Task] = None
+
+
+async def startup():
+    global _refresh_task
+    index_sync.register_index(classic_search.job_index)
+    index_sync.register_index(fuzzy_search.vocabulary)
+    await index_sync.build_indexes()
+    for event in JOB_EVENTS:
+        subscribe(event, index_sync.on_job_changed)
+        subscribe(event, semantic_search.on_job_changed)
+    subscribe("job.created_many", index_sync.on_jobs_changed)
+    subscribe("job.created_many", semantic_search.on_jobs_changed)
+    _refresh_task = asyncio.create_task(index_sync.run_refresh_loop())
+    # Embeds and syncs in the background; never delays startup
+    await semantic_search.start()
+
+
+async def shutdown():
+    global _refresh_task
+    for event in JOB_EVENTS:
+        unsubscribe(event, index_sync.on_job_changed)
+        unsubscribe(event, semantic_search.on_job_changed)
+    unsubscribe("job.created_many", index_sync.on_jobs_changed)
+    unsubscribe("job.created_many", semantic_search.on_jobs_changed)
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        _refresh_task = None
+    await semantic_search.stop()
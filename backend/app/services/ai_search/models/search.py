@@ -0,0 +1,46 @@
+# app/services/ai_search/models/search.py
+
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from datetime import datetime
+from app.models.job import JobSearchFilter
+from app.services.ai_search.config import SEARCH_MAX_RESULTS
+
+class JobSearchQuery(JobSearchFilter):
+    q: Optional[str] = None
+    limit: int = Field(20, ge=1, le=SEARCH_MAX_RESULTS)
+    offset: int = Field(0, ge=0)
+
+class JobSearchHit(BaseModel):
+    id: str
+    title: str
+    company: str
+    location: str
+    salary: str
+    employment_type: Optional[str] = "Full-time"
+    remote: Optional[bool] = False
+    status: Optional[str] = "active"
+    employer_id: str
+    skills_required: Optional[List[str]] = []
+    application_deadline: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    score: float = 0.0
+
+class JobSearchResponse(BaseModel):
+    query: Optional[str] = None
+    total: int
+    items: List[JobSearchHit] = []
+    took_ms: float
+
+class FuzzySuggestion(BaseModel):
+    term: str
+    kinds: List[str] = []
+    distance: int
+    jobs: int
+
+class FuzzySearchResponse(BaseModel):
+    query: str
+    suggestions: List[FuzzySuggestion] = []
+    items: List[JobSearchHit] = []
+    took_ms: float
@@ -0,0 +1,70 @@
+# app/services/ai_search/routes/search_routes.py
+
+import time
+from typing import Annotated
+from fastapi import APIRouter, Depends, HTTPException, Query
+from app.services.ai_search.config import SEARCH_MAX_RESULTS
+from app.services.ai_search.models.search import (
+    FuzzySearchResponse,
+    JobSearchHit,
+    JobSearchQuery,
+    JobSearchResponse,
+)
+from app.services.ai_search.services import classic_search, fuzzy_search
+from app.services.ai_search.services.ai_semantic_search import semantic_search
+from app.services.analytics.eventhandlers.job_view_events import track_search
+from app.services.auth_service.services.jwt_handler import get_current_user
+
+router = APIRouter()
+
+@router.get("/jobs", response_model=JobSearchResponse)
+async def search_jobs(params: Annotated[JobSearchQuery, Query()]):
+    """Full-text job search (BM25) with employment type/remote/location/skills filters"""
+    started = time.perf_counter()
+    total, hits = classic_search.search_jobs(params.q, params, limit=params.limit, offset=params.offset)
+    track_search(params.q, "jobs", total)
+    return JobSearchResponse(
+        query=params.q,
+        total=total,
+        items=[JobSearchHit(**job, score=round(score, 4)) for score, job in hits],
+        took_ms=round((time.perf_counter() - started) * 1000, 3),
+    )
+
+@router.get("/fuzzy", response_model=FuzzySearchResponse)
+async def fuzzy_job_search(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=SEARCH_MAX_RESULTS),
+):
+    """Typo-tolerant search over job titles, companies and skills"""
+    started = time.perf_counter()
+    suggestions, hits = fuzzy_search.fuzzy_search(q, limit=limit)
+    track_search(q, "fuzzy", len(hits))
+    return FuzzySearchResponse(
+        query=q,
+        suggestions=suggestions,
+        items=[JobSearchHit(**job, score=round(score, 4)) for score, job in hits],
+        took_ms=round((time.perf_counter() - started) * 1000, 3),
+    )
+
+@router.get("/semantic", response_model=JobSearchResponse)
+async def semantic_job_search(
+    q: str = Query(..., min_length=1, max_length=500),
+    limit: int = Query(20, ge=1, le=SEARCH_MAX_RESULTS),
+):
+    """Jobs ranked by embedding similarity to a free-text query"""
+    if not semantic_search.enabled:
+        raise HTTPException(status_code=503, detail="Semantic search is not available")
+    started = time.perf_counter()
+    hits = await semantic_search.search(q, limit=limit)
+    track_search(q, "semantic", len(hits))
+    return JobSearchResponse(
+        query=q,
+        total=len(hits),
+        items=[JobSearchHit(**job, score=round(score, 4)) for score, job in hits],
+        took_ms=round((time.perf_counter() - started) * 1000, 3),
+    )
+
+@router.get("/semantic/stats")
+async def semantic_index_stats(user=Depends(get_current_user)):
+    """Vector count, embedding queue depth and IVF state of this worker"""
+    return semantic_search.stats()
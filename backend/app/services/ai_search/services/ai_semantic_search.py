@@ -0,0 +1,459 @@
+# app/services/ai_search/services/ai_semantic_search.py
+"""
+Semantic job search over embedded job texts.
+
+Vectors live in one contiguous float32 matrix (memory-mapped from
+SEMANTIC_INDEX_DIR when set, so they survive restarts). Small collections are
+searched exactly; past SEMANTIC_IVF_MIN_VECTORS an IVF index (spherical
+k-means centroids + inverted lists) is trained in a background thread and
+queries only score the rows of the SEMANTIC_IVF_NPROBE closest lists.
+
+Jobs are embedded by a background worker in batches. Write paths only
+enqueue, so create_job never waits for an embedding.
+"""
+import asyncio
+import json
+import logging
+import math
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks
+    fcntl = None
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.services.ai_search.config import (
+    SEARCH_REFRESH_SECONDS,
+    SEMANTIC_BATCH_SIZE,
+    SEMANTIC_BATCH_WAIT_SECONDS,
+    SEMANTIC_INDEX_DIR,
+    SEMANTIC_IVF_MIN_VECTORS,
+    SEMANTIC_IVF_NPROBE,
+    SEMANTIC_QUEUE_SIZE,
+)
+from app.services.ai_search.db.query_jobs import iter_jobs
+from app.services.ai_search.services.classic_search import job_index
+from app.services.ai_search.services.embedding_model import get_embedder, job_text, np
+
+logger = logging.getLogger(__name__)
+
+_EMPTY_ID = b"\x00" * 12
+
+
+def _timestamp(value: datetime) -> float:
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+class VectorStore:
+    """
+    Row-addressed vector matrix plus the job id (12-byte ObjectId) and
+    updated_at of every row. Freed rows are reused.
+    """
+
+    def __init__(self, dim: int, model_name: str, directory: Optional[str] = SEMANTIC_INDEX_DIR,
+                 initial_capacity: int = 1024):
+        self.dim = dim
+        self.model_name = model_name
+        self.directory = directory or None
+        self.capacity = 0
+        self.vectors = self.ids = self.updated = None
+        self.row_of: Dict[str, int] = {}
+        self.free: List[int] = []
+        self.size = 0  # high-water mark of used rows
+        self._lock_file = None
+
+        if self.directory and not self._lock():
+            logger.warning("Semantic index in %s is used by another process; keeping vectors in RAM", self.directory)
+            self.directory = None
+        if self.directory and self._load():
+            return
+        self._allocate(initial_capacity)
+
+    # -- storage -----------------------------------------------------------
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _lock(self) -> bool:
+        """Take the directory's exclusive lock for this process; False when another one holds it"""
+        os.makedirs(self.directory, exist_ok=True)
+        if fcntl is None:
+            return True
+        self._lock_file = open(self._file(".lock"), "w")
+        try:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            self._lock_file.close()
+            self._lock_file = None
+            return False
+        return True
+
+    def _open(self, capacity: int, mode: str):
+        self.vectors = np.memmap(self._file("vectors.f32"), dtype=np.float32, mode=mode, shape=(capacity, self.dim))
+        self.ids = np.memmap(self._file("ids.u8"), dtype=np.uint8, mode=mode, shape=(capacity, 12))
+        self.updated = np.memmap(self._file("updated.f64"), dtype=np.float64, mode=mode, shape=(capacity,))
+
+    def _write_meta(self):
+        with open(self._file("meta.json"), "w") as f:
+            json.dump({"dim": self.dim, "model": self.model_name, "capacity": self.capacity}, f)
+
+    def _load(self) -> bool:
+        try:
+            with open(self._file("meta.json")) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if meta.get("dim") != self.dim or meta.get("model") != self.model_name:
+            logger.info("Semantic index in %s was built with another model; rebuilding", self.directory)
+            return False
+        self.capacity = meta["capacity"]
+        self._open(self.capacity, "r+")
+        used = np.flatnonzero(self.ids.any(axis=1))
+        self.size = int(used[-1]) + 1 if len(used) else 0
+        self.row_of = {self.ids[row].tobytes().hex(): int(row) for row in used}
+        self.free = sorted(set(range(self.size)) - set(self.row_of.values()), reverse=True)
+        return True
+
+    def _allocate(self, capacity: int):
+        """Create or grow the matrix; existing rows keep their position"""
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            self.flush()
+            for name, width in (("vectors.f32", 4 * self.dim), ("ids.u8", 12), ("updated.f64", 8)):
+                with open(self._file(name), "ab") as f:
+                    f.truncate(capacity * width)
+            self.capacity = capacity
+            self._open(capacity, "r+")
+            self._write_meta()
+        else:
+            vectors = np.zeros((capacity, self.dim), dtype=np.float32)
+            ids = np.zeros((capacity, 12), dtype=np.uint8)
+            updated = np.zeros(capacity, dtype=np.float64)
+            if self.capacity:
+                vectors[:self.capacity] = self.vectors
+                ids[:self.capacity] = self.ids
+                updated[:self.capacity] = self.updated
+            self.vectors, self.ids, self.updated = vectors, ids, updated
+            self.capacity = capacity
+
+    def flush(self):
+        if self.directory and isinstance(self.vectors, np.memmap):
+            self.vectors.flush()
+            self.ids.flush()
+            self.updated.flush()
+
+    def close(self):
+        """Flush and release the directory for the next process"""
+        self.flush()
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    # -- rows --------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.row_of)
+
+    def updated_at(self, job_id: str) -> Optional[float]:
+        row = self.row_of.get(job_id)
+        return None if row is None else float(self.updated[row])
+
+    def job_id(self, row: int) -> Optional[str]:
+        raw = self.ids[row].tobytes()
+        return None if raw == _EMPTY_ID else raw.hex()
+
+    def upsert(self, job_id: str, vector, updated_at: float) -> int:
+        row = self.row_of.get(job_id)
+        if row is None:
+            if self.free:
+                row = self.free.pop()
+            else:
+                if self.size == self.capacity:
+                    self._allocate(self.capacity * 2)
+                row = self.size
+                self.size += 1
+            self.row_of[job_id] = row
+            self.ids[row] = np.frombuffer(bytes.fromhex(job_id), dtype=np.uint8)
+        self.vectors[row] = vector
+        self.updated[row] = updated_at
+        return row
+
+    def remove(self, job_id: str) -> Optional[int]:
+        row = self.row_of.pop(job_id, None)
+        if row is not None:
+            self.ids[row] = 0
+            self.updated[row] = 0
+            self.free.append(row)
+        return row
+
+    def live_rows(self):
+        return np.fromiter(self.row_of.values(), dtype=np.int64, count=len(self.row_of))
+
+
+class IVFIndex:
+    """Inverted file index: each row sits in the list of its nearest centroid"""
+
+    def __init__(self, nprobe: int = SEMANTIC_IVF_NPROBE):
+        self.nprobe = nprobe
+        self.centroids = None
+        self.lists: List[List[int]] = []
+        self.row_list: Dict[int, int] = {}
+        self.trained_size = 0
+
+    @property
+    def trained(self) -> bool:
+        return self.centroids is not None
+
+    @staticmethod
+    def train(sample, nlist: int, iterations: int = 10, seed: int = 0):
+        """Spherical k-means; runs in a worker thread"""
+        rng = np.random.default_rng(seed)
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            for k in range(nlist):
+                members = sample[assignment == k]
+                if len(members):
+                    centroids[k] = members.sum(axis=0)
+            norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            centroids /= norms
+        return centroids.astype(np.float32)
+
+    @staticmethod
+    def assign(vectors, centroids, chunk: int = 65536):
+        out = np.empty(len(vectors), dtype=np.int64)
+        for start in range(0, len(vectors), chunk):
+            out[start:start + chunk] = np.argmax(vectors[start:start + chunk] @ centroids.T, axis=1)
+        return out
+
+    def install(self, centroids, rows, assignment, trained_size: int):
+        self.centroids = centroids
+        self.lists = [[] for _ in range(len(centroids))]
+        self.row_list = {}
+        for row, k in zip(rows.tolist(), assignment.tolist()):
+            self.lists[k].append(row)
+            self.row_list[row] = k
+        self.trained_size = trained_size
+
+    def add(self, row: int, vector):
+        self.remove(row)
+        k = int(np.argmax(self.centroids @ vector))
+        self.lists[k].append(row)
+        self.row_list[row] = k
+
+    def remove(self, row: int):
+        k = self.row_list.pop(row, None)
+        if k is not None:
+            self.lists[k].remove(row)
+
+    def candidates(self, query):
+        nprobe = min(self.nprobe, len(self.centroids))
+        nearest = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+        rows = [row for k in nearest for row in self.lists[k]]
+        return np.fromiter(rows, dtype=np.int64, count=len(rows))
+
+
+class SemanticSearch:
+    def __init__(self):
+        self.enabled = np is not None
+        self.store: Optional[VectorStore] = None
+        self.ivf = IVFIndex()
+        self.queue: "asyncio.Queue" = asyncio.Queue(maxsize=SEMANTIC_QUEUE_SIZE)
+        self.dropped = 0
+        self._tasks: List[asyncio.Task] = []
+        self._training: Optional[asyncio.Task] = None
+        self._dirty_rows: Optional[Set[int]] = None  # rows changed while training
+        self._synced_at: Optional[datetime] = None
+
+    # -- lifecycle ---------------------------------------------------------
+
+    async def start(self):
+        if not self.enabled:
+            logger.warning("numpy is not installed; semantic search is disabled")
+            return
+        # Loading a sentence-transformers model takes seconds: keep it off the event loop
+        self.embedder = await run_in_threadpool(get_embedder)
+        self.store = await run_in_threadpool(VectorStore, self.embedder.dim, self.embedder.name)
+        self._tasks = [
+            asyncio.create_task(self._run_embedder()),
+            asyncio.create_task(self._run_sync()),
+        ]
+        self._maybe_train()
+
+    async def stop(self):
+        tasks = self._tasks + ([self._training] if self._training else [])
+        for task in tasks:
+            task.cancel()
+        # Let them unwind before the store is flushed and its lock released
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks, self._training = [], None
+        if self.store is not None:
+            self.store.close()
+
+    # -- updates -----------------------------------------------------------
+
+    def _is_current(self, job) -> bool:
+        stored = self.store.updated_at(str(job.id))
+        return stored is not None and stored >= _timestamp(job.updated_at)
+
+    def on_job_changed(self, job):
+        """Event handler: never blocks the publishing request"""
+        if not self.enabled or self.store is None:
+            return
+        if getattr(job.status, "value", job.status) != "active":
+            self._remove(str(job.id))
+        elif not self._is_current(job):
+            try:
+                self.queue.put_nowait(job)
+            except asyncio.QueueFull:
+                self.dropped += 1
+                self._synced_at = None  # next sync pass re-scans everything
+
+    def on_jobs_changed(self, jobs):
+        for job in jobs:
+            self.on_job_changed(job)
+
+    def _remove(self, job_id: str):
+        row = self.store.remove(job_id)
+        if row is not None:
+            self.ivf.remove(row)
+            if self._dirty_rows is not None:
+                self._dirty_rows.add(row)
+
+    async def _run_sync(self):
+        """Backfill at startup, then pick up jobs changed by other workers or dropped"""
+        while True:
+            try:
+                since = None if self._synced_at is None else self._synced_at - timedelta(seconds=5)
+                self._synced_at = datetime.utcnow()
+                async for job in iter_jobs(updated_since=since):
+                    if getattr(job.status, "value", job.status) != "active":
+                        self._remove(str(job.id))
+                    elif not self._is_current(job):
+                        await self.queue.put(job)  # backpressure only on this task
+            except Exception:
+                logger.exception("Semantic index sync failed")
+                self._synced_at = None
+            await asyncio.sleep(SEARCH_REFRESH_SECONDS)
+
+    async def _next_batch(self) -> list:
+        batch = [await self.queue.get()]
+        deadline = asyncio.get_running_loop().time() + SEMANTIC_BATCH_WAIT_SECONDS
+        while len(batch) < SEMANTIC_BATCH_SIZE:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run_embedder(self):
+        while True:
+            batch = await self._next_batch()
+            try:
+                latest = {str(job.id): job for job in batch}  # last write per job wins
+                jobs = list(latest.values())
+                vectors = await run_in_threadpool(self.embedder.embed, [job_text(job) for job in jobs])
+                for job, vector in zip(jobs, vectors):
+                    row = self.store.upsert(str(job.id), vector, _timestamp(job.updated_at))
+                    if self.ivf.trained:
+                        self.ivf.add(row, vector)
+                    if self._dirty_rows is not None:
+                        self._dirty_rows.add(row)
+                self.store.flush()
+                self._maybe_train()
+            except Exception:
+                logger.exception("Embedding batch of %d jobs failed", len(batch))
+
+    # -- IVF training --------------------------------------------------------
+
+    def _maybe_train(self):
+        size = len(self.store)
+        if self._training is not None or size < SEMANTIC_IVF_MIN_VECTORS:
+            return
+        if self.ivf.trained and size < 2 * self.ivf.trained_size:
+            return
+        self._training = asyncio.create_task(self._train())
+
+    async def _train(self):
+        try:
+            self._dirty_rows = set()
+            rows = self.store.live_rows()
+            nlist = max(16, int(math.sqrt(len(rows))))
+            vectors = self.store.vectors
+
+            def fit():
+                rng = np.random.default_rng(0)
+                sample_rows = np.sort(rng.choice(rows, min(len(rows), nlist * 64), replace=False))
+                centroids = IVFIndex.train(np.asarray(vectors[sample_rows]), nlist)
+                return centroids, IVFIndex.assign(vectors[rows], centroids)
+
+            centroids, assignment = await run_in_threadpool(fit)
+            self.ivf.install(centroids, rows, assignment, trained_size=len(rows))
+            # Replay rows written or removed while the thread was running
+            for row in self._dirty_rows:
+                if self.store.job_id(row) is None:
+                    self.ivf.remove(row)
+                else:
+                    self.ivf.add(row, self.store.vectors[row])
+            logger.info("Semantic IVF index trained: %d vectors, %d lists", len(rows), nlist)
+        except Exception:
+            logger.exception("Semantic IVF training failed")
+        finally:
+            self._dirty_rows = None
+            self._training = None
+
+    # -- querying ------------------------------------------------------------
+
+    async def search(self, text: str, limit: int = 20) -> List[Tuple[float, dict]]:
+        """Top jobs by cosine similarity; only currently active jobs are returned"""
+        if not self.enabled or self.store is None or not len(self.store):
+            return []
+        query = (await run_in_threadpool(self.embedder.embed, [text]))[0]
+        rows = self.ivf.candidates(query) if self.ivf.trained else None
+        size = self.store.size
+        vectors = self.store.vectors
+        # Over-fetch: rows of jobs closed elsewhere are filtered below
+        k = limit * 2 + 10
+
+        def score():
+            if rows is None:
+                sims = vectors[:size] @ query
+                candidate_rows = np.arange(size)
+            else:
+                sims = vectors[rows] @ query
+                candidate_rows = rows
+            if len(sims) > k:
+                top = np.argpartition(-sims, k - 1)[:k]
+            else:
+                top = np.arange(len(sims))
+            top = top[np.argsort(-sims[top])]
+            return [(float(sims[i]), int(candidate_rows[i])) for i in top]
+
+        hits = []
+        for similarity, row in await run_in_threadpool(score):
+            job_id = self.store.job_id(row)
+            if job_id is not None and job_id in job_index.docs:
+                hits.append((similarity, job_index.docs[job_id]))
+                if len(hits) == limit:
+                    break
+        return hits
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "vectors": len(self.store) if self.store else 0,
+            "queued": self.queue.qsize(),
+            "dropped": self.dropped,
+            "ivf_lists": len(self.ivf.lists),
+        }
+
+
+semantic_search = SemanticSearch()
@@ -0,0 +1,197 @@
+# app/services/ai_search/services/classic_search.py
+"""
+In-process inverted index over active jobs with BM25 ranking.
+Loaded and kept current by services/index_sync.py.
+"""
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.models.job import JobSearchFilter
+from app.services.ai_search.config import SEARCH_BM25_B, SEARCH_BM25_K1, SEARCH_FIELD_WEIGHTS
+from app.services.job.utils.salary import salary_in_range
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in is it of on or our the to we will with you your".split()
+)
+# Fields whose tokens can be used as exact filters
+FILTER_TOKEN_FIELDS = ("title", "company", "location")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    if not text:
+        return []
+    return [token for token in TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+def _value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+def job_summary(job) -> dict:
+    """List-view fields kept in memory so hits can be returned without a DB read"""
+    return {
+        "id": str(job.id),
+        "title": job.title,
+        "company": job.company,
+        "location": job.location,
+        "salary": job.salary,
+        "salary_currency": getattr(job, "salary_currency", None),
+        "salary_annual_min": getattr(job, "salary_annual_min", None),
+        "salary_annual_max": getattr(job, "salary_annual_max", None),
+        "employment_type": _value(job.employment_type),
+        "remote": job.remote,
+        "status": _value(job.status),
+        "employer_id": job.employer_id,
+        "skills_required": job.skills_required or [],
+        "application_deadline": job.application_deadline,
+        "created_at": job.created_at,
+        "updated_at": job.updated_at,
+    }
+
+
+class JobSearchIndex:
+    def __init__(self, k1: float = SEARCH_BM25_K1, b: float = SEARCH_BM25_B,
+                 field_weights: Dict[str, float] = SEARCH_FIELD_WEIGHTS):
+        self.k1 = k1
+        self.b = b
+        self.field_weights = field_weights
+        self.clear()
+
+    def clear(self):
+        self.postings: Dict[str, Dict[str, float]] = defaultdict(dict)  # term -> {job_id: weighted tf}
+        self.doc_lengths: Dict[str, float] = {}
+        self.total_length = 0.0
+        self.docs: Dict[str, dict] = {}
+        self.filter_sets: Dict[str, Dict[Any, Set[str]]] = defaultdict(lambda: defaultdict(set))
+        self._doc_terms: Dict[str, List[str]] = {}
+        self._doc_filter_keys: Dict[str, List[Tuple[str, Any]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self.docs
+
+    # -- maintenance -------------------------------------------------------
+
+    def add(self, job) -> None:
+        """Index (or re-index) a job; jobs that are not active are removed"""
+        job_id = str(job.id)
+        self.remove(job_id)
+        if _value(job.status) != "active":
+            return
+
+        weighted: Counter = Counter()
+        for field, weight in self.field_weights.items():
+            value = getattr(job, field, None)
+            text = " ".join(value) if isinstance(value, list) else value
+            for token in tokenize(text):
+                weighted[token] += weight
+        for term, tf in weighted.items():
+            self.postings[term][job_id] = tf
+        length = sum(weighted.values())
+        self.doc_lengths[job_id] = length
+        self.total_length += length
+        self._doc_terms[job_id] = list(weighted)
+
+        keys = [("employment_type", _value(job.employment_type)), ("remote", bool(job.remote))]
+        for field in FILTER_TOKEN_FIELDS:
+            keys += [(field, token) for token in set(tokenize(getattr(job, field)))]
+        keys += [("skills", skill.strip().lower()) for skill in (job.skills_required or [])]
+        for field, key in keys:
+            self.filter_sets[field][key].add(job_id)
+        self._doc_filter_keys[job_id] = keys
+
+        self.docs[job_id] = job_summary(job)
+
+    def remove(self, job_id: str) -> None:
+        if job_id not in self.docs:
+            return
+        for term in self._doc_terms.pop(job_id):
+            postings = self.postings[term]
+            postings.pop(job_id, None)
+            if not postings:
+                del self.postings[term]
+        for field, key in self._doc_filter_keys.pop(job_id):
+            ids = self.filter_sets[field][key]
+            ids.discard(job_id)
+            if not ids:
+                del self.filter_sets[field][key]
+        self.total_length -= self.doc_lengths.pop(job_id)
+        del self.docs[job_id]
+
+    # -- querying ----------------------------------------------------------
+
+    def _filter_keys(self, filters: JobSearchFilter) -> List[Tuple[str, Any]]:
+        keys: List[Tuple[str, Any]] = []
+        if filters.employment_type is not None:
+            keys.append(("employment_type", _value(filters.employment_type)))
+        if filters.remote is not None:
+            keys.append(("remote", filters.remote))
+        for field in FILTER_TOKEN_FIELDS:
+            keys += [(field, token) for token in tokenize(getattr(filters, field))]
+        keys += [("skills", skill.strip().lower()) for skill in (filters.skills or [])]
+        return keys
+
+    def candidates(self, filters: Optional[JobSearchFilter]) -> Optional[Set[str]]:
+        """Ids matching every filter, or None when nothing is filtered"""
+        keys = self._filter_keys(filters) if filters else []
+        result: Optional[Set[str]] = None
+        if keys:
+            sets = sorted((self.filter_sets[field].get(key, set()) for field, key in keys), key=len)
+            result = set(sets[0])
+            for ids in sets[1:]:
+                if not result:
+                    break
+                result &= ids
+        if filters and (filters.salary_min is not None or filters.salary_max is not None or filters.salary_currency):
+            # Range check on the (already narrowed) summaries
+            bounds = (filters.salary_min, filters.salary_max, filters.salary_currency)
+            result = {job_id for job_id in (self.docs if result is None else result)
+                      if salary_in_range(self.docs[job_id], *bounds)}
+        return result
+
+    def score(self, terms: Iterable[str], allowed: Optional[Set[str]] = None) -> Dict[str, float]:
+        n_docs = len(self.docs)
+        if not n_docs:
+            return {}
+        avg_length = self.total_length / n_docs or 1.0
+        scores: Dict[str, float] = defaultdict(float)
+        for term in set(terms):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for job_id, tf in postings.items():
+                if allowed is not None and job_id not in allowed:
+                    continue
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[job_id] / avg_length)
+                scores[job_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+        return scores
+
+    def search(self, query: Optional[str], filters: Optional[JobSearchFilter] = None,
+               limit: int = 20, offset: int = 0) -> Tuple[int, List[Tuple[float, dict]]]:
+        """Return (total matches, [(score, job summary)]) for one page"""
+        allowed = self.candidates(filters)
+        terms = tokenize(query)
+        if terms:
+            scores = self.score(terms, allowed)
+            top = heapq.nlargest(offset + limit, scores.items(), key=lambda item: item[1])
+            return len(scores), [(score, self.docs[job_id]) for job_id, score in top[offset:]]
+
+        # No query text: filtered browse, newest first
+        ids = self.docs.keys() if allowed is None else allowed
+        newest = heapq.nlargest(offset + limit, ids, key=lambda job_id: self.docs[job_id]["created_at"])
+        return len(ids), [(0.0, self.docs[job_id]) for job_id in newest[offset:]]
+
+
+job_index = JobSearchIndex()
+
+
+def search_jobs(query: Optional[str], filters: Optional[JobSearchFilter] = None,
+                limit: int = 20, offset: int = 0) -> Tuple[int, List[Tuple[float, dict]]]:
+    return job_index.search(query, filters, limit=limit, offset=offset)
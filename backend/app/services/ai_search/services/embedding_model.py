@@ -0,0 +1,94 @@
+# app/services/ai_search/services/embedding_model.py
+"""
+Text embedders for semantic job search. Every embedder turns a batch of
+texts into an L2-normalised float32 matrix, so cosine similarity is a dot
+product.
+"""
+import logging
+import math
+import zlib
+from collections import Counter
+from typing import List
+
+try:
+    import numpy as np
+except ImportError:  # semantic search is disabled without numpy
+    np = None
+
+from app.services.ai_search.config import EMBEDDING_DIM, EMBEDDING_MODEL
+from app.services.ai_search.services.classic_search import tokenize
+
+logger = logging.getLogger(__name__)
+
+
+def job_text(job) -> str:
+    return " ".join(
+        part for part in (
+            job.title,
+            job.company,
+            " ".join(job.skills_required or []),
+            job.description,
+            job.requirements,
+        ) if part
+    )
+
+
+def _normalise(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class HashingEmbedder:
+    """
+    Feature-hashed bag of words and word bigrams with sublinear term
+    frequency. Deterministic across processes (crc32, not hash()) and needs
+    no model download.
+    """
+    name = "hashing"
+
+    def __init__(self, dim: int = EMBEDDING_DIM):
+        self.dim = dim
+
+    def _features(self, text: str) -> Counter:
+        tokens = tokenize(text)
+        return Counter(tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])])
+
+    def embed(self, texts: List[str]):
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, count in self._features(text).items():
+                digest = zlib.crc32(feature.encode())
+                sign = 1.0 if digest & 0x80000000 else -1.0
+                matrix[row, digest % self.dim] += sign * (1.0 + math.log(count))
+        return _normalise(matrix)
+
+
+class SentenceTransformerEmbedder:
+    def __init__(self, model_name: str):
+        from sentence_transformers import SentenceTransformer
+
+        self.name = model_name
+        self.model = SentenceTransformer(model_name, device="cpu")
+        self.dim = self.model.get_sentence_embedding_dimension()
+
+    def embed(self, texts: List[str]):
+        vectors = self.model.encode(texts, batch_size=64, convert_to_numpy=True, normalize_embeddings=True)
+        return vectors.astype(np.float32, copy=False)
+
+
+_embedder = None
+
+
+def get_embedder():
+    """Configured embedder, falling back to hashing when the model can't be loaded"""
+    global _embedder
+    if _embedder is None:
+        if EMBEDDING_MODEL != "hashing":
+            try:
+                _embedder = SentenceTransformerEmbedder(EMBEDDING_MODEL)
+            except Exception:
+                logger.exception("Could not load embedding model %s, using hashing embedder", EMBEDDING_MODEL)
+        if _embedder is None:
+            _embedder = HashingEmbedder()
+    return _embedder
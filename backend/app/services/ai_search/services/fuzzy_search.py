@@ -0,0 +1,167 @@
+# app/services/ai_search/services/fuzzy_search.py
+"""
+Typo-tolerant lookup over the vocabulary of job titles, companies and
+skills. Terms are indexed by padded character trigrams; a query only
+computes edit distances for terms that share enough trigrams with it and
+have a compatible length, so a lookup costs O(candidates) rather than a
+pass over every job.
+"""
+import heapq
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.services.ai_search.config import FUZZY_MAX_CANDIDATES
+from app.services.ai_search.services.classic_search import job_index, tokenize
+
+
+def trigrams(term: str) -> Set[str]:
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def max_distance_for(term: str) -> int:
+    return 1 if len(term) <= 4 else 2
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Optimal string alignment distance (adjacent transpositions count as one
+    edit). Returns limit + 1 as soon as the distance must exceed limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2: Optional[List[int]] = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if previous2 is not None and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class FuzzyVocabulary:
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.terms: Dict[str, Dict[str, object]] = {}  # term -> {"kinds": set, "jobs": set}
+        self.trigram_postings: Dict[str, Set[str]] = defaultdict(set)
+        self._job_terms: Dict[str, List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    # -- maintenance -------------------------------------------------------
+
+    def _job_vocabulary(self, job) -> List[Tuple[str, str]]:
+        entries = [(token, "title") for token in tokenize(job.title)]
+        company = " ".join(tokenize(job.company))
+        if company:
+            entries.append((company, "company"))
+            entries += [(token, "company") for token in tokenize(job.company)]
+        for skill in job.skills_required or []:
+            skill = skill.strip().lower()
+            if skill:
+                entries.append((skill, "skill"))
+        return entries
+
+    def add(self, job):
+        """Index (or re-index) a job's terms; jobs that are not active are removed"""
+        job_id = str(job.id)
+        self.remove(job_id)
+        if getattr(job.status, "value", job.status) != "active":
+            return
+        terms = []
+        for term, kind in self._job_vocabulary(job):
+            entry = self.terms.get(term)
+            if entry is None:
+                entry = self.terms[term] = {"kinds": set(), "jobs": set()}
+                for gram in trigrams(term):
+                    self.trigram_postings[gram].add(term)
+            entry["kinds"].add(kind)
+            entry["jobs"].add(job_id)
+            terms.append(term)
+        self._job_terms[job_id] = terms
+
+    def remove(self, job_id: str):
+        for term in self._job_terms.pop(job_id, []):
+            entry = self.terms.get(term)
+            if entry is None:
+                continue
+            entry["jobs"].discard(job_id)
+            if not entry["jobs"]:
+                del self.terms[term]
+                for gram in trigrams(term):
+                    postings = self.trigram_postings[gram]
+                    postings.discard(term)
+                    if not postings:
+                        del self.trigram_postings[gram]
+
+    # -- querying ----------------------------------------------------------
+
+    def lookup(self, word: str, limit: int = 10) -> List[Tuple[str, int]]:
+        """Vocabulary terms within the typo budget of word, closest first"""
+        word = word.lower().strip()
+        if not word:
+            return []
+        budget = max_distance_for(word)
+        grams = trigrams(word)
+        shared = Counter()
+        for gram in grams:
+            for term in self.trigram_postings.get(gram, ()):
+                shared[term] += 1
+        # One edit changes at most three trigrams (four for a transposition)
+        min_shared = max(1, len(grams) - 4 * budget)
+        candidates = [
+            term for term, count in shared.most_common(FUZZY_MAX_CANDIDATES)
+            if count >= min_shared and abs(len(term) - len(word)) <= budget
+        ]
+        matches = []
+        for term in candidates:
+            distance = edit_distance(word, term, budget)
+            if distance <= budget:
+                matches.append((term, distance))
+        return heapq.nsmallest(limit, matches, key=lambda match: (match[1], -len(self.terms[match[0]]["jobs"])))
+
+    def search(self, query: str, limit: int = 20) -> Tuple[List[dict], List[Tuple[float, dict]]]:
+        """Return (term suggestions, [(score, job summary)]) for a possibly misspelled query"""
+        words = tokenize(query)
+        phrase = " ".join(words)
+        lookups = [phrase] + words if len(words) > 1 else words
+
+        suggestions: Dict[str, dict] = {}
+        job_scores: Dict[str, float] = defaultdict(float)
+        for word in lookups:
+            for term, distance in self.lookup(word):
+                entry = self.terms[term]
+                similarity = 1 - distance / (len(term) + 1)
+                if term not in suggestions:
+                    suggestions[term] = {
+                        "term": term,
+                        "kinds": sorted(entry["kinds"]),
+                        "distance": distance,
+                        "jobs": len(entry["jobs"]),
+                    }
+                for job_id in entry["jobs"]:
+                    job_scores[job_id] += similarity
+
+        top = heapq.nlargest(
+            limit,
+            (job_id for job_id in job_scores if job_id in job_index.docs),
+            key=lambda job_id: (job_scores[job_id], job_index.docs[job_id]["created_at"]),
+        )
+        ordered = sorted(suggestions.values(), key=lambda s: (s["distance"], -s["jobs"]))
+        return ordered, [(job_scores[job_id], job_index.docs[job_id]) for job_id in top]
+
+
+vocabulary = FuzzyVocabulary()
+
+
+def fuzzy_search(query: str, limit: int = 20) -> Tuple[List[dict], List[Tuple[float, dict]]]:
+    return vocabulary.search(query, limit=limit)
@@ -0,0 +1,69 @@
+# app/services/ai_search/services/index_sync.py
+"""
+Keeps the in-process search indexes in step with the jobs collection.
+
+Indexes are loaded from MongoDB at startup and updated from the
+job.created / job.updated / job.closed / job.reopened events of this
+process. A periodic refresh picks up jobs changed by other worker processes.
+Every index exposes ``add(job)`` (re-index; drops jobs that are not
+active) and ``clear()``.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from app.services.ai_search.config import SEARCH_REFRESH_SECONDS
+from app.services.ai_search.db.query_jobs import iter_jobs
+
+logger = logging.getLogger(__name__)
+
+INDEXES: List[object] = []
+_synced_at: Optional[datetime] = None
+# Overlap between refresh windows so writes racing a refresh are not missed
+_REFRESH_OVERLAP = timedelta(seconds=5)
+
+
+def register_index(index):
+    if index not in INDEXES:
+        INDEXES.append(index)
+
+
+def on_job_changed(job):
+    for index in INDEXES:
+        index.add(job)
+
+
+def on_jobs_changed(jobs):
+    for job in jobs:
+        on_job_changed(job)
+
+
+async def build_indexes():
+    global _synced_at
+    _synced_at = datetime.utcnow()
+    for index in INDEXES:
+        index.clear()
+    count = 0
+    async for job in iter_jobs():
+        on_job_changed(job)
+        count += 1
+    logger.info("Search indexes built from %d jobs", count)
+
+
+async def refresh_indexes():
+    """Re-index jobs changed since the previous sync (e.g. by other workers)"""
+    global _synced_at
+    since = _synced_at - _REFRESH_OVERLAP
+    _synced_at = datetime.utcnow()
+    async for job in iter_jobs(updated_since=since):
+        on_job_changed(job)
+
+
+async def run_refresh_loop():
+    while True:
+        await asyncio.sleep(SEARCH_REFRESH_SECONDS)
+        try:
+            await refresh_indexes()
+        except Exception:
+            logger.exception("Search index refresh failed")
@@ -0,0 +1,16 @@
+# app/services/analytics/config.py
+
+import os
+
+# Event tracker: in-memory ring buffer flushed to MongoDB in batches
+ANALYTICS_ENABLED = os.getenv("ANALYTICS_ENABLED", "true").lower() == "true"
+ANALYTICS_BUFFER_SIZE = int(os.getenv("ANALYTICS_BUFFER_SIZE", "100000"))
+ANALYTICS_FLUSH_BATCH_SIZE = int(os.getenv("ANALYTICS_FLUSH_BATCH_SIZE", "1000"))
+ANALYTICS_FLUSH_INTERVAL_SECONDS = float(os.getenv("ANALYTICS_FLUSH_INTERVAL_SECONDS", "2"))
+
+# Rollups: application statuses that count as a hire
+ANALYTICS_HIRE_STATUSES = tuple(
+    status.strip() for status in os.getenv("ANALYTICS_HIRE_STATUSES", "hired,accepted").split(",") if status.strip()
+)
+ANALYTICS_MAX_HOURLY_DAYS = int(os.getenv("ANALYTICS_MAX_HOURLY_DAYS", "14"))
+ANALYTICS_MAX_DAYS = int(os.getenv("ANALYTICS_MAX_DAYS", "366"))
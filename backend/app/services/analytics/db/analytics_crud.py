@@ -0,0 +1,26 @@
+# app/services/analytics/db/analytics_crud.py
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pymongo.errors import BulkWriteError
+
+from app.services.analytics.models.analytics import AnalyticsEvent
+
+
+async def insert_events(events: List[dict]) -> int:
+    """Unordered bulk insert of raw event dicts; returns how many were written"""
+    try:
+        result = await AnalyticsEvent.get_motor_collection().insert_many(events, ordered=False)
+        return len(result.inserted_ids)
+    except BulkWriteError as e:
+        return e.details.get("nInserted", 0)
+
+
+async def count_events(event_type: str, job_id: Optional[str] = None, since: Optional[datetime] = None) -> int:
+    query: Dict[str, object] = {"type": event_type}
+    if job_id is not None:
+        query["job_id"] = job_id
+    if since is not None:
+        query["created_at"] = {"$gte": since}
+    return await AnalyticsEvent.get_motor_collection().count_documents(query)
@@ -0,0 +1,22 @@
+# app/services/analytics/eventhandlers/job_view_events.py
+
+from typing import Optional
+
+from app.services.analytics.models.analytics import AnalyticsEventType
+from app.services.analytics.services.tracker import tracker
+
+
+def track_job_view(job_id: str, user_id: Optional[str] = None):
+    tracker.track(AnalyticsEventType.JOB_VIEW.value, job_id=job_id, user_id=user_id)
+
+
+def track_search(query: Optional[str], kind: str, results: int):
+    tracker.track(AnalyticsEventType.SEARCH.value, query=query, kind=kind, results=results)
+
+
+def on_application_submitted(application):
+    tracker.track(
+        AnalyticsEventType.JOB_APPLY.value,
+        job_id=application.job_id,
+        user_id=application.candidate_id,
+    )
@@ -0,0 +1,32 @@
+# app/services/analytics/main.py
+
+from app.core.events import subscribe, unsubscribe
+from app.services.analytics.eventhandlers import job_view_events
+from app.services.analytics.services import insights_aggregator
+from app.services.analytics.services.tracker import tracker
+
+EVENT_HANDLERS = {
+    "application.submitted": [job_view_events.on_application_submitted, insights_aggregator.on_application_submitted],
+    "application.status_changed_many": [insights_aggregator.on_application_status_changed_many],
+    "job.created": [insights_aggregator.on_job_created],
+    "job.created_many": [insights_aggregator.on_jobs_created],
+    "job.closed": [insights_aggregator.on_job_closed],
+    "job.reopened": [insights_aggregator.on_job_reopened],
+    "user.created": [insights_aggregator.on_user_created],
+}
+
+
+async def startup():
+    for event, handlers in EVENT_HANDLERS.items():
+        for handler in handlers:
+            subscribe(event, handler)
+    if insights_aggregator.on_events_flushed not in tracker.flush_listeners:
+        tracker.flush_listeners.append(insights_aggregator.on_events_flushed)
+    tracker.start()
+
+
+async def shutdown():
+    for event, handlers in EVENT_HANDLERS.items():
+        for handler in handlers:
+            unsubscribe(event, handler)
+    await tracker.stop()
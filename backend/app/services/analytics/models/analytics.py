@@ -0,0 +1,59 @@
+# app/services/analytics/models/analytics.py
+
+from beanie import Document
+from pydantic import Field
+from typing import Any, Dict, Optional
+from datetime import datetime
+from enum import Enum
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+class AnalyticsEventType(str, Enum):
+    JOB_VIEW = "job_view"
+    JOB_APPLY = "job_apply"
+    SEARCH = "search"
+
+class AnalyticsEvent(Document):
+    """One tracked event; written in batches by services/tracker.py"""
+    type: AnalyticsEventType
+    job_id: Optional[str] = None
+    user_id: Optional[str] = None
+    query: Optional[str] = None
+    data: Dict[str, Any] = Field(default_factory=dict)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+    class Settings:
+        name = "analytics_events"
+        indexes = [
+            IndexModel([("type", ASCENDING), ("created_at", DESCENDING)], name="type_created_at"),
+            IndexModel([("job_id", ASCENDING), ("type", ASCENDING)], name="job_type"),
+        ]
+
+class RollupGranularity(str, Enum):
+    HOUR = "hour"
+    DAY = "day"
+
+class AnalyticsRollup(Document):
+    """
+    Counters for one hour or one day, keyed "<granularity>:<bucket start>".
+    Maintained incrementally by services/insights_aggregator.py.
+    """
+    id: str
+    granularity: RollupGranularity
+    bucket: datetime
+    jobs_posted: int = 0
+    jobs_closed: int = 0
+    jobs_reopened: int = 0  # closed jobs made active again
+    jobs_by_employment_type: Dict[str, int] = Field(default_factory=dict)
+    applications_submitted: int = 0
+    applications_by_status: Dict[str, int] = Field(default_factory=dict)  # moves into each status
+    hires: int = 0
+    time_to_hire_seconds: float = 0.0  # summed over hires
+    users_new: Dict[str, int] = Field(default_factory=dict)  # by role
+    job_views: int = 0
+    searches: int = 0
+
+    class Settings:
+        name = "analytics_rollups"
+        indexes = [
+            IndexModel([("granularity", ASCENDING), ("bucket", ASCENDING)], name="granularity_bucket"),
+        ]
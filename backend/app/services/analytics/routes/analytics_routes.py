@@ -1,61 +1,83 @@
-from fastapi import APIRouter
+from datetime import datetime, timedelta
+from fastapi import APIRouter, HTTPException, Query
+from app.services.analytics.config import ANALYTICS_MAX_DAYS, ANALYTICS_MAX_HOURLY_DAYS
+from app.services.analytics.models.analytics import RollupGranularity
+from app.services.analytics.services import insights_aggregator
+from app.services.analytics.services.tracker import tracker
 
 router = APIRouter()
 
+async def _window(days: int, granularity: RollupGranularity):
+    """Rollups of the last `days` days plus their combined totals"""
+    if granularity == RollupGranularity.HOUR and days > ANALYTICS_MAX_HOURLY_DAYS:
+        raise HTTPException(status_code=400, detail=f"Hourly rollups cover at most {ANALYTICS_MAX_HOURLY_DAYS} days")
+    rollups = await insights_aggregator.get_rollups(granularity, datetime.utcnow() - timedelta(days=days))
+    return rollups, insights_aggregator.combine(rollups)
+
+def _breakdown(counts, label: str):
+    return [{label: key, "count": count} for key, count in sorted(counts.items(), key=lambda item: -item[1]) if count]
+
 @router.get("/jobs")
-async def get_job_analytics():
+async def get_job_analytics(
+    days: int = Query(30, ge=1, le=ANALYTICS_MAX_DAYS),
+    granularity: RollupGranularity = RollupGranularity.DAY,
+):
     """Get job analytics data"""
+    rollups, window = await _window(days, granularity)
+    totals = await insights_aggregator.get_all_time_totals()
     return {
-        "total_jobs": 150,
-        "active_jobs": 120,
-        "jobs_this_month": 25,
-        "top_categories": [
-            {"category": "Technology", "count": 45},
-            {"category": "Finance", "count": 32},
-            {"category": "Healthcare", "count": 28},
-            {"category": "Marketing", "count": 22},
-            {"category": "Education", "count": 18}
+        "total_jobs": totals["jobs_posted"],
+        "active_jobs": max(totals["jobs_posted"] - totals["jobs_closed"] + totals["jobs_reopened"], 0),
+        "jobs_in_period": window["jobs_posted"],
+        "job_views_in_period": window["job_views"],
+        "employment_types": _breakdown(window["jobs_by_employment_type"], "type"),
+        "series": [
+            {"bucket": rollup.bucket, "jobs_posted": rollup.jobs_posted, "jobs_closed": rollup.jobs_closed, "job_views": rollup.job_views}
+            for rollup in rollups
         ],
-        "employment_types": [
-            {"type": "Full-time", "count": 85},
-            {"type": "Part-time", "count": 25},
-            {"type": "Contract", "count": 30},
-            {"type": "Freelance", "count": 10}
-        ]
     }
 
 @router.get("/applications")
-async def get_application_analytics():
+async def get_application_analytics(
+    days: int = Query(30, ge=1, le=ANALYTICS_MAX_DAYS),
+    granularity: RollupGranularity = RollupGranularity.DAY,
+):
     """Get application analytics data"""
+    rollups, window = await _window(days, granularity)
+    totals = await insights_aggregator.get_all_time_totals()
+    submitted = window["applications_submitted"]
+    hires = window["hires"]
     return {
-        "total_applications": 1250,
-        "applications_this_month": 180,
-        "conversion_rate": 12.5,
-        "average_time_to_hire": 18,
-        "status_breakdown": [
-            {"status": "Submitted", "count": 450},
-            {"status": "Under Review", "count": 320},
-            {"status": "Interview Scheduled", "count": 180},
-            {"status": "Interviewed", "count": 120},
-            {"status": "Accepted", "count": 80},
-            {"status": "Rejected", "count": 100}
-        ]
+        "total_applications": totals["applications_submitted"],
+        "applications_in_period": submitted,
+        "conversion_rate": round(hires / submitted * 100, 2) if submitted else 0.0,
+        "average_time_to_hire_days": round(window["time_to_hire_seconds"] / hires / 86400, 2) if hires else None,
+        "status_breakdown": _breakdown(window["applications_by_status"], "status"),
+        "series": [
+            {"bucket": rollup.bucket, "applications_submitted": rollup.applications_submitted, "hires": rollup.hires}
+            for rollup in rollups
+        ],
     }
 
 @router.get("/users")
-async def get_user_analytics():
+async def get_user_analytics(
+    days: int = Query(30, ge=1, le=ANALYTICS_MAX_DAYS),
+    granularity: RollupGranularity = RollupGranularity.DAY,
+):
     """Get user analytics data"""
+    rollups, window = await _window(days, granularity)
+    totals = await insights_aggregator.get_all_time_totals()
     return {
-        "total_users": 2500,
-        "active_users": 1800,
-        "new_users_this_month": 250,
-        "user_types": [
-            {"type": "Candidates", "count": 2000},
-            {"type": "Employers", "count": 500}
+        "total_users": sum(totals["users_new"].values()),
+        "new_users_in_period": sum(window["users_new"].values()),
+        "user_types": _breakdown(totals["users_new"], "type"),
+        "series": [
+            {"bucket": rollup.bucket, "new_users": sum(rollup.users_new.values())}
+            for rollup in rollups
         ],
-        "user_activity": [
-            {"metric": "Daily Active Users", "value": 650},
-            {"metric": "Weekly Active Users", "value": 1200},
-            {"metric": "Monthly Active Users", "value": 1800}
-        ]
-    }
\ No newline at end of file
+    }
+
+@router.get("/tracker")
+async def get_tracker_stats():
+    """Buffer depth, flush and drop counters of this worker's event tracker"""
+    return tracker.stats()
@@ -0,0 +1,224 @@
+# app/services/analytics/services/insights_aggregator.py
+"""
+Hourly and daily analytics rollups.
+
+Every domain event adds its deltas to the hour and day bucket it falls in
+(two upserts in one bulk_write), so the analytics endpoints read one
+document per bucket instead of scanning jobs, applications and users.
+Data that predates the rollups can be loaded once with
+
+    python -m app.services.analytics.services.insights_aggregator
+
+which recounts jobs/applications/users per bucket and $merges the result.
+"""
+import asyncio
+import sys
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from pymongo import UpdateOne
+
+from app.services.analytics.config import ANALYTICS_HIRE_STATUSES
+from app.services.analytics.models.analytics import AnalyticsEventType, AnalyticsRollup, RollupGranularity
+from app.services.application.models.application import Application
+from app.services.auth_service.models.user import User
+from app.services.job.models.job import Job, JobStatus
+
+# Counters that are plain sums across buckets
+SUM_FIELDS = ("jobs_posted", "jobs_closed", "jobs_reopened", "applications_submitted", "hires", "time_to_hire_seconds", "job_views", "searches")
+MAP_FIELDS = ("jobs_by_employment_type", "applications_by_status", "users_new")
+
+
+def bucket_start(at: datetime, granularity: RollupGranularity) -> datetime:
+    if granularity == RollupGranularity.HOUR:
+        return at.replace(minute=0, second=0, microsecond=0)
+    return at.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def rollup_id(granularity: RollupGranularity, bucket: datetime) -> str:
+    return f"{granularity.value}:{bucket.isoformat()}"
+
+
+def _key(value: Any) -> str:
+    # Map keys become field names
+    return str(getattr(value, "value", value)).replace(".", "_").replace("$", "_")
+
+
+async def record(increments: Dict[str, float], at: Optional[datetime] = None):
+    """Add increments (dotted paths allowed, e.g. "users_new.employer") to the hour and day buckets"""
+    increments = {path: amount for path, amount in increments.items() if amount}
+    if not increments:
+        return
+    at = at or datetime.utcnow()
+    operations = []
+    for granularity in RollupGranularity:
+        bucket = bucket_start(at, granularity)
+        operations.append(UpdateOne(
+            {"_id": rollup_id(granularity, bucket)},
+            {"$inc": increments, "$setOnInsert": {"granularity": granularity.value, "bucket": bucket}},
+            upsert=True,
+        ))
+    await AnalyticsRollup.get_motor_collection().bulk_write(operations, ordered=False)
+
+
+# -- event handlers -----------------------------------------------------------
+
+async def on_job_created(job):
+    await record({"jobs_posted": 1, f"jobs_by_employment_type.{_key(job.employment_type)}": 1})
+
+
+async def on_jobs_created(jobs: List[Any]):
+    increments: Counter = Counter()
+    for job in jobs:
+        increments["jobs_posted"] += 1
+        increments[f"jobs_by_employment_type.{_key(job.employment_type)}"] += 1
+    await record(increments)
+
+
+async def on_job_closed(job):
+    await record({"jobs_closed": 1})
+
+
+async def on_job_reopened(job):
+    await record({"jobs_reopened": 1})
+
+
+async def on_user_created(user):
+    await record({f"users_new.{_key(user.role)}": 1})
+
+
+async def on_application_submitted(application):
+    await record({"applications_submitted": 1, f"applications_by_status.{_key(application.status)}": 1})
+
+
+async def on_application_status_changed_many(changes: List[dict]):
+    """A bulk status change: every delta lands in the same buckets, so one record()"""
+    now = datetime.utcnow()
+    increments: Counter = Counter()
+    for change in changes:
+        application = change["application"]
+        if change["previous_status"] == application.status:
+            continue
+        increments[f"applications_by_status.{_key(application.status)}"] += 1
+        if application.status in ANALYTICS_HIRE_STATUSES and change["previous_status"] not in ANALYTICS_HIRE_STATUSES:
+            applied_at = application.applied_at.replace(tzinfo=None)
+            increments["hires"] += 1
+            increments["time_to_hire_seconds"] += max((now - applied_at).total_seconds(), 0.0)
+    await record(increments, at=now)
+
+
+async def on_events_flushed(events: Iterable[dict]):
+    """Fold a batch written by the tracker into the view/search counters"""
+    counts = Counter(event["type"] for event in events)
+    await record({
+        "job_views": counts[AnalyticsEventType.JOB_VIEW.value],
+        "searches": counts[AnalyticsEventType.SEARCH.value],
+    })
+
+
+# -- reads --------------------------------------------------------------------
+
+async def get_rollups(granularity: RollupGranularity, since: datetime) -> List[AnalyticsRollup]:
+    """Buckets from since (inclusive, floored to the bucket) in time order"""
+    return await AnalyticsRollup.find(
+        {"granularity": granularity.value, "bucket": {"$gte": bucket_start(since, granularity)}}
+    ).sort("bucket").to_list()
+
+
+def combine(rollups: Iterable[Any]) -> Dict[str, Any]:
+    """Sum rollups (documents or raw dicts) into one set of counters"""
+    totals: Dict[str, Any] = {field: 0 for field in SUM_FIELDS}
+    totals.update({field: Counter() for field in MAP_FIELDS})
+    for rollup in rollups:
+        get = rollup.get if isinstance(rollup, dict) else lambda name: getattr(rollup, name, None)
+        for field in SUM_FIELDS:
+            totals[field] += get(field) or 0
+        for field in MAP_FIELDS:
+            totals[field].update(get(field) or {})
+    return totals
+
+
+async def get_all_time_totals() -> Dict[str, Any]:
+    """Totals over every daily bucket: O(days) documents"""
+    cursor = AnalyticsRollup.get_motor_collection().find(
+        {"granularity": RollupGranularity.DAY.value}, {"_id": 0, "granularity": 0, "bucket": 0}
+    )
+    return combine([doc async for doc in cursor])
+
+
+# -- backfill -------------------------------------------------------------------
+
+def _backfill_pipeline(time_field: str, unit: str, fields: Dict[str, Any],
+                       breakdown: Optional[tuple] = None, match: Optional[dict] = None) -> List[dict]:
+    """Group a source collection (optionally filtered) by bucket and key, and $merge into the rollups"""
+    bucket = {"$dateTrunc": {"date": f"${time_field}", "unit": unit}}
+    pipeline: List[dict] = [{"$match": match}] if match else []
+    if breakdown:
+        target, source = breakdown
+        pipeline += [
+            {"$group": {"_id": {"bucket": bucket, "key": {"$toString": f"${source}"}}, "count": {"$sum": 1}}},
+            {"$group": {
+                "_id": "$_id.bucket",
+                "total": {"$sum": "$count"},
+                "pairs": {"$push": {"k": {"$ifNull": ["$_id.key", "unknown"]}, "v": "$count"}},
+            }},
+            {"$project": {target: {"$arrayToObject": "$pairs"}, **{name: "$total" for name in fields}}},
+        ]
+    else:
+        pipeline += [
+            {"$group": {"_id": bucket, "total": {"$sum": 1}}},
+            {"$project": {name: "$total" for name in fields}},
+        ]
+    pipeline += [
+        {"$addFields": {
+            "bucket": "$_id",
+            "granularity": unit,
+            "_id": {"$concat": [unit, ":", {"$dateToString": {"date": "$_id", "format": "%Y-%m-%dT%H:%M:%S"}}]},
+        }},
+        {"$merge": {"into": AnalyticsRollup.get_collection_name(), "on": "_id", "whenMatched": "merge", "whenNotMatched": "insert"}},
+    ]
+    return pipeline
+
+
+async def backfill_rollups():
+    """
+    Recount jobs posted and closed, applications submitted and by status, and
+    new users for every bucket. Closes and statuses are recounted from the
+    current documents: a closed job counts once at its updated_at (reopens
+    are reset, since an active job was not counted as closed), and an
+    application once in its current status at its updated_at.
+    """
+    await AnalyticsRollup.get_motor_collection().update_many(
+        {}, {"$set": {"jobs_closed": 0, "jobs_reopened": 0, "applications_by_status": {}}}
+    )
+    for granularity in RollupGranularity:
+        unit = granularity.value
+        await Job.get_motor_collection().aggregate(
+            _backfill_pipeline("created_at", unit, {"jobs_posted": 1}, ("jobs_by_employment_type", "employment_type"))
+        ).to_list(length=None)
+        await Job.get_motor_collection().aggregate(
+            _backfill_pipeline("updated_at", unit, {"jobs_closed": 1}, match={"status": JobStatus.CLOSED.value})
+        ).to_list(length=None)
+        await Application.get_motor_collection().aggregate(
+            _backfill_pipeline("updated_at", unit, {}, ("applications_by_status", "status"))
+        ).to_list(length=None)
+        await Application.get_motor_collection().aggregate(
+            _backfill_pipeline("applied_at", unit, {"applications_submitted": 1})
+        ).to_list(length=None)
+        await User.get_motor_collection().aggregate(
+            _backfill_pipeline("created_at", unit, {}, ("users_new", "role"))
+        ).to_list(length=None)
+
+
+async def main() -> int:
+    from app.core.db import init_db
+
+    await init_db()
+    await backfill_rollups()
+    print("Analytics rollups backfilled")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,141 @@
+# app/services/analytics/services/tracker.py
+"""
+Buffered analytics event tracker.
+
+track() only appends a small dict to an in-memory ring buffer, so it is
+cheap enough for hot request paths. A background task started from the
+lifespan drains the buffer with insert_many, either every
+ANALYTICS_FLUSH_INTERVAL_SECONDS or as soon as a full batch is waiting.
+When MongoDB cannot keep up the buffer fills and the oldest events are
+overwritten; every lost event is counted.
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, List, Optional
+
+from app.services.analytics.config import (
+    ANALYTICS_BUFFER_SIZE,
+    ANALYTICS_ENABLED,
+    ANALYTICS_FLUSH_BATCH_SIZE,
+    ANALYTICS_FLUSH_INTERVAL_SECONDS,
+)
+from app.services.analytics.db import analytics_crud
+
+logger = logging.getLogger(__name__)
+
+
+class EventTracker:
+    def __init__(self, capacity: int = ANALYTICS_BUFFER_SIZE, batch_size: int = ANALYTICS_FLUSH_BATCH_SIZE,
+                 interval: float = ANALYTICS_FLUSH_INTERVAL_SECONDS, enabled: bool = ANALYTICS_ENABLED):
+        self.enabled = enabled
+        self.batch_size = batch_size
+        self.interval = interval
+        self.buffer: deque = deque(maxlen=capacity)
+        self.tracked = 0
+        self.flushed = 0
+        self.dropped_overflow = 0  # overwritten before they could be flushed
+        self.dropped_failed = 0  # lost in failed writes
+        self.flush_errors = 0
+        self.last_flush_ms: Optional[float] = None
+        # Called with each written batch (e.g. to fold it into rollups)
+        self.flush_listeners: List[Callable[[List[dict]], Any]] = []
+        self._batch_ready: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    # -- producers (hot path) ------------------------------------------------
+
+    def track(self, event_type: str, job_id: Optional[str] = None, user_id: Optional[str] = None,
+              query: Optional[str] = None, **data: Any):
+        if not self.enabled:
+            return
+        if len(self.buffer) == self.buffer.maxlen:
+            self.dropped_overflow += 1
+        self.buffer.append({
+            "type": event_type,
+            "job_id": job_id,
+            "user_id": user_id,
+            "query": query,
+            "data": data,
+            "created_at": datetime.utcnow(),
+        })
+        self.tracked += 1
+        if self._batch_ready is not None and len(self.buffer) >= self.batch_size:
+            self._batch_ready.set()
+
+    # -- consumer ------------------------------------------------------------
+
+    async def flush(self) -> int:
+        """Write everything buffered so far in batches; returns events written"""
+        written = 0
+        while self.buffer:
+            batch = [self.buffer.popleft() for _ in range(min(self.batch_size, len(self.buffer)))]
+            started = time.perf_counter()
+            try:
+                inserted = await analytics_crud.insert_events(batch)
+            except asyncio.CancelledError:
+                self.buffer.extendleft(reversed(batch))  # shutdown: the final flush retries them
+                raise
+            except Exception:
+                # Database unavailable: keep the events unless newer ones need the room
+                self.flush_errors += 1
+                room = self.buffer.maxlen - len(self.buffer)
+                self.buffer.extendleft(reversed(batch[-room:] if room else []))
+                self.dropped_failed += len(batch) - min(room, len(batch))
+                logger.exception("Analytics flush of %d events failed", len(batch))
+                break
+            self.last_flush_ms = round((time.perf_counter() - started) * 1000, 3)
+            self.dropped_failed += len(batch) - inserted
+            self.flushed += inserted
+            written += inserted
+            for listener in self.flush_listeners:
+                try:
+                    await listener(batch)
+                except Exception:
+                    logger.exception("Analytics flush listener %r failed", listener)
+        return written
+
+    async def run(self):
+        self._batch_ready = asyncio.Event()
+        while True:
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+            failures = self.flush_errors
+            await self.flush()
+            if self.flush_errors > failures:
+                await asyncio.sleep(self.interval)  # back off while the database is unavailable
+
+    def start(self):
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "buffered": len(self.buffer),
+            "capacity": self.buffer.maxlen,
+            "tracked": self.tracked,
+            "flushed": self.flushed,
+            "dropped_overflow": self.dropped_overflow,
+            "dropped_failed": self.dropped_failed,
+            "flush_errors": self.flush_errors,
+            "last_flush_ms": self.last_flush_ms,
+        }
+
+
+tracker = EventTracker()
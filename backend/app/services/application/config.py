@@ -0,0 +1,10 @@
+# app/services/application/config.py
+
+import os
+
+# Job -> employer_id/status lookups made when an application is submitted
+APPLICATION_JOB_CACHE_SIZE = int(os.getenv("APPLICATION_JOB_CACHE_SIZE", "10000"))
+APPLICATION_JOB_CACHE_TTL = float(os.getenv("APPLICATION_JOB_CACHE_TTL", "300"))
+
+# Applications per PUT /api/applications/bulk-status request
+APPLICATION_BULK_STATUS_MAX = int(os.getenv("APPLICATION_BULK_STATUS_MAX", "500"))
@@ -1,14 +1,64 @@
 # app/services/application/db/application_crud.py
 
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+from app.core import raw_reads
+from app.core.pagination import keyset_filter
 from app.services.application.models.application import Application
 from beanie import PydanticObjectId
 
-async def get_applications_by_candidate(candidate_id: str):
-    return await Application.find(Application.candidate_id == candidate_id).to_list()
+# Fields returned by the application list endpoints
+APPLICATION_FIELDS = ("id", "candidate_id", "job_id", "employer_id", "resume_url", "cover_letter", "status", "applied_at", "updated_at")
 
-async def get_applications_by_employer(employer_id: str):
-    return await Application.find(Application.employer_id == employer_id).to_list()
-async def create_application(application_data: dict):
+def to_document(application: Application) -> Dict[str, Any]:
+    return {"id": str(application.id), **application.model_dump(include=set(APPLICATION_FIELDS) - {"id"})}
+
+async def _list_applications(endpoint: str, query: Dict[str, Any]) -> List[Dict[str, Any]]:
+    sort = [("applied_at", -1)]
+    if raw_reads.raw_reads_enabled(endpoint):
+        docs = raw_reads.stream(Application, query, fields=APPLICATION_FIELDS, sort=sort)
+        return [raw_reads.with_str_id(doc) async for doc in docs]
+    applications = await Application.find(query).sort(sort).to_list()
+    return [to_document(application) for application in applications]
+
+async def get_applications_by_candidate(candidate_id: str) -> List[Dict[str, Any]]:
+    return await _list_applications("candidate_applications", {"candidate_id": candidate_id})
+
+async def find_employer_applications(
+    employer_id: str,
+    limit: int,
+    cursor: Optional[str] = None,
+    job_id: Optional[str] = None,
+    statuses: Optional[Sequence[str]] = None,
+    applied_from: Optional[datetime] = None,
+    applied_to: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Up to limit applications after the cursor, newest first. The employer_*
+    indexes end in applied_at, so the sort never needs an in-memory stage
+    """
+    query: Dict[str, Any] = {"employer_id": employer_id}
+    if job_id:
+        query["job_id"] = job_id
+    if statuses:
+        query["status"] = statuses[0] if len(statuses) == 1 else {"$in": list(statuses)}
+    applied_at = {}
+    if applied_from:
+        applied_at["$gte"] = applied_from
+    if applied_to:
+        applied_at["$lt"] = applied_to
+    if applied_at:
+        query["applied_at"] = applied_at
+    query.update(keyset_filter("applied_at", cursor))
+    sort = [("applied_at", -1), ("_id", -1)]
+    if raw_reads.raw_reads_enabled("employer_applications"):
+        docs = await raw_reads.find(Application, query, fields=APPLICATION_FIELDS, sort=sort, limit=limit)
+        return [raw_reads.with_str_id(doc) for doc in docs]
+    applications = await Application.find(query).sort(sort).limit(limit).to_list()
+    return [to_document(application) for application in applications]
+
+async def create_application(application_data: dict, session=None) -> Application:
+    """Insert; raises DuplicateKeyError when the candidate already applied to the job"""
     application = Application(**application_data)
-    await application.insert()
+    await application.insert(session=session)
     return application
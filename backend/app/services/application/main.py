@@ -0,0 +1,16 @@
+# app/services/application/main.py
+
+from app.core.events import subscribe, unsubscribe
+from app.services.application.services import job_lookup
+
+JOB_EVENTS = ("job.updated", "job.closed", "job.reopened")
+
+
+async def startup():
+    for event in JOB_EVENTS:
+        subscribe(event, job_lookup.on_job_changed)
+
+
+async def shutdown():
+    for event in JOB_EVENTS:
+        unsubscribe(event, job_lookup.on_job_changed)
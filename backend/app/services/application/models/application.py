@@ -1,18 +1,60 @@
 # app/services/application/models/application.py
 
 from beanie import Document
-from pydantic import Field
+from pydantic import BaseModel, Field
 from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.models.application import ApplicationStatus
+from pymongo import ASCENDING, DESCENDING, IndexModel
 
 class Application(Document):
     candidate_id: str
     job_id: str
     resume_url: str
     cover_letter: str
-    status: str = Field(default="pending")
+    status: str = Field(default=ApplicationStatus.SUBMITTED.value)  # older rows may hold legacy values
     employer_id: str
     applied_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     class Settings:
         name = "applications"  # MongoDB collection name
+        indexes = [
+            # Employer dashboard and inbox: newest applications first, optionally per status or job
+            IndexModel([("employer_id", ASCENDING), ("applied_at", DESCENDING)], name="employer_applied_at"),
+            IndexModel(
+                [("employer_id", ASCENDING), ("status", ASCENDING), ("applied_at", DESCENDING), ("_id", DESCENDING)],
+                name="employer_status_applied_at",
+            ),
+            IndexModel(
+                [("employer_id", ASCENDING), ("job_id", ASCENDING), ("applied_at", DESCENDING), ("_id", DESCENDING)],
+                name="employer_job_applied_at",
+            ),
+            IndexModel([("candidate_id", ASCENDING), ("applied_at", DESCENDING)], name="candidate_applied_at"),
+            IndexModel([("job_id", ASCENDING)], name="job_id"),
+            # One application per candidate and job; enforced on insert, no read-before-write
+            IndexModel([("candidate_id", ASCENDING), ("job_id", ASCENDING)], name="candidate_job", unique=True),
+        ]
+
+
+class ApplyForm(BaseModel):
+    job_id: str
+    resume_url: str
+    cover_letter: str
+
+
+class ApplicationInboxQuery(BaseModel):
+    """Query parameters of GET /api/applications/employer"""
+    limit: int = Field(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+    cursor: Optional[str] = None
+    job_id: Optional[str] = None
+    status: Optional[List[str]] = None  # any of
+    applied_from: Optional[datetime] = None  # inclusive
+    applied_to: Optional[datetime] = None  # exclusive
+
+
+class ApplicationInboxPage(BaseModel):
+    items: List[Dict[str, Any]] = []  # application fields plus a compact "job"
+    next_cursor: Optional[str] = None
+    limit: int
@@ -1,23 +1,26 @@
 # app/services/application/routes/application_routes.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from app.services.application.services import apply_handler, status_updater
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from app.services.application.services import apply_handler, inbox, status_updater
 from app.services.application.db import application_crud
 from app.services.auth_service.services.jwt_handler import get_current_user
-from pydantic import BaseModel
-from typing import List
+from app.services.application.models.application import ApplicationInboxPage, ApplicationInboxQuery, ApplyForm
+from app.core.raw_reads import encode_document, encode_documents, json_response
+from app.services.application.config import APPLICATION_BULK_STATUS_MAX
+from app.models.application import ApplicationStatus
+from collections import Counter
+from pydantic import BaseModel, Field
+from typing import Annotated, List
 from fastapi import Depends
 router = APIRouter()
 
 # Pydantic models
-class ApplyForm(BaseModel):
-    job_id: str
-    resume_url: str
-    cover_letter: str
-
 class UpdateStatusForm(BaseModel):
     application_id: str
-    new_status: str  # e.g., "interview", "rejected", "hired"
+    new_status: ApplicationStatus  # e.g., "under_review", "rejected", "accepted"
+
+class BulkUpdateStatusForm(BaseModel):
+    changes: List[UpdateStatusForm] = Field(..., min_length=1, max_length=APPLICATION_BULK_STATUS_MAX)
 
 
 
@@ -34,15 +37,16 @@ async def apply_to_job(form: ApplyForm, user=Depends(get_current_user)):
 async def get_candidate_applications(user=Depends(get_current_user)):
     if not user or user["role"] != "candidate":
         raise HTTPException(status_code=403, detail="Unauthorized")
-    return await application_crud.get_applications_by_candidate(user["id"])
+    return json_response(encode_documents(await application_crud.get_applications_by_candidate(user["id"])))
 
 
-# GET /api/applications/employer
-@router.get("/employer", response_model=List[dict])
-async def get_employer_applications(user=Depends(get_current_user)):
+# GET /api/applications/employer?status=pending&job_id=...&cursor=...
+@router.get("/employer", response_model=ApplicationInboxPage)
+async def get_employer_applications(params: Annotated[ApplicationInboxQuery, Query()], user=Depends(get_current_user)):
+    """Employer inbox, newest first, filtered by job, status and applied_at range"""
     if not user or user["role"] != "employer":
         raise HTTPException(status_code=403, detail="Unauthorized")
-    return await application_crud.get_applications_by_employer(user["id"])
+    return json_response(encode_document(await inbox.get_employer_inbox(user["id"], params)))
 
 
 # PUT /api/applications/update-status
@@ -51,3 +55,15 @@ async def update_application_status(data: UpdateStatusForm, user=Depends(get_cur
     if not user or user["role"] != "employer":
         raise HTTPException(status_code=403, detail="Only employers can update application status.")
     return await status_updater.update_status(user["id"], data.application_id, data.new_status)
+
+
+# PUT /api/applications/bulk-status
+@router.put("/bulk-status")
+async def bulk_update_application_status(data: BulkUpdateStatusForm, user=Depends(get_current_user)):
+    """Apply many status changes at once; returns counts and one outcome per change"""
+    if not user or user["role"] != "employer":
+        raise HTTPException(status_code=403, detail="Only employers can update application status.")
+    results = await status_updater.bulk_update_status(
+        user["id"], [(change.application_id, change.new_status) for change in data.changes]
+    )
+    return {**Counter(result["outcome"] for result in results), "results": results}
@@ -1,16 +1,48 @@
 # app/services/application/services/apply_handler.py
-
+"""
+The one write path for job applications (POST /api/applications/apply and
+POST /api/jobs/{job_id}/apply). The job's employer_id is copied onto the
+application so employer inbox queries filter on one indexed field, and
+duplicates are rejected by the unique (candidate_id, job_id) index. The
+employer's notification is queued in the same unit of work.
+"""
 from app.services.application.db import application_crud
+from app.services.application.models.application import ApplyForm
+from app.models.application import ApplicationStatus
+from app.services.application.services import job_lookup
+from app.services.notifications.event_handlers import application_events
+from app.services.notifications.services import outbox
+from app.core.events import publish
+from fastapi import HTTPException
 from datetime import datetime
+from pymongo.errors import DuplicateKeyError
+
+async def submit_application(user_id: str, form: ApplyForm) -> dict:
+    job = await job_lookup.get_job_owner(form.job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if not job.accepting_applications:
+        raise HTTPException(status_code=409, detail="This job is no longer accepting applications")
 
-async def submit_application(user_id: str, form):
     application_data = {
         "candidate_id": user_id,
         "job_id": form.job_id,
+        "employer_id": job.employer_id,
         "resume_url": form.resume_url,
         "cover_letter": form.cover_letter,
-        "status": "pending",
+        "status": ApplicationStatus.SUBMITTED.value,
         "applied_at": datetime.utcnow(),
     }
 
-    return await application_crud.create_application(application_data)
+    try:
+        async with outbox.unit_of_work() as session:
+            application = await application_crud.create_application(application_data, session=session)
+            await outbox.enqueue(application_events.EVENT, [application_events.outbox_payload(application)], session=session)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="You have already applied to this job")
+    await publish("application.submitted", application)
+    return {
+        "message": "Application submitted.",
+        "application_id": str(application.id),
+        "application": application_crud.to_document(application),
+    }
@@ -0,0 +1,39 @@
+# app/services/application/services/inbox.py
+"""
+Employer application inbox: one keyset page of applications plus the jobs
+they belong to, fetched with a single $in per page. Work per request is
+bounded by the page size, not by how many applications an employer has.
+"""
+from typing import Any, Dict, Optional
+
+from app.core.pagination import encode_cursor
+from app.services.application.db import application_crud
+from app.services.application.models.application import ApplicationInboxQuery
+from app.services.job.db import job_crud
+
+
+def _job_card(job_id: str, job: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if job is None:
+        return None  # deleted job
+    return {"id": job_id, **{field: job.get(field) for field in job_crud.JOB_SUMMARY_FIELDS}}
+
+
+async def get_employer_inbox(employer_id: str, params: ApplicationInboxQuery) -> Dict[str, Any]:
+    # Fetch one extra row to know whether another page exists
+    rows = await application_crud.find_employer_applications(
+        employer_id,
+        limit=params.limit + 1,
+        cursor=params.cursor,
+        job_id=params.job_id,
+        statuses=params.status,
+        applied_from=params.applied_from,
+        applied_to=params.applied_to,
+    )
+    has_more = len(rows) > params.limit
+    rows = rows[:params.limit]
+    next_cursor = encode_cursor(rows[-1]["applied_at"], rows[-1]["id"]) if has_more else None
+
+    jobs = await job_crud.get_job_summaries(row["job_id"] for row in rows)
+    for row in rows:
+        row["job"] = _job_card(row["job_id"], jobs.get(row["job_id"]))
+    return {"items": rows, "next_cursor": next_cursor, "limit": params.limit}
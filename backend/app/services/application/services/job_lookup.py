@@ -0,0 +1,53 @@
+# app/services/application/services/job_lookup.py
+"""
+What the application write path needs to know about a job (its owner and
+whether it is still open), cached per process. Jobs never change owner;
+job.updated / job.closed / job.reopened events drop the entry so a closed
+job stops accepting applications right away on this worker.
+"""
+from typing import NamedTuple, Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+from app.core.cache import TTLCache
+from app.core.raw_reads import collection
+from app.services.application.config import APPLICATION_JOB_CACHE_SIZE, APPLICATION_JOB_CACHE_TTL
+from app.services.job.models.job import Job, JobStatus
+
+
+class JobOwner(NamedTuple):
+    employer_id: str
+    status: str
+
+    @property
+    def accepting_applications(self) -> bool:
+        return self.status == JobStatus.ACTIVE.value
+
+
+_jobs = TTLCache(maxsize=APPLICATION_JOB_CACHE_SIZE, ttl=APPLICATION_JOB_CACHE_TTL)
+
+
+async def get_job_owner(job_id: str) -> Optional[JobOwner]:
+    """Owner and status of a job, or None when it does not exist"""
+    owner = _jobs.get(job_id)
+    if owner is not None:
+        return owner
+    try:
+        object_id = ObjectId(job_id)
+    except (InvalidId, TypeError):
+        return None
+    doc = await collection(Job).find_one({"_id": object_id}, {"employer_id": 1, "status": 1})
+    if doc is None:
+        return None
+    owner = JobOwner(doc["employer_id"], doc.get("status", JobStatus.ACTIVE.value))
+    _jobs.set(job_id, owner)
+    return owner
+
+
+async def on_job_changed(job):
+    _jobs.pop(str(job.id))
+
+
+def stats() -> dict:
+    return _jobs.stats()
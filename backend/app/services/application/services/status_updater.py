@@ -1,21 +1,143 @@
 # app/services/application/services/status_updater.py
+"""
+Employer-driven application status changes.
 
-from app.services.application.models.application import Application
-from beanie import PydanticObjectId
+Statuses follow ApplicationStatus and may only move along TRANSITIONS.
+Every change is a partial $set whose filter carries employer_id and the
+status the transition was validated against, so an application that
+belongs to someone else, or changed in the meantime, is never written.
+A batch is one $in read and one unordered bulk_write, the candidates'
+notifications are queued in the same unit of work, and the dashboard and
+analytics counters get one application.status_changed_many event.
+"""
 from datetime import datetime
+from typing import Dict, FrozenSet, List, Sequence, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException
+from pymongo import UpdateOne
+
+from app.core.events import publish
+from app.models.application import ApplicationStatus
+from app.services.application.models.application import Application
+from app.services.notifications.event_handlers import status_events
+from app.services.notifications.services import outbox
+
+S = ApplicationStatus
+
+# Allowed next statuses. Withdrawing is the candidate's move, not the employer's.
+TRANSITIONS: Dict[ApplicationStatus, FrozenSet[ApplicationStatus]] = {
+    S.SUBMITTED: frozenset({S.UNDER_REVIEW, S.INTERVIEW_SCHEDULED, S.REJECTED}),
+    S.UNDER_REVIEW: frozenset({S.INTERVIEW_SCHEDULED, S.ACCEPTED, S.REJECTED}),
+    S.INTERVIEW_SCHEDULED: frozenset({S.INTERVIEWED, S.REJECTED}),
+    S.INTERVIEWED: frozenset({S.INTERVIEW_SCHEDULED, S.ACCEPTED, S.REJECTED}),
+    S.REJECTED: frozenset({S.UNDER_REVIEW}),
+    S.ACCEPTED: frozenset(),
+    S.WITHDRAWN: frozenset(),
+}
+
+# Values written before statuses were validated
+LEGACY_STATUSES = {"pending": S.SUBMITTED, "interview": S.INTERVIEW_SCHEDULED, "hired": S.ACCEPTED}
+
+# Outcome -> HTTP status for the single-application endpoint
+OUTCOME_ERRORS = {
+    "not_found": (404, "Application not found."),
+    "invalid_transition": (409, "Status change not allowed."),
+    "conflict": (409, "Application was changed by another request."),
+}
+
+
+def current_status(value: str):
+    """The ApplicationStatus a stored value stands for, or None when unknown"""
+    if value in LEGACY_STATUSES:
+        return LEGACY_STATUSES[value]
+    try:
+        return ApplicationStatus(value)
+    except ValueError:
+        return None
+
+
+async def bulk_update_status(employer_id: str, changes: Sequence[Tuple[str, ApplicationStatus]]) -> List[dict]:
+    """Apply (application_id, new_status) changes; one outcome per change, in order"""
+    outcomes: List[dict] = []
+    wanted: Dict[ObjectId, int] = {}  # application _id -> index in outcomes
+    for application_id, new_status in changes:
+        outcome = {"application_id": application_id, "status": new_status.value}
+        outcomes.append(outcome)
+        try:
+            object_id = ObjectId(application_id)
+        except (InvalidId, TypeError):
+            outcome["outcome"] = "not_found"
+            continue
+        if object_id in wanted:
+            outcome["outcome"] = "duplicate"
+            continue
+        wanted[object_id] = len(outcomes) - 1
 
-async def update_status(employer_id: str, application_id: str, new_status: str):
-    app = await Application.get(PydanticObjectId(application_id))
+    found = await Application.find({"_id": {"$in": list(wanted)}, "employer_id": employer_id}).to_list()
+    applications = {application.id: application for application in found}
 
-    if not app:
-        raise ValueError("Application not found.")
+    now = datetime.utcnow()
+    operations = []
+    pending: Dict[ObjectId, Tuple[Application, str]] = {}
+    for object_id, index in wanted.items():
+        outcome = outcomes[index]
+        application = applications.get(object_id)
+        if application is None:
+            outcome["outcome"] = "not_found"  # missing or another employer's
+            continue
+        new_status = ApplicationStatus(outcome["status"])
+        previous = current_status(application.status)
+        outcome["previous_status"] = application.status
+        if previous == new_status:
+            outcome["outcome"] = "unchanged"
+            continue
+        if previous is None or new_status not in TRANSITIONS[previous]:
+            outcome["outcome"] = "invalid_transition"
+            outcome["allowed"] = sorted(status.value for status in TRANSITIONS.get(previous, ()))
+            continue
+        operations.append(UpdateOne(
+            {"_id": object_id, "employer_id": employer_id, "status": application.status},
+            {"$set": {"status": new_status.value, "updated_at": now}},
+        ))
+        pending[object_id] = (application, application.status)
 
-    # Optional: enforce only the employer who owns the job can update
-    if app.employer_id != employer_id:
-        raise PermissionError("Unauthorized to update this application.")
+    if operations:
+        collection = Application.get_motor_collection()
+        async with outbox.unit_of_work() as session:
+            result = await collection.bulk_write(operations, ordered=False, session=session)
+            applied = set(pending)
+            if result.matched_count < len(operations):
+                # Some rows moved on since they were read: find the ones written by this batch
+                written = collection.find({"_id": {"$in": list(pending)}, "updated_at": now}, {"_id": 1}, session=session)
+                applied = {doc["_id"] async for doc in written}
+            for object_id, (application, previous_status) in pending.items():
+                if object_id in applied:
+                    application.status = outcomes[wanted[object_id]]["status"]
+                    application.updated_at = now
+            await outbox.enqueue(status_events.EVENT, [
+                status_events.outbox_payload(application, previous_status)
+                for object_id, (application, previous_status) in pending.items() if object_id in applied
+            ], session=session)
+        changed = []
+        for object_id, (application, previous_status) in pending.items():
+            outcome = outcomes[wanted[object_id]]
+            if object_id not in applied:
+                outcome["outcome"] = "conflict"
+                continue
+            outcome["outcome"] = "updated"
+            changed.append({"application": application, "previous_status": previous_status})
+        if changed:
+            await publish("application.status_changed_many", changed)
+    return outcomes
 
-    app.status = new_status
-    app.updated_at = datetime.utcnow()
 
-    await app.save()
+async def update_status(employer_id: str, application_id: str, new_status: ApplicationStatus):
+    [outcome] = await bulk_update_status(employer_id, [(application_id, new_status)])
+    if outcome["outcome"] in OUTCOME_ERRORS:
+        status_code, detail = OUTCOME_ERRORS[outcome["outcome"]]
+        if outcome.get("allowed") is not None:
+            detail = f"{detail} From {outcome['previous_status']} an application can move to: {', '.join(outcome['allowed']) or 'nothing'}."
+        raise HTTPException(status_code=status_code, detail=detail)
     return {"message": "Application status updated.", "application_id": application_id}
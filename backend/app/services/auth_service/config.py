@@ -0,0 +1,19 @@
+# app/services/auth_service/config.py
+
+import os
+
+# Password hashing runs off the event loop in a bounded pool.
+# "thread" is enough for bcrypt (it releases the GIL); "process" isolates it fully.
+PASSWORD_HASH_EXECUTOR = os.getenv("PASSWORD_HASH_EXECUTOR", "thread")
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+# Calls queued or running beyond this limit are rejected with 503
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+
+# Decoded principals cached per process (see jwt_handler.get_current_user).
+# The caches are per worker and never invalidated: after a change to a user's
+# role or is_active, a worker may keep serving the old principal for up to
+# AUTH_PRINCIPAL_CACHE_TTL seconds. Set the TTL to 0 to read the user on every request.
+AUTH_PRINCIPAL_CACHE_SIZE = int(os.getenv("AUTH_PRINCIPAL_CACHE_SIZE", "10000"))
+AUTH_PRINCIPAL_CACHE_TTL = float(os.getenv("AUTH_PRINCIPAL_CACHE_TTL", "60"))
+# Build the principal from the signed role/email claims and skip the DB lookup
+AUTH_TRUST_TOKEN_CLAIMS = os.getenv("AUTH_TRUST_TOKEN_CLAIMS", "false").lower() == "true"
@@ -2,6 +2,7 @@ from beanie import Document
 from pydantic import EmailStr, Field
 from typing import Optional
 from datetime import datetime
+from pymongo import ASCENDING, IndexModel
 
 
 class User(Document):
@@ -10,10 +11,15 @@ class User(Document):
     full_name: Optional[str] = None
     role: str = Field(default="candidate", description="candidate or employer")
     is_active: bool = True
+    token_version: int = 0  # $inc it with any role/is_active change; tokens carry it as "ver"
+    locale: Optional[str] = None  # language of emails; the default locale when unset
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
     class Settings:
         name = "users"  # MongoDB collection name
+        indexes = [
+            IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+        ]
 
     model_config = {
         "json_schema_extra": {
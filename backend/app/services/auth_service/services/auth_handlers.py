@@ -1,10 +1,12 @@
 # app/services/auth_service/services/auth_handlers.py
 
-from app.services.auth_service.services.auth_utils import hash_password, verify_password
-from app.services.auth_service.services.jwt_handler import create_access_token
+from app.services.auth_service.utils.password_hash import hash_password_async, verify_password_async
+from app.services.auth_service.services.jwt_handler import create_access_token, token_claims
 from app.services.auth_service.models.user import User
 from app.models.auth import UserSignup, UserLogin
+from app.core.events import publish
 from fastapi import HTTPException
+from pymongo.errors import DuplicateKeyError
 
 
 async def signup_user(payload: UserSignup):
@@ -14,13 +16,18 @@ async def signup_user(payload: UserSignup):
 
     user = User(
         email=payload.email,
-        hashed_password=hash_password(payload.password),
+        hashed_password=await hash_password_async(payload.password),
         role=payload.role,
         full_name=payload.full_name
     )
-    await user.insert()
+    try:
+        await user.insert()
+    except DuplicateKeyError:
+        # A concurrent signup with the same email won the unique index
+        raise HTTPException(status_code=400, detail="Email already registered")
+    await publish("user.created", user)
     
-    access_token = create_access_token(data={"sub": str(user.id)})
+    access_token = create_access_token(data=token_claims(user))
     
     user_dict = user.dict()
     user_dict["id"] = str(user.id)  # Convert ObjectId to string
@@ -31,10 +38,10 @@ async def signup_user(payload: UserSignup):
 
 async def login_user(payload: UserLogin):
     user = await User.find_one(User.email == payload.email)
-    if not user or not verify_password(payload.password, user.hashed_password):
+    if not user or not await verify_password_async(payload.password, user.hashed_password):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    access_token = create_access_token(data={"sub": str(user.id)})
+    access_token = create_access_token(data=token_claims(user))
     
     user_dict = user.dict()
     user_dict["id"] = str(user.id)  # Convert ObjectId to string
@@ -2,9 +2,17 @@
 
 from datetime import datetime, timedelta
 from typing import Optional
+import time
 from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status, Request
 from app.services.auth_service.models.user import User
+from app.services.auth_service.config import (
+    AUTH_PRINCIPAL_CACHE_SIZE,
+    AUTH_PRINCIPAL_CACHE_TTL,
+    AUTH_TRUST_TOKEN_CLAIMS,
+)
+from app.core.cache import TTLCache
+from beanie import PydanticObjectId
 from app.core.db import db
 import os
 
@@ -12,34 +20,116 @@ SECRET_KEY = os.getenv("JWT_SECRET", "secret")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# token -> user id (saves the JWT decode), user id -> principal (saves the DB read)
+_token_cache = TTLCache(maxsize=AUTH_PRINCIPAL_CACHE_SIZE, ttl=AUTH_PRINCIPAL_CACHE_TTL)
+_principal_cache = TTLCache(maxsize=AUTH_PRINCIPAL_CACHE_SIZE, ttl=AUTH_PRINCIPAL_CACHE_TTL)
+# user id -> token_version and is_active, for trusting claims; a miss re-reads them
+_user_state_cache = TTLCache(maxsize=AUTH_PRINCIPAL_CACHE_SIZE, ttl=AUTH_PRINCIPAL_CACHE_TTL)
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=15))
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "iat": int(time.time())})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
+def token_claims(user: User) -> dict:
+    """Claims embedded in access tokens so they can be trusted without a DB read"""
+    return {
+        "sub": str(user.id),
+        "email": user.email,
+        "role": user.role,
+        "full_name": user.full_name,
+        "ver": user.token_version,
+    }
+
+
+async def _user_state(user_id: str) -> dict:
+    """
+    token_version and is_active of a user. Both live on the User document,
+    so an evicted entry costs a small read, never a revoked token trusted.
+    """
+    principal = _principal_cache.get(user_id)
+    if principal is not None:
+        return {"token_version": principal.get("token_version", 0), "is_active": principal.get("is_active", True)}
+    state = _user_state_cache.get(user_id)
+    if state is None:
+        try:
+            object_id = PydanticObjectId(user_id)
+        except Exception:
+            raise HTTPException(status_code=401, detail="Invalid token payload")
+        doc = await User.get_motor_collection().find_one({"_id": object_id}, {"token_version": 1, "is_active": 1})
+        if doc is None:
+            raise HTTPException(status_code=404, detail="User not found")
+        state = {"token_version": doc.get("token_version", 0), "is_active": doc.get("is_active", True)}
+        _user_state_cache.set(user_id, state)
+    return state
+
+
+def _principal_from_claims(payload: dict, state: dict) -> Optional[dict]:
+    """Principal from the signed claims; None when they predate a change to the user"""
+    if "role" not in payload or "email" not in payload:
+        return None
+    if payload.get("ver", 0) != state["token_version"]:
+        return None
+    return {
+        "id": payload["sub"],
+        "email": payload["email"],
+        "full_name": payload.get("full_name"),
+        "role": payload["role"],
+        "is_active": state["is_active"],
+    }
+
+
+async def _load_principal(user_id: str) -> dict:
+    """A copy of the cached principal, so callers cannot change the cached one"""
+    principal = _principal_cache.get(user_id)
+    if principal is not None:
+        return dict(principal)
+
+    user = await User.get(user_id)
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    user_dict = user.dict()
+    user_dict["id"] = str(user.id)  # Convert ObjectId to string
+    user_dict.pop("hashed_password", None)  # Remove password from response
+
+    _principal_cache.set(user_id, user_dict)
+    return dict(user_dict)
+
+
 async def get_current_user(request: Request):
     auth_header = request.headers.get("Authorization")
     if not auth_header or not auth_header.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Invalid auth header")
     token = auth_header.split(" ")[1]
 
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    user_id = _token_cache.get(token)
+    if user_id is None:
+        try:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        except JWTError:
+            raise HTTPException(status_code=403, detail="Invalid token")
         user_id = payload.get("sub")
         if user_id is None:
             raise HTTPException(status_code=401, detail="Invalid token payload")
-        user = await User.get(user_id)
-        if user is None:
-            raise HTTPException(status_code=404, detail="User not found")
-        
-        user_dict = user.dict()
-        user_dict["id"] = str(user.id)  # Convert ObjectId to string
-        user_dict.pop("hashed_password", None)  # Remove password from response
-        
-        return user_dict
-    except JWTError:
-        raise HTTPException(status_code=403, detail="Invalid token")
\ No newline at end of file
+
+        if AUTH_TRUST_TOKEN_CLAIMS:
+            principal = _principal_from_claims(payload, await _user_state(user_id))
+            if principal is not None:
+                if not principal["is_active"]:
+                    raise HTTPException(status_code=403, detail="Inactive user")
+                return principal
+
+        # Never cache a token past its own expiry
+        ttl = min(AUTH_PRINCIPAL_CACHE_TTL, payload.get("exp", 0) - time.time())
+        if ttl > 0:
+            _token_cache.set(token, user_id, ttl=ttl)
+
+    principal = await _load_principal(user_id)
+    if not principal.get("is_active", True):
+        raise HTTPException(status_code=403, detail="Inactive user")
+    return principal
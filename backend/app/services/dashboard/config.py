@@ -0,0 +1,10 @@
+# app/services/dashboard/config.py
+
+import os
+
+# Recent applications shown on the employer dashboard
+DASHBOARD_RECENT_APPLICATIONS = int(os.getenv("DASHBOARD_RECENT_APPLICATIONS", "5"))
+DASHBOARD_MAX_RECENT_APPLICATIONS = int(os.getenv("DASHBOARD_MAX_RECENT_APPLICATIONS", "50"))
+
+# A rebuild is stored only if no counter changed while it ran; it recounts up to this many times
+DASHBOARD_STATS_REBUILD_ATTEMPTS = int(os.getenv("DASHBOARD_STATS_REBUILD_ATTEMPTS", "3"))
@@ -0,0 +1,19 @@
+# app/services/dashboard/db/candidate_stats_crud.py
+
+from typing import Any, Dict
+
+from app.services.application.models.application import Application
+
+
+async def get_candidate_application_facets(candidate_id: str, recent_limit: int) -> Dict[str, Any]:
+    """Status breakdown and newest applications of a candidate in one aggregation"""
+    facets = {"by_status": [{"$group": {"_id": "$status", "count": {"$sum": 1}}}]}
+    if recent_limit > 0:
+        facets["recent"] = [
+            {"$sort": {"applied_at": -1}},
+            {"$limit": recent_limit},
+            {"$project": {"job_id": 1, "status": 1, "applied_at": 1, "updated_at": 1}},
+        ]
+    pipeline = [{"$match": {"candidate_id": candidate_id}}, {"$facet": facets}]
+    result = await Application.get_motor_collection().aggregate(pipeline).to_list(length=1)
+    return {"by_status": [], "recent": [], **(result[0] if result else {})}
@@ -0,0 +1,175 @@
+# app/services/dashboard/db/employer_stats_crud.py
+
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pymongo import ReturnDocument, UpdateOne
+
+from app.services.application.models.application import Application
+from app.services.auth_service.models.user import User
+from app.services.dashboard.config import DASHBOARD_STATS_REBUILD_ATTEMPTS
+from app.services.dashboard.models.dashboard import EmployerStats
+from app.services.job.models.job import Job
+
+
+def _status_key(status: str) -> str:
+    # Statuses become field names under applications_by_status
+    return str(status).replace(".", "_").replace("$", "_")
+
+
+async def _increment(employer_id: str, changes: Dict[str, int]):
+    await _increment_many({employer_id: changes})
+
+
+async def _increment_many(deltas: Dict[str, Dict[str, int]]):
+    """
+    Apply counter deltas per employer with one bulk_write. Employers without
+    a stats document are skipped: their first dashboard read rebuilds
+    everything from the source data. Each delta bumps the version, so a
+    rebuild running concurrently does not store counts that miss it.
+    """
+    now = datetime.utcnow()
+    operations = [
+        UpdateOne({"_id": employer_id}, {"$inc": {**changes, "version": 1}, "$set": {"updated_at": now}})
+        for employer_id, changes in deltas.items()
+        if any(changes.values())
+    ]
+    if operations:
+        await EmployerStats.get_motor_collection().bulk_write(operations, ordered=False)
+
+
+async def record_job_posted(employer_id: str):
+    await _increment(employer_id, {"job_posts": 1})
+
+
+async def record_jobs_posted(employer_ids: Iterable[str]):
+    await _increment_many({employer_id: {"job_posts": count} for employer_id, count in Counter(employer_ids).items()})
+
+
+async def record_application_submitted(employer_id: str, status: str):
+    await _increment(employer_id, {
+        "applications_total": 1,
+        f"applications_by_status.{_status_key(status)}": 1,
+    })
+
+
+async def record_status_changes(changes: Iterable[Tuple[str, str, str]]):
+    """Fold (employer_id, previous, current) changes into one $inc per employer"""
+    deltas: Dict[str, Counter] = defaultdict(Counter)
+    for employer_id, previous, current in changes:
+        if previous == current:
+            continue
+        deltas[employer_id][f"applications_by_status.{_status_key(previous)}"] -= 1
+        deltas[employer_id][f"applications_by_status.{_status_key(current)}"] += 1
+    await _increment_many(deltas)
+
+
+async def get_employer_stats(employer_id: str) -> Optional[EmployerStats]:
+    return await EmployerStats.get(employer_id)
+
+
+async def rebuild_employer_stats(employer_id: str) -> EmployerStats:
+    """
+    Recount an employer's totals from jobs and applications with one
+    aggregation ($unionWith + $facet) and store them as the new counters.
+
+    The stats document is created first, so deltas published while the
+    aggregation runs land on it and bump its version. The counts are only
+    stored if the version did not move; otherwise they may miss or double
+    count those deltas and the recount is repeated. When every attempt
+    raced, the last counts are returned unstored and the next read rebuilds.
+    """
+    collection = EmployerStats.get_motor_collection()
+    placeholder = EmployerStats(id=employer_id).model_dump(by_alias=True, exclude={"id"})
+    stats = None
+    for _ in range(DASHBOARD_STATS_REBUILD_ATTEMPTS):
+        current = await collection.find_one_and_update(
+            {"_id": employer_id},
+            {"$setOnInsert": placeholder},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        stats = await _count_employer_stats(employer_id, current.get("version", 0))
+        fields = stats.model_dump(by_alias=True, exclude={"id", "version"})
+        result = await collection.update_one({"_id": employer_id, "version": stats.version}, {"$set": fields})
+        if result.matched_count:
+            return stats
+    return stats
+
+
+async def _count_employer_stats(employer_id: str, version: int) -> EmployerStats:
+    pipeline = [
+        {"$match": {"employer_id": employer_id}},
+        {"$project": {"_id": 0, "kind": "job"}},
+        {"$unionWith": {
+            "coll": Application.get_collection_name(),
+            "pipeline": [
+                {"$match": {"employer_id": employer_id}},
+                {"$project": {"_id": 0, "kind": "application", "status": 1}},
+            ],
+        }},
+        {"$facet": {
+            "jobs": [{"$match": {"kind": "job"}}, {"$count": "count"}],
+            "applications": [
+                {"$match": {"kind": "application"}},
+                {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+            ],
+        }},
+    ]
+    result = await Job.get_motor_collection().aggregate(pipeline).to_list(length=1)
+    facets = result[0] if result else {"jobs": [], "applications": []}
+
+    by_status = {_status_key(row["_id"]): row["count"] for row in facets["applications"]}
+    now = datetime.utcnow()
+    stats = EmployerStats(
+        id=employer_id,
+        job_posts=facets["jobs"][0]["count"] if facets["jobs"] else 0,
+        applications_total=sum(by_status.values()),
+        applications_by_status=by_status,
+        version=version,
+        rebuilt_at=now,
+        updated_at=now,
+    )
+    return stats
+
+
+async def get_recent_applications(employer_id: str, limit: int) -> List[Dict[str, Any]]:
+    """Newest applications with job title and candidate name joined in by the server"""
+    if limit <= 0:
+        return []
+    pipeline = [
+        {"$match": {"employer_id": employer_id}},
+        {"$sort": {"applied_at": -1}},
+        {"$limit": limit},
+        {"$lookup": {
+            "from": Job.get_collection_name(),
+            "let": {"job_id": {"$convert": {"input": "$job_id", "to": "objectId", "onError": None}}},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$_id", "$$job_id"]}}},
+                {"$project": {"title": 1, "company": 1}},
+            ],
+            "as": "job",
+        }},
+        {"$lookup": {
+            "from": User.get_collection_name(),
+            "let": {"candidate_id": {"$convert": {"input": "$candidate_id", "to": "objectId", "onError": None}}},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$_id", "$$candidate_id"]}}},
+                {"$project": {"full_name": 1}},
+            ],
+            "as": "candidate",
+        }},
+        {"$project": {
+            "_id": 0,
+            "id": {"$toString": "$_id"},
+            "job_id": 1,
+            "candidate_id": 1,
+            "status": 1,
+            "applied_at": 1,
+            "job_title": {"$first": "$job.title"},
+            "company": {"$first": "$job.company"},
+            "candidate": {"$first": "$candidate.full_name"},
+        }},
+    ]
+    return await Application.get_motor_collection().aggregate(pipeline).to_list(length=limit)
@@ -0,0 +1,21 @@
+# app/services/dashboard/main.py
+
+from app.core.events import subscribe, unsubscribe
+from app.services.dashboard.services import employer_widgets
+
+EVENT_HANDLERS = {
+    "job.created": employer_widgets.on_job_created,
+    "job.created_many": employer_widgets.on_jobs_created,
+    "application.submitted": employer_widgets.on_application_submitted,
+    "application.status_changed_many": employer_widgets.on_application_status_changed_many,
+}
+
+
+async def startup():
+    for event, handler in EVENT_HANDLERS.items():
+        subscribe(event, handler)
+
+
+async def shutdown():
+    for event, handler in EVENT_HANDLERS.items():
+        unsubscribe(event, handler)
@@ -0,0 +1,23 @@
+# app/services/dashboard/models/dashboard.py
+
+from beanie import Document
+from pydantic import Field
+from typing import Dict, Optional
+from datetime import datetime
+
+class EmployerStats(Document):
+    """
+    Materialized per-employer dashboard counters, keyed by employer id.
+    Kept current by application/job events; rebuilt from the source
+    collections when missing or never rebuilt (rebuilt_at is None).
+    """
+    id: str
+    job_posts: int = 0
+    applications_total: int = 0
+    applications_by_status: Dict[str, int] = Field(default_factory=dict)
+    version: int = 0  # bumped by every increment; a rebuild only stores over the version it started from
+    rebuilt_at: Optional[datetime] = None
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+    class Settings:
+        name = "employer_stats"
@@ -1,12 +1,37 @@
 # app/services/dashboard/services/candidate_widgets.py
 
-async def get_candidate_summary():
+from app.services.dashboard.config import DASHBOARD_RECENT_APPLICATIONS
+from app.services.dashboard.db import candidate_stats_crud
+from app.services.job.db import job_crud
+
+INTERVIEW_STATUSES = ("interview", "interview_scheduled")
+
+async def get_candidate_summary(candidate_id: str, recent_limit: int = DASHBOARD_RECENT_APPLICATIONS):
+    """Two queries whatever the application count: one aggregation, one batched job fetch"""
+    facets = await candidate_stats_crud.get_candidate_application_facets(candidate_id, recent_limit)
+    by_status = {row["_id"]: row["count"] for row in facets["by_status"]}
+
+    recent = facets["recent"]
+    jobs = await job_crud.get_job_summaries([row["job_id"] for row in recent])
+
+    recent_applications = []
+    for row in recent:
+        job = jobs.get(row["job_id"], {})
+        recent_applications.append({
+            "id": str(row["_id"]),
+            "job_id": row["job_id"],
+            "job_title": job.get("title"),
+            "company": job.get("company"),
+            "location": job.get("location"),
+            "job_status": job.get("status"),
+            "status": row["status"],
+            "applied_at": row.get("applied_at"),
+            "updated_at": row.get("updated_at"),
+        })
+
     return {
-        "applications_submitted": 12,
-        "interviews_scheduled": 3,
-        "saved_jobs": 5,
-        "recommended_jobs": [
-            {"title": "Frontend Developer", "company": "Meta", "location": "Remote"},
-            {"title": "Data Scientist", "company": "Google", "location": "Bangalore"},
-        ]
+        "applications_submitted": sum(by_status.values()),
+        "interviews_scheduled": sum(by_status.get(status, 0) for status in INTERVIEW_STATUSES),
+        "applications_by_status": by_status,
+        "recent_applications": recent_applications,
     }
@@ -1,15 +1,38 @@
 # app/services/dashboard/services/employer_widgets.py
 
-async def get_employer_summary():
+from app.services.dashboard.config import DASHBOARD_RECENT_APPLICATIONS
+from app.services.dashboard.db import employer_stats_crud
+
+async def get_employer_summary(employer_id: str, recent_limit: int = DASHBOARD_RECENT_APPLICATIONS):
+    """Counters come from the materialized stats document, not from a scan"""
+    stats = await employer_stats_crud.get_employer_stats(employer_id)
+    if stats is None or stats.rebuilt_at is None:
+        stats = await employer_stats_crud.rebuild_employer_stats(employer_id)
+
     return {
-        "total_job_posts": 8,
-        "applications_received": 42,
-        "recent_applications": [
-            {"candidate": "John Doe", "job_title": "UX Designer", "status": "Pending"},
-            {"candidate": "Ayesha Khan", "job_title": "Backend Dev", "status": "Interview Scheduled"},
-        ],
-        "analytics": {
-            "job_views": 240,
-            "profile_visits": 98
-        }
+        "total_job_posts": stats.job_posts,
+        "applications_received": stats.applications_total,
+        "applications_by_status": {status: count for status, count in stats.applications_by_status.items() if count},
+        "recent_applications": await employer_stats_crud.get_recent_applications(employer_id, recent_limit),
+        "updated_at": stats.updated_at,
     }
+
+async def get_recent_applications(employer_id: str, limit: int = DASHBOARD_RECENT_APPLICATIONS):
+    return {"recent_applications": await employer_stats_crud.get_recent_applications(employer_id, limit)}
+
+# -- event handlers: keep the counters current --------------------------------
+
+async def on_job_created(job):
+    await employer_stats_crud.record_job_posted(job.employer_id)
+
+async def on_jobs_created(jobs: list):
+    await employer_stats_crud.record_jobs_posted(job.employer_id for job in jobs)
+
+async def on_application_submitted(application):
+    await employer_stats_crud.record_application_submitted(application.employer_id, application.status)
+
+async def on_application_status_changed_many(changes: list):
+    await employer_stats_crud.record_status_changes(
+        (change["application"].employer_id, change["previous_status"], change["application"].status)
+        for change in changes
+    )
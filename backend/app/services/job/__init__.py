@@ -1,3 +1,3 @@
-from .job_service import list_jobs, get_job, create_job, apply_to_job
+from .job_service import list_jobs, get_job, create_job, apply_to_job, bulk_create_jobs, update_job, close_job
 
-__all__ = ["list_jobs", "get_job", "create_job", "apply_to_job"]
\ No newline at end of file
+__all__ = ["list_jobs", "get_job", "create_job", "apply_to_job", "bulk_create_jobs", "update_job", "close_job"]
\ No newline at end of file
@@ -0,0 +1,15 @@
+# app/services/job/config.py
+
+import os
+
+# Bulk ingestion (POST /api/jobs/bulk)
+JOB_BULK_MAX_ROWS = int(os.getenv("JOB_BULK_MAX_ROWS", "50000"))
+JOB_BULK_BATCH_SIZE = int(os.getenv("JOB_BULK_BATCH_SIZE", "1000"))
+# Largest single row (an NDJSON line or one array element); bodies are streamed, never read whole
+JOB_BULK_MAX_ROW_BYTES = int(os.getenv("JOB_BULK_MAX_ROW_BYTES", str(1024 * 1024)))
+
+# Per-value counts returned by GET /api/jobs/?facets=true
+JOB_FACET_LIMIT = int(os.getenv("JOB_FACET_LIMIT", "20"))
+
+# Derived field backfill (python -m app.services.job.db.derived_fields_backfill)
+JOB_BACKFILL_BATCH_SIZE = int(os.getenv("JOB_BACKFILL_BATCH_SIZE", "1000"))
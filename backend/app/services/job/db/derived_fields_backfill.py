@@ -0,0 +1,71 @@
+# app/services/job/db/derived_fields_backfill.py
+"""
+Fill the derived job fields (parsed salary, normalised location and
+skills) of jobs created before they existed.
+
+    python -m app.services.job.db.derived_fields_backfill [--all]
+
+Walks the jobs collection in _id order, JOB_BACKFILL_BATCH_SIZE at a
+time, and writes each batch with one unordered bulk_write. Only jobs
+missing a derived field are touched, so an interrupted run simply resumes;
+--all recomputes every job (after a parser changed). updated_at is left
+alone, so in-process search indexes see the new fields on their next full
+load.
+"""
+import asyncio
+import sys
+from typing import Optional
+
+from pymongo import UpdateOne
+
+from app.services.job.config import JOB_BACKFILL_BATCH_SIZE
+from app.services.job.models.job import Job
+from app.services.job.utils.filters import filter_fields
+from app.services.job.utils.salary import salary_fields
+
+MISSING = {"$or": [
+    {"salary_period": {"$exists": False}},
+    {"location_normalized": {"$exists": False}},
+    {"skills_normalized": {"$exists": False}},
+]}
+
+
+def derived_fields(row: dict) -> dict:
+    return {
+        **salary_fields(row.get("salary")),
+        **filter_fields(row.get("location"), row.get("skills_required")),
+    }
+
+
+async def backfill_derived_fields(recompute: bool = False, batch_size: int = JOB_BACKFILL_BATCH_SIZE) -> int:
+    """Compute and store derived fields batch by batch; returns jobs updated"""
+    collection = Job.get_motor_collection()
+    base = {} if recompute else MISSING
+    last_id: Optional[object] = None
+    updated = 0
+    while True:
+        query = {**base, "_id": {"$gt": last_id}} if last_id is not None else base
+        rows = await collection.find(query, {"salary": 1, "location": 1, "skills_required": 1}) \
+            .sort("_id", 1).limit(batch_size).to_list(length=batch_size)
+        if not rows:
+            return updated
+        await collection.bulk_write(
+            [UpdateOne({"_id": row["_id"]}, {"$set": derived_fields(row)}) for row in rows],
+            ordered=False,
+        )
+        updated += len(rows)
+        last_id = rows[-1]["_id"]
+        print(f"{updated} jobs updated")
+
+
+async def main() -> int:
+    from app.core.db import init_db
+
+    await init_db()
+    updated = await backfill_derived_fields(recompute="--all" in sys.argv[1:])
+    print(f"Derived fields backfilled for {updated} jobs")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,26 @@
+# app/services/job/db/job_crud.py
+
+from typing import Any, Dict, Iterable
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+from app.core import raw_reads
+from app.services.job.models.job import Job
+
+# Compact job card embedded next to applications
+JOB_SUMMARY_FIELDS = ("title", "company", "location", "status", "employment_type", "remote")
+
+
+async def get_job_summaries(job_ids: Iterable[str], fields: Iterable[str] = JOB_SUMMARY_FIELDS) -> Dict[str, Dict[str, Any]]:
+    """Job id -> projected fields for many jobs with a single $in query"""
+    object_ids = []
+    for job_id in set(job_ids):
+        try:
+            object_ids.append(ObjectId(job_id))
+        except (InvalidId, TypeError):
+            continue
+    if not object_ids:
+        return {}
+    jobs = raw_reads.stream(Job, {"_id": {"$in": object_ids}}, fields=fields)
+    return {str(job["_id"]): job async for job in jobs}
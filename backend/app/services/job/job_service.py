@@ -1,32 +1,61 @@
-from typing import List
-from app.models.jobs import JobCreate, JobResponse
-from app.services.job.models.job import Job
+from typing import AsyncIterable, List, Optional, Union
+import asyncio
+from app.models.jobs import JobApply, JobCreate, JobResponse, JobUpdate, JobSummary, JobPage
+from app.services.job.models.job import Job, JobListView, JobStatus
+from app.services.job.serializers import to_job_page, to_job_response
+from app.services.job.config import JOB_BULK_BATCH_SIZE, JOB_BULK_MAX_ROWS, JOB_FACET_LIMIT
+from app.services.job.services.bulk_import import BulkBodyError
+from app.services.job.utils.filters import facet_pipeline, filter_fields, job_filter_query, read_facets
+from app.services.job.utils.salary import salary_fields
+from app.models.job import JobSearchFilter
+from app.services.application.models.application import ApplyForm
+from app.services.application.services import apply_handler
+from app.core.pagination import DEFAULT_PAGE_SIZE, encode_cursor, keyset_filter
+from app.core.events import publish
+from app.core import raw_reads
+from beanie import PydanticObjectId
 from datetime import datetime
 from fastapi import HTTPException
+from pydantic import ValidationError
+from pymongo.errors import BulkWriteError
+import json
 
-async def list_jobs() -> List[JobResponse]:
-    """Get all active jobs"""
-    jobs = await Job.find(Job.status == "active").to_list()
-    return [
-        JobResponse(
-            id=str(job.id),
-            title=job.title,
-            company=job.company,
-            location=job.location,
-            salary=job.salary,
-            description=job.description,
-            requirements=job.requirements,
-            employment_type=job.employment_type,
-            remote=job.remote,
-            status=job.status,
-            employer_id=job.employer_id,
-            skills_required=job.skills_required,
-            benefits=job.benefits,
-            application_deadline=job.application_deadline,
-            created_at=job.created_at,
-            updated_at=job.updated_at
-        ) for job in jobs
-    ]
+async def _job_rows(query: dict, sort: list, limit: int) -> list:
+    if raw_reads.raw_reads_enabled("list_jobs"):
+        return await raw_reads.find(Job, query, fields=JobSummary.model_fields, sort=sort, limit=limit)
+    return await Job.find(query).sort(sort).limit(limit).project(JobListView).to_list()
+
+async def _facet_counts(base: dict) -> dict:
+    result = await raw_reads.collection(Job).aggregate(facet_pipeline(base, JOB_FACET_LIMIT)).to_list(length=1)
+    return read_facets(result[0] if result else {})
+
+async def list_jobs(limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None,
+                    filters: Optional[JobSearchFilter] = None, facets: bool = False) -> JobPage:
+    """
+    Get one page of active jobs matching the filters, newest first. The
+    page is an indexed keyset find; with facets the per-value counts run
+    as a separate aggregation alongside it.
+    """
+    base = {"status": JobStatus.ACTIVE.value, **job_filter_query(filters)}
+    page_query = {**base, **keyset_filter("created_at", cursor)} if cursor else base
+    sort = [("created_at", -1), ("_id", -1)]
+    # Fetch one extra row to know whether another page exists
+    if facets:
+        rows, facet_counts = await asyncio.gather(_job_rows(page_query, sort, limit + 1), _facet_counts(base))
+    else:
+        rows, facet_counts = await _job_rows(page_query, sort, limit + 1), None
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        if isinstance(last, dict):
+            next_cursor = encode_cursor(last["created_at"], last["_id"])
+        else:
+            next_cursor = encode_cursor(last.created_at, last.id)
+
+    return to_job_page(rows, next_cursor, limit, facet_counts)
 
 async def get_job(job_id: str) -> JobResponse:
     """Get a specific job by ID"""
@@ -34,24 +63,7 @@ async def get_job(job_id: str) -> JobResponse:
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    return JobResponse(
-        id=str(job.id),
-        title=job.title,
-        company=job.company,
-        location=job.location,
-        salary=job.salary,
-        description=job.description,
-        requirements=job.requirements,
-        employment_type=job.employment_type,
-        remote=job.remote,
-        status=job.status,
-        employer_id=job.employer_id,
-        skills_required=job.skills_required,
-        benefits=job.benefits,
-        application_deadline=job.application_deadline,
-        created_at=job.created_at,
-        updated_at=job.updated_at
-    )
+    return to_job_response(job)
 
 async def create_job(job_create: JobCreate, employer_id: str) -> JobResponse:
     """Create a new job"""
@@ -60,6 +72,8 @@ async def create_job(job_create: JobCreate, employer_id: str) -> JobResponse:
         company=job_create.company,
         location=job_create.location,
         salary=job_create.salary,
+        **salary_fields(job_create.salary),
+        **filter_fields(job_create.location, job_create.skills_required),
         description=job_create.description,
         requirements=job_create.requirements,
         employment_type=job_create.employment_type,
@@ -71,60 +85,140 @@ async def create_job(job_create: JobCreate, employer_id: str) -> JobResponse:
     )
     
     await job.insert()
+    await publish("job.created", job)
     
-    return JobResponse(
-        id=str(job.id),
-        title=job.title,
-        company=job.company,
-        location=job.location,
-        salary=job.salary,
-        description=job.description,
-        requirements=job.requirements,
-        employment_type=job.employment_type,
-        remote=job.remote,
-        status=job.status,
-        employer_id=job.employer_id,
-        skills_required=job.skills_required,
-        benefits=job.benefits,
-        application_deadline=job.application_deadline,
-        created_at=job.created_at,
-        updated_at=job.updated_at
-    )
+    return to_job_response(job)
 
-async def get_employer_jobs(employer_id: str) -> List[JobResponse]:
-    """Get all jobs posted by a specific employer"""
-    jobs = await Job.find(Job.employer_id == employer_id).to_list()
-    return [
-        JobResponse(
-            id=str(job.id),
-            title=job.title,
-            company=job.company,
-            location=job.location,
-            salary=job.salary,
-            description=job.description,
-            requirements=job.requirements,
-            employment_type=job.employment_type,
-            remote=job.remote,
-            status=job.status,
-            employer_id=job.employer_id,
-            skills_required=job.skills_required,
-            benefits=job.benefits,
-            application_deadline=job.application_deadline,
-            created_at=job.created_at,
-            updated_at=job.updated_at
-        ) for job in jobs
-    ]
-
-async def apply_to_job(job_id: str, application_data: dict) -> dict:
-    """Apply to a specific job"""
+def status_event(previous: JobStatus, current: JobStatus) -> str:
+    """job.closed / job.reopened only on an actual transition, job.updated otherwise"""
+    if previous == JobStatus.ACTIVE and current == JobStatus.CLOSED:
+        return "job.closed"
+    if previous == JobStatus.CLOSED and current == JobStatus.ACTIVE:
+        return "job.reopened"
+    return "job.updated"
+
+async def update_job(job_id: str, job_update: JobUpdate, employer_id: str) -> JobResponse:
+    """Partially update a job owned by the employer"""
     job = await Job.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    
-    # In a real implementation, you'd save the application to database
-    # For now, just return a success response
-    return {
-        "message": "Application submitted successfully",
-        "job_id": job_id,
-        "application_id": f"app_{job_id}_{datetime.now().timestamp()}"
-    }
\ No newline at end of file
+    if job.employer_id != employer_id:
+        raise HTTPException(status_code=403, detail="Not authorized to update this job")
+
+    changes = job_update.model_dump(exclude_unset=True)
+    if "salary" in changes:
+        changes.update(salary_fields(changes["salary"]))
+    if "location" in changes or "skills_required" in changes:
+        changes.update(filter_fields(changes.get("location", job.location),
+                                     changes.get("skills_required", job.skills_required)))
+    if changes:
+        changes["updated_at"] = datetime.utcnow()
+        try:
+            updated = Job.model_validate({**job.model_dump(), **changes})
+        except ValidationError as e:
+            raise HTTPException(status_code=422, detail=e.errors(include_url=False, include_context=False))
+        previous_status = job.status
+        await job.set({field: getattr(updated, field) for field in changes})
+        await publish(status_event(previous_status, job.status), job)
+
+    return to_job_response(job)
+
+async def close_job(job_id: str, employer_id: str) -> dict:
+    """Close a job so it no longer appears in listings or search"""
+    job = await Job.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.employer_id != employer_id:
+        raise HTTPException(status_code=403, detail="Not authorized to close this job")
+
+    if job.status != JobStatus.CLOSED:
+        await job.set({"status": JobStatus.CLOSED, "updated_at": datetime.utcnow()})
+        await publish("job.closed", job)
+
+    return {"message": "Job closed", "job_id": job_id}
+
+async def bulk_create_jobs(rows: AsyncIterable[Union[dict, bytes]], employer_id: str) -> dict:
+    """
+    Validate rows as they arrive and write valid ones with unordered
+    insert_many batches. Returns one result per row, in input order; past
+    JOB_BULK_MAX_ROWS, or when the body cannot be read on (BulkBodyError),
+    reading stops and the response is marked truncated.
+    """
+    results: List[dict] = []
+    batch: List[tuple] = []  # (row index, Job)
+
+    async def flush():
+        if not batch:
+            return
+        failed = {}
+        try:
+            await Job.insert_many([job for _, job in batch], ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                failed[error["index"]] = error.get("errmsg", "Write failed")
+        created = []
+        for position, (index, job) in enumerate(batch):
+            if position in failed:
+                results[index] = {"index": index, "status": "failed", "error": failed[position]}
+            else:
+                results[index] = {"index": index, "status": "created", "id": str(job.id)}
+                created.append(job)
+        batch.clear()
+        if created:
+            # One event per batch: caches, indexes and counters fold it in one pass
+            await publish("job.created_many", created)
+
+    index = -1
+    truncated = False
+    try:
+        async for row in rows:
+            index += 1
+            if index >= JOB_BULK_MAX_ROWS:
+                # Earlier batches are already written: report them instead of failing the request
+                truncated = True
+                break
+            try:
+                data = json.loads(row) if isinstance(row, (bytes, str)) else row
+                job_create = JobCreate.model_validate(data)
+                job = Job(
+                    id=PydanticObjectId(),  # assigned up front so partial batch failures keep their ids
+                    **job_create.model_dump(exclude={"skills_required"}),
+                    skills_required=job_create.skills_required or [],
+                    **salary_fields(job_create.salary),
+                    **filter_fields(job_create.location, job_create.skills_required),
+                    employer_id=employer_id,
+                )
+            except ValidationError as e:
+                results.append({"index": index, "status": "invalid", "errors": e.errors(include_url=False, include_context=False)})
+                continue
+            except ValueError:
+                results.append({"index": index, "status": "invalid", "errors": [{"msg": "Invalid JSON"}]})
+                continue
+            results.append(None)  # filled in by flush()
+            batch.append((index, job))
+            if len(batch) >= JOB_BULK_BATCH_SIZE:
+                await flush()
+    except BulkBodyError as e:
+        # Earlier batches are already written: report where the body broke off
+        index += 1
+        results.append({"index": index, "status": "invalid", "errors": [{"msg": str(e)}]})
+        truncated = True
+    await flush()
+
+    counts = {"created": 0, "invalid": 0, "failed": 0}
+    for result in results:
+        counts[result["status"]] += 1
+    return {**counts, "truncated": truncated, "max_rows": JOB_BULK_MAX_ROWS, "results": results}
+
+async def get_employer_jobs(employer_id: str) -> List[JobResponse]:
+    """Get all jobs posted by a specific employer"""
+    if raw_reads.raw_reads_enabled("employer_jobs"):
+        jobs = raw_reads.stream(Job, {"employer_id": employer_id}, fields=JobResponse.model_fields)
+        return [to_job_response(job) async for job in jobs]
+    jobs = await Job.find(Job.employer_id == employer_id).to_list()
+    return [to_job_response(job) for job in jobs]
+
+async def apply_to_job(job_id: str, candidate_id: str, application: JobApply) -> dict:
+    """Apply to a specific job through the application service's write path"""
+    form = ApplyForm(job_id=job_id, **application.model_dump())
+    return await apply_handler.submit_application(candidate_id, form)
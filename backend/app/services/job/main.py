@@ -0,0 +1,18 @@
+# app/services/job/main.py
+
+from app.core.events import subscribe, unsubscribe
+from app.services.job.services import job_cache
+
+JOB_EVENTS = ("job.created", "job.updated", "job.closed", "job.reopened")
+
+
+async def startup():
+    for event in JOB_EVENTS:
+        subscribe(event, job_cache.on_job_changed)
+    subscribe("job.created_many", job_cache.on_jobs_created)
+
+
+async def shutdown():
+    for event in JOB_EVENTS:
+        unsubscribe(event, job_cache.on_job_changed)
+    unsubscribe("job.created_many", job_cache.on_jobs_created)
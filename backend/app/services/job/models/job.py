@@ -1,8 +1,9 @@
-from beanie import Document
-from pydantic import Field
+from beanie import Document, PydanticObjectId
+from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
+from pymongo import ASCENDING, DESCENDING, IndexModel
 
 class EmploymentType(str, Enum):
     FULL_TIME = "Full-time"
@@ -20,7 +21,15 @@ class Job(Document):
     title: str
     company: str
     location: str
+    location_normalized: Optional[str] = None  # utils/filters.py
     salary: str
+    # Parsed from salary by utils/salary.py; the annual_* pair drives range filters
+    salary_currency: Optional[str] = None
+    salary_period: Optional[str] = None
+    salary_min: Optional[float] = None
+    salary_max: Optional[float] = None
+    salary_annual_min: Optional[float] = None
+    salary_annual_max: Optional[float] = None
     description: str
     requirements: Optional[str] = None
     employment_type: EmploymentType = EmploymentType.FULL_TIME
@@ -28,6 +37,7 @@ class Job(Document):
     status: JobStatus = JobStatus.ACTIVE
     employer_id: str  # ID of the user who posted the job
     skills_required: Optional[List[str]] = []
+    skills_normalized: List[str] = []  # utils/filters.py
     benefits: Optional[str] = None
     application_deadline: Optional[datetime] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -35,6 +45,39 @@ class Job(Document):
 
     class Settings:
         name = "jobs"
+        indexes = [
+            # Public listing: status filter + keyset order (created_at, _id)
+            IndexModel(
+                [("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+                name="status_created_at",
+            ),
+            IndexModel(
+                [("employer_id", ASCENDING), ("created_at", DESCENDING)],
+                name="employer_created_at",
+            ),
+            # Job list filters (utils/filters.py): status plus the filtered field, then recency
+            IndexModel(
+                [("status", ASCENDING), ("employment_type", ASCENDING), ("remote", ASCENDING),
+                 ("created_at", DESCENDING), ("_id", DESCENDING)],
+                name="status_type_remote",
+            ),
+            IndexModel(
+                [("status", ASCENDING), ("location_normalized", ASCENDING), ("created_at", DESCENDING)],
+                name="status_location",
+            ),
+            # Multikey: one entry per skill
+            IndexModel(
+                [("status", ASCENDING), ("skills_normalized", ASCENDING), ("created_at", DESCENDING)],
+                name="status_skills",
+            ),
+            # Salary range filters on the annualised bounds
+            IndexModel(
+                [("status", ASCENDING), ("salary_annual_max", DESCENDING), ("salary_annual_min", ASCENDING)],
+                name="status_salary",
+            ),
+            # Incremental refresh of in-process search indexes
+            IndexModel([("updated_at", ASCENDING)], name="updated_at"),
+        ]
 
     model_config = {
         "json_schema_extra": {
@@ -52,3 +95,20 @@ class Job(Document):
             }
         }
     }
+
+
+class JobListView(BaseModel):
+    """Projection used by list endpoints; leaves out the large text fields"""
+    id: PydanticObjectId = Field(alias="_id")
+    title: str
+    company: str
+    location: str
+    salary: str
+    employment_type: EmploymentType = EmploymentType.FULL_TIME
+    remote: bool = False
+    status: JobStatus = JobStatus.ACTIVE
+    employer_id: str
+    skills_required: Optional[List[str]] = []
+    application_deadline: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
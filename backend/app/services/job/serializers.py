@@ -0,0 +1,66 @@
+# app/services/job/serializers.py
+"""
+The one place jobs are turned into API payloads.
+
+Sources are trusted database data (Beanie documents, projections or raw
+Motor dicts), so response models are built with model_construct instead of
+being validated again, and routes hand the encoded bytes straight to the
+client so FastAPI's response_model check does not run a third pass.
+Route response_model declarations are kept for the OpenAPI schema.
+"""
+from typing import Any, Iterable, List, Mapping, Optional, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+from app.models.jobs import FacetCount, JobFacets, JobPage, JobResponse, JobSummary
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_job_adapter = TypeAdapter(JobResponse)
+_jobs_adapter = TypeAdapter(List[JobResponse])
+_page_adapter = TypeAdapter(JobPage)
+
+
+def _construct(model: Type[ModelT], source: Any) -> ModelT:
+    """Copy the model's fields from a document/projection or a raw Mongo dict"""
+    raw = isinstance(source, Mapping)
+    values = {}
+    for name in model.model_fields:
+        if name == "id":
+            value = source["_id"] if raw else source.id
+            values["id"] = str(value)
+            continue
+        value = source.get(name, ...) if raw else getattr(source, name, ...)
+        if value is not ...:
+            values[name] = getattr(value, "value", value)  # enums -> plain strings
+    return model.model_construct(**values)
+
+
+def to_job_response(source: Any) -> JobResponse:
+    return _construct(JobResponse, source)
+
+
+def to_job_summary(source: Any) -> JobSummary:
+    return _construct(JobSummary, source)
+
+
+def to_job_page(rows: Iterable[Any], next_cursor: Optional[str], limit: int,
+                facets: Optional[dict] = None) -> JobPage:
+    if facets is not None:
+        facets = JobFacets.model_construct(**{
+            name: [FacetCount.model_construct(**count) for count in counts] for name, counts in facets.items()
+        })
+    return JobPage.model_construct(items=[to_job_summary(row) for row in rows], next_cursor=next_cursor,
+                                   limit=limit, facets=facets)
+
+
+def encode_job(job: JobResponse) -> bytes:
+    return _job_adapter.dump_json(job)
+
+
+def encode_jobs(jobs: List[JobResponse]) -> bytes:
+    return _jobs_adapter.dump_json(jobs)
+
+
+def encode_job_page(page: JobPage) -> bytes:
+    return _page_adapter.dump_json(page)
@@ -0,0 +1,114 @@
+# app/services/job/services/bulk_import.py
+"""
+Request bodies of POST /api/jobs/bulk, read as a stream of rows.
+
+NDJSON (one job per line) is the streaming format: each line is handed on
+as soon as it arrives. A JSON array is decoded incrementally too, one
+element at a time, so neither format holds the whole body in memory. A row
+larger than JOB_BULK_MAX_ROW_BYTES, or a body that breaks off mid-array,
+stops the stream with a BulkBodyError; the rows before it are kept.
+"""
+import codecs
+import json
+from typing import AsyncIterator, Union
+
+from fastapi import HTTPException, Request
+
+from app.services.job.config import JOB_BULK_MAX_ROW_BYTES
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+WHITESPACE = " \t\r\n"
+
+
+class BulkBodyError(ValueError):
+    """The body cannot be read past this point"""
+
+
+def _too_large() -> BulkBodyError:
+    return BulkBodyError(f"Row is larger than {JOB_BULK_MAX_ROW_BYTES} bytes or not valid JSON")
+
+
+async def iter_ndjson(request: Request) -> AsyncIterator[bytes]:
+    """Yield one raw line per row as the body streams in"""
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if len(line) > JOB_BULK_MAX_ROW_BYTES:
+                raise _too_large()
+            if line.strip():
+                yield line
+        if len(buffer) > JOB_BULK_MAX_ROW_BYTES:
+            raise _too_large()
+    if buffer.strip():
+        yield buffer
+
+
+async def iter_json_array(request: Request) -> AsyncIterator[Union[dict, bytes]]:
+    """Yield the elements of a JSON array body one at a time as it streams in"""
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8")()
+    stream = request.stream().__aiter__()
+    buffer, position, eof = "", 0, False
+    state = "start"  # start -> first (after "[") -> after (a value) -> value (after ",")
+
+    async def fill():
+        nonlocal buffer, position, eof
+        try:
+            chunk = await stream.__anext__()
+        except StopAsyncIteration:
+            chunk, eof = b"", True
+        try:
+            buffer = buffer[position:] + text.decode(chunk, final=eof)
+        except UnicodeDecodeError:
+            raise BulkBodyError("Body is not valid UTF-8")
+        position = 0
+
+    while True:
+        while position < len(buffer) and buffer[position] in WHITESPACE:
+            position += 1
+        if position == len(buffer):
+            if not eof:
+                await fill()
+                continue
+            if state == "start":
+                raise HTTPException(status_code=400, detail="Expected a JSON array of jobs")
+            raise BulkBodyError("Body ended before the closing ]")
+        char = buffer[position]
+        if state == "start":
+            # Nothing has been written yet: a body that is not an array is a plain 400
+            if char != "[":
+                raise HTTPException(status_code=400, detail="Expected a JSON array of jobs")
+            position, state = position + 1, "first"
+            continue
+        if char == "]" and state in ("first", "after"):
+            return
+        if state == "after":
+            if char != ",":
+                raise BulkBodyError("Expected , or ] after a row")
+            position, state = position + 1, "value"
+            continue
+        try:
+            row, end = decoder.raw_decode(buffer, position)
+        except ValueError:
+            # Usually a row split across chunks: read on, up to the row size limit
+            if eof or len(buffer) - position > JOB_BULK_MAX_ROW_BYTES:
+                raise _too_large()
+            await fill()
+            continue
+        if end == len(buffer) and not eof:
+            await fill()  # a bare number could continue in the next chunk
+            continue
+        position, state = end, "after"
+        yield row
+
+
+def iter_rows(request: Request) -> AsyncIterator[Union[dict, bytes]]:
+    """Rows from an NDJSON or JSON array body, picked by Content-Type"""
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in NDJSON_CONTENT_TYPES:
+        return iter_ndjson(request)
+    if content_type in ("application/json", ""):
+        return iter_json_array(request)
+    raise HTTPException(status_code=415, detail="Use application/json or application/x-ndjson")
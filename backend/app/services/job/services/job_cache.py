@@ -0,0 +1,28 @@
+# app/services/job/services/job_cache.py
+
+from app.core.response_cache import ResponseCache
+
+LIST_NAMESPACE = "jobs:list"
+DETAIL_NAMESPACE = "jobs:detail"
+
+# Encoded bodies of GET /api/jobs/ pages and GET /api/jobs/{job_id}
+job_cache = ResponseCache()
+
+
+def list_key(limit: int, cursor: str = None, **filters) -> str:
+    key = f"{limit}:{cursor or ''}"
+    for name, value in sorted(filters.items()):
+        if value is not None:
+            key += f":{name}={value}"
+    return key
+
+
+async def on_job_changed(job):
+    """Write paths publish job events; any change can reorder or empty listing pages"""
+    await job_cache.invalidate(LIST_NAMESPACE)
+    await job_cache.invalidate(DETAIL_NAMESPACE, str(job.id))
+
+
+async def on_jobs_created(jobs):
+    """A bulk import: new ids have no cached detail, so one listing invalidation covers the batch"""
+    await job_cache.invalidate(LIST_NAMESPACE)
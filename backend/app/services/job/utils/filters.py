@@ -0,0 +1,107 @@
+# app/services/job/utils/filters.py
+"""
+Server-side filtering for the public job list.
+
+Jobs carry normalised copies of location and skills_required
+(location_normalized, skills_normalized) so filters are exact or
+left-anchored matches that the status_* compound indexes can serve;
+skills_normalized is an array, which makes its index multikey.
+"""
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.models.job import JobSearchFilter
+from app.services.job.utils.salary import salary_range_query
+
+NORMALIZE_RE = re.compile(r"[^a-z0-9+#]+")
+
+# Facet name -> field grouped on (list facets are unwound first)
+FACET_FIELDS = {
+    "employment_type": "employment_type",
+    "remote": "remote",
+    "location": "location_normalized",
+    "skills": "skills_normalized",
+}
+LIST_FACETS = ("skills",)
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """Lowercase with punctuation collapsed to spaces ("San Francisco, CA" -> "san francisco ca")"""
+    return NORMALIZE_RE.sub(" ", (value or "").lower()).strip()
+
+
+def normalize_skills(skills: Optional[Iterable[str]]) -> List[str]:
+    seen: Dict[str, None] = {}
+    for skill in skills or []:
+        for part in skill.split(","):
+            key = normalize_text(part)
+            if key:
+                seen.setdefault(key)
+    return list(seen)
+
+
+def filter_fields(location: Optional[str], skills: Optional[Iterable[str]]) -> Dict[str, Any]:
+    """Normalised fields stored on a Job next to location and skills_required"""
+    return {
+        "location_normalized": normalize_text(location) or None,
+        "skills_normalized": normalize_skills(skills),
+    }
+
+
+def _contains(value: str) -> Dict[str, Any]:
+    return {"$regex": re.escape(value.strip()), "$options": "i"}
+
+
+def job_filter_query(filters: Optional[JobSearchFilter]) -> Dict[str, Any]:
+    """Mongo filter for every JobSearchFilter field that is set"""
+    if filters is None:
+        return {}
+    query: Dict[str, Any] = {}
+    if filters.employment_type is not None:
+        query["employment_type"] = getattr(filters.employment_type, "value", filters.employment_type)
+    if filters.remote is not None:
+        query["remote"] = filters.remote
+    location = normalize_text(filters.location)
+    if location:
+        # Left-anchored, so the index bounds it: "san" matches "san francisco ca"
+        query["location_normalized"] = {"$regex": "^" + re.escape(location)}
+    skills = normalize_skills(filters.skills)
+    if skills:
+        query["skills_normalized"] = {"$all": skills}
+    # Free-text fields: residual filters over what the indexed ones selected
+    if filters.title and filters.title.strip():
+        query["title"] = _contains(filters.title)
+    if filters.company and filters.company.strip():
+        query["company"] = _contains(filters.company)
+    query.update(salary_range_query(filters.salary_min, filters.salary_max, filters.salary_currency))
+    return query
+
+
+def facet_pipeline(query: Dict[str, Any], limit: int) -> List[dict]:
+    """
+    Aggregation counting jobs per facet value, most common first. Each facet
+    ignores its own filter (picking "Full-time" still counts the other
+    types): the leading $match holds only what every facet shares, so it
+    can use an index, and each sub-pipeline adds the other facets' filters.
+    """
+    facet_filters = {field: query[field] for field in FACET_FIELDS.values() if field in query}
+    shared = {key: value for key, value in query.items() if key not in facet_filters}
+    stages = {}
+    for name, field in FACET_FIELDS.items():
+        others = {key: value for key, value in facet_filters.items() if key != field}
+        pipeline: List[dict] = [{"$match": others}] if others else []
+        if name in LIST_FACETS:
+            pipeline.append({"$unwind": f"${field}"})
+        pipeline += [
+            {"$match": {field: {"$ne": None}}},
+            {"$group": {"_id": f"${field}", "count": {"$sum": 1}}},
+            {"$sort": {"count": -1, "_id": 1}},
+            {"$limit": limit},
+        ]
+        stages[name] = pipeline
+    return [{"$match": shared}, {"$facet": stages}]
+
+
+def read_facets(result: Dict[str, List[dict]]) -> Dict[str, List[dict]]:
+    return {name: [{"value": row["_id"], "count": row["count"]} for row in result.get(name, [])]
+            for name in FACET_FIELDS}
@@ -0,0 +1,198 @@
+# app/services/job/utils/salary.py
+"""
+Normalises free-form salary strings ("$120,000 - $150,000", "£45k",
+"€30-35/hour", "Up to 90k EUR", "10-15 LPA") into currency, min, max and period, plus
+the range annualised so jobs paid per hour and per year can be compared.
+Only figures next to a currency, a suffix, a pay period or another figure
+of a range are amounts, so "2023 graduates, $80k" is 80k; a string that is
+nothing but a number ("85000") is taken as it is.
+"""
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+CURRENCY_SYMBOLS = {"$": "USD", "€": "EUR", "£": "GBP", "₹": "INR", "¥": "JPY"}
+CURRENCY_CODES = {"USD", "EUR", "GBP", "INR", "JPY", "CAD", "AUD", "CHF", "SEK", "NOK", "DKK", "PLN", "SGD", "NZD", "PKR", "AED"}
+DEFAULT_CURRENCY = "USD"
+
+PERIOD_PATTERNS = (
+    ("hour", re.compile(r"\b(?:per\s+hour|hourly|hr|hour|ph)\b|/\s*h\b")),
+    ("day", re.compile(r"\b(?:per\s+day|daily|day)\b|/\s*d\b")),
+    ("week", re.compile(r"\b(?:per\s+week|weekly|week|wk)\b")),
+    ("month", re.compile(r"\b(?:per\s+month|monthly|month|mo|mth)\b")),
+    ("year", re.compile(r"\b(?:per\s+(?:year|annum)|annual(?:ly)?|year|yr|l?p\.?a\.?)\b")),
+)
+# Working-time multipliers used to annualise a rate
+PERIODS_PER_YEAR = {"hour": 2080, "day": 260, "week": 52, "month": 12, "year": 1}
+
+# Amount suffixes; lakh and crore ("12 LPA": 12 lakh per annum) are Indian and imply INR
+MULTIPLIERS = {"k": 1_000, "m": 1_000_000, "l": 100_000, "cr": 10_000_000}
+INR_SUFFIXES = {"l", "cr"}
+SUFFIX_RE = r"k|m|lpa|lakhs?|lacs?|l|crores?|cr"
+
+# 120,000 | 120.000 | 120 000 | 12,00,000 | 120k | 1.5m | 45.50 | 12 LPA | 1.2 cr
+GROUPED_RE = r"\d{1,3}(?:,\d{2})*(?:[,.\s]\d{3})+"
+AMOUNT_RE = re.compile(rf"({GROUPED_RE}|\d+(?:\.\d+)?)\s*({SUFFIX_RE})?(?![a-z])", re.IGNORECASE)
+# What makes a figure an amount: a currency before or after it, a range, or a pay period after it
+_CURRENCY = "|".join([*(re.escape(symbol) for symbol in CURRENCY_SYMBOLS), *(rf"\b{code}\b" for code in sorted(CURRENCY_CODES))])
+CURRENCY_BEFORE_RE = re.compile(rf"(?:{_CURRENCY})\s*$", re.IGNORECASE)
+CURRENCY_AFTER_RE = re.compile(rf"\s*(?:{_CURRENCY})", re.IGNORECASE)
+RANGE_RE = re.compile(rf"\s*(?:{_CURRENCY})?\s*(?:-|–|—|to)\s*(?:{_CURRENCY})?\s*", re.IGNORECASE)
+RATE_AFTER_RE = re.compile(
+    r"\s*(?:/\s*[a-z]|per\b|an?\s+(?:hour|day|week|month|year)\b|(?:hourly|daily|weekly|monthly|annual(?:ly)?|p\.?a\.?)\b)",
+    re.IGNORECASE,
+)
+UPPER_BOUND_RE = re.compile(r"\b(?:up\s+to|max(?:imum)?|under)\b", re.IGNORECASE)
+
+# Job fields written from a parsed salary
+SALARY_FIELDS = ("salary_currency", "salary_period", "salary_min", "salary_max", "salary_annual_min", "salary_annual_max")
+
+
+class ParsedSalary(NamedTuple):
+    currency: str
+    min: Optional[float]
+    max: Optional[float]
+    period: str
+
+    def annual(self, value: Optional[float]) -> Optional[float]:
+        return None if value is None else round(value * PERIODS_PER_YEAR[self.period], 2)
+
+
+def _unit(suffix: Optional[str]) -> Optional[str]:
+    """Canonical suffix: "LPA", "lakhs" and "lac" are "l", "crore" is "cr"; "K" is "k"."""
+    if not suffix:
+        return None
+    suffix = suffix.lower()
+    if suffix.startswith("cr"):
+        return "cr"
+    return "l" if suffix.startswith("l") else suffix
+
+
+def _amount(digits: str, suffix: Optional[str]) -> float:
+    if re.fullmatch(GROUPED_RE, digits):
+        value = float(re.sub(r"[,.\s]", "", digits))
+    else:
+        value = float(digits)
+    if suffix:
+        value *= MULTIPLIERS[_unit(suffix)]
+    return value
+
+
+def _currency(text: str, default: str = DEFAULT_CURRENCY) -> str:
+    for code in re.findall(r"\b[A-Z]{3}\b", text.upper()):
+        if code in CURRENCY_CODES:
+            return code
+    for symbol, code in CURRENCY_SYMBOLS.items():
+        if symbol in text:
+            return code
+    return default
+
+
+def _period(text: str, largest: float) -> str:
+    lowered = text.lower()
+    for period, pattern in PERIOD_PATTERNS:
+        if pattern.search(lowered):
+            return period
+    # No unit given: small numbers are hourly rates, large ones yearly salaries
+    return "hour" if largest < 500 else "year"
+
+
+def _amount_matches(text: str) -> List[Tuple[str, str]]:
+    """(digits, suffix) of the figures that are amounts, in order"""
+    matches = list(AMOUNT_RE.finditer(text))
+    if len(matches) == 1 and matches[0].group(0).strip() == text.strip():
+        return [matches[0].groups()]  # a bare figure: "85000"
+    amounts = []
+    for index, match in enumerate(matches):
+        ranged = (
+            (index > 0 and RANGE_RE.fullmatch(text, matches[index - 1].end(), match.start()))
+            or (index + 1 < len(matches) and RANGE_RE.fullmatch(text, match.end(), matches[index + 1].start()))
+        )
+        after = text[match.end():]
+        if (match.group(2) or ranged or CURRENCY_BEFORE_RE.search(text, 0, match.start())
+                or CURRENCY_AFTER_RE.match(after) or RATE_AFTER_RE.match(after)):
+            amounts.append(match.groups())
+    return amounts
+
+
+def parse_salary(text: Optional[str]) -> Optional[ParsedSalary]:
+    """Parse a salary string; None when it holds no amount ("Competitive")"""
+    if not text:
+        return None
+    matches = _amount_matches(text)
+    if not matches:
+        return None
+    amounts = [_amount(digits, suffix) for digits, suffix in matches[:2]]
+    # "120-150k": a suffix on the upper bound applies to the lower one too
+    if len(matches) == 2 and matches[1][1] and not matches[0][1] and amounts[0] < 1000:
+        amounts[0] = _amount(matches[0][0], matches[1][1])
+    low, high = min(amounts), max(amounts)
+    if len(amounts) == 1 and UPPER_BOUND_RE.search(text):
+        low = None
+    elif len(amounts) == 1 and not re.search(r"\b(?:from|min(?:imum)?|starting)\b|\+", text, re.IGNORECASE):
+        low = high  # a single figure is a fixed salary
+    elif len(amounts) == 1:
+        high = None
+    indian = any(_unit(suffix) in INR_SUFFIXES for _, suffix in matches[:2])
+    return ParsedSalary(_currency(text, "INR" if indian else DEFAULT_CURRENCY), low, high, _period(text, max(amounts)))
+
+
+def salary_fields(text: Optional[str]) -> Dict[str, Any]:
+    """Structured salary fields for a Job; all None when the string cannot be parsed"""
+    parsed = parse_salary(text)
+    if parsed is None:
+        return {field: None for field in SALARY_FIELDS}
+    return {
+        "salary_currency": parsed.currency,
+        "salary_period": parsed.period,
+        "salary_min": parsed.min,
+        "salary_max": parsed.max,
+        "salary_annual_min": parsed.annual(parsed.min),
+        "salary_annual_max": parsed.annual(parsed.max),
+    }
+
+
+def salary_range_query(salary_min: Optional[float] = None, salary_max: Optional[float] = None,
+                       currency: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Mongo filter for jobs whose annual range overlaps [salary_min, salary_max].
+    Open-ended ranges (no max / no min) match on their known bound. Bounds
+    are in `currency`, DEFAULT_CURRENCY when none is given: amounts in
+    different currencies are never compared.
+    """
+    query: Dict[str, Any] = {}
+    if not currency and (salary_min is not None or salary_max is not None):
+        currency = DEFAULT_CURRENCY
+    if currency:
+        query["salary_currency"] = currency.upper()
+    bounds = []
+    if salary_min is not None:
+        bounds.append({"$or": [
+            {"salary_annual_max": {"$gte": salary_min}},
+            {"salary_annual_max": None, "salary_annual_min": {"$gte": salary_min}},
+        ]})
+    if salary_max is not None:
+        bounds.append({"$or": [
+            {"salary_annual_min": {"$lte": salary_max}},
+            {"salary_annual_min": None, "salary_annual_max": {"$lte": salary_max}},
+        ]})
+    if bounds:
+        query["$and"] = bounds
+    return query
+
+
+def salary_in_range(fields: Dict[str, Any], salary_min: Optional[float] = None,
+                    salary_max: Optional[float] = None, currency: Optional[str] = None) -> bool:
+    """In-memory twin of salary_range_query for documents already loaded"""
+    if salary_min is None and salary_max is None and not currency:
+        return True
+    currency = currency or DEFAULT_CURRENCY
+    if currency and fields.get("salary_currency") != currency.upper():
+        return False
+    low, high = fields.get("salary_annual_min"), fields.get("salary_annual_max")
+    if low is None and high is None:
+        return False
+    if salary_min is not None and (high if high is not None else low) < salary_min:
+        return False
+    if salary_max is not None and (low if low is not None else high) > salary_max:
+        return False
+    return True
@@ -0,0 +1,14 @@
+# app/services/localization/config.py
+
+import os
+
+# ✅ Locales served from ./locales; missing keys fall back to the default locale
+LOCALIZATION_DEFAULT_LOCALE = os.getenv("LOCALIZATION_DEFAULT_LOCALE", "en")
+LOCALIZATION_LOCALES = [
+    locale.strip().lower() for locale in os.getenv("LOCALIZATION_LOCALES", "en,fr,hi").split(",") if locale.strip()
+]
+
+# Emails of the accounts allowed to edit translation overrides
+LOCALIZATION_EDITORS = {
+    email.strip().lower() for email in os.getenv("LOCALIZATION_EDITORS", "").split(",") if email.strip()
+}
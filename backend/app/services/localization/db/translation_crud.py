@@ -0,0 +1,26 @@
+# app/services/localization/db/translation_crud.py
+
+from datetime import datetime
+from typing import Dict, List, Optional
+from app.core import raw_reads
+from app.services.localization.models.translation import Translation
+
+async def get_overrides(locale: str) -> Dict[str, str]:
+    """key -> value of every override stored for a locale"""
+    docs = raw_reads.stream(Translation, {"locale": locale}, fields=("key", "value"))
+    return {doc["key"]: doc["value"] async for doc in docs}
+
+async def list_overrides(locale: str) -> List[dict]:
+    docs = raw_reads.stream(Translation, {"locale": locale}, fields=("key", "value", "updated_by", "updated_at"), sort=[("key", 1)])
+    return [raw_reads.with_str_id(doc) async for doc in docs]
+
+async def set_override(locale: str, key: str, value: str, updated_by: Optional[str] = None):
+    await raw_reads.collection(Translation).update_one(
+        {"locale": locale, "key": key},
+        {"$set": {"value": value, "updated_by": updated_by, "updated_at": datetime.utcnow()}},
+        upsert=True,
+    )
+
+async def delete_override(locale: str, key: str) -> bool:
+    result = await raw_reads.collection(Translation).delete_one({"locale": locale, "key": key})
+    return result.deleted_count > 0
@@ -0,0 +1,12 @@
+# app/services/localization/main.py
+
+from app.core.events import subscribe, unsubscribe
+from app.services.localization.services.translation_loader import TRANSLATION_CHANGED, translator
+
+
+async def startup():
+    subscribe(TRANSLATION_CHANGED, translator.on_translation_changed)
+
+
+async def shutdown():
+    unsubscribe(TRANSLATION_CHANGED, translator.on_translation_changed)
@@ -0,0 +1,21 @@
+# app/services/localization/models/translation.py
+
+from beanie import Document
+from pydantic import Field
+from typing import Optional
+from datetime import datetime
+from pymongo import ASCENDING, IndexModel
+
+class Translation(Document):
+    """A stored override of one catalog string, e.g. ("fr", "jobs.apply")"""
+    locale: str
+    key: str  # dotted path into the locale JSON
+    value: str
+    updated_by: Optional[str] = None
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+    class Settings:
+        name = "translations"
+        indexes = [
+            IndexModel([("locale", ASCENDING), ("key", ASCENDING)], name="locale_key", unique=True),
+        ]
@@ -0,0 +1,54 @@
+# app/services/localization/routes/localitzation_routes.py
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from pydantic import BaseModel, Field
+from app.core.response_cache import etag_matches
+from app.services.auth_service.services.jwt_handler import get_current_user
+from app.services.localization.config import LOCALIZATION_EDITORS
+from app.services.localization.db import translation_crud
+from app.services.localization.services.translation_loader import translator
+
+router = APIRouter()
+
+class OverrideForm(BaseModel):
+    value: str = Field(..., min_length=1, max_length=2000)
+
+def require_editor(user=Depends(get_current_user)):
+    if not user or user.get("email", "").lower() not in LOCALIZATION_EDITORS:
+        raise HTTPException(status_code=403, detail="Only translation editors can change overrides.")
+    return user
+
+# GET /api/localization
+@router.get("")
+async def get_locales():
+    """Supported locales and which ones this worker has compiled"""
+    return translator.stats()
+
+# GET /api/localization/{locale}
+@router.get("/{locale}")
+async def get_bundle(locale: str, request: Request):
+    """Flat key -> string bundle; revalidated with If-None-Match instead of re-downloaded"""
+    catalog = await translator.catalog(locale)
+    headers = {"ETag": catalog.etag, "Cache-Control": "no-cache", "Content-Language": catalog.locale}
+    if etag_matches(request, catalog.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=catalog.bundle, media_type="application/json", headers=headers)
+
+# GET /api/localization/{locale}/overrides
+@router.get("/{locale}/overrides")
+async def get_overrides(locale: str, user=Depends(require_editor)):
+    return await translation_crud.list_overrides(translator.resolve(locale))
+
+# PUT /api/localization/{locale}/overrides/{key}
+@router.put("/{locale}/overrides/{key}")
+async def set_override(locale: str, key: str, form: OverrideForm, user=Depends(require_editor)):
+    await translator.set_override(locale, key, form.value, updated_by=user["id"])
+    catalog = await translator.catalog(locale)
+    return {"message": "Translation updated.", "locale": catalog.locale, "key": key, "etag": catalog.etag}
+
+# DELETE /api/localization/{locale}/overrides/{key}
+@router.delete("/{locale}/overrides/{key}")
+async def delete_override(locale: str, key: str, user=Depends(require_editor)):
+    if not await translator.delete_override(locale, key):
+        raise HTTPException(status_code=404, detail="No override for this key.")
+    return {"message": "Override removed.", "locale": locale, "key": key}
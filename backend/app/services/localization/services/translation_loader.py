@@ -0,0 +1,194 @@
+# app/services/localization/services/translation_loader.py
+"""
+In-memory translation catalogs.
+
+A locale is compiled on first use: the default locale's catalog, then the
+locale's JSON file (nested objects flattened to dotted keys), then its DB
+overrides. Every string gets a precompiled formatter for its {{name}}
+placeholders and the catalog is serialised once into an ETag'd bundle for
+the frontend, so a request pays a dict lookup. A "translation.changed"
+event drops the catalogs it affects; the next use recompiles them.
+"""
+import asyncio
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from fastapi import HTTPException
+
+from app.core.events import publish
+from app.services.localization.config import LOCALIZATION_DEFAULT_LOCALE, LOCALIZATION_LOCALES
+from app.services.localization.db import translation_crud
+
+LOCALES_DIR = Path(__file__).parent.parent / "locales"
+PLACEHOLDER_RE = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+
+TRANSLATION_CHANGED = "translation.changed"
+
+
+def flatten(tree: Dict[str, Any], prefix: str = "") -> Dict[str, str]:
+    """{"jobs": {"apply": "Apply"}} -> {"jobs.apply": "Apply"}"""
+    flat = {}
+    for key, value in tree.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{path}."))
+        else:
+            flat[path] = str(value)
+    return flat
+
+
+class Message:
+    """One catalog string split into literal parts and placeholder slots"""
+    __slots__ = ("text", "_parts", "_slots")
+
+    def __init__(self, text: str):
+        self.text = text
+        parts, slots, position = [], [], 0
+        for match in PLACEHOLDER_RE.finditer(text):
+            parts.append(text[position:match.start()])
+            slots.append((len(parts), match.group(1)))
+            parts.append(match.group(0))  # kept when no value is given
+            position = match.end()
+        parts.append(text[position:])
+        self._parts = parts
+        self._slots = tuple(slots)
+
+    def format(self, values: Dict[str, Any]) -> str:
+        if not self._slots:
+            return self.text
+        parts = self._parts.copy()
+        for index, name in self._slots:
+            if name in values:
+                parts[index] = str(values[name])
+        return "".join(parts)
+
+
+class Catalog:
+    __slots__ = ("locale", "messages", "bundle", "etag", "_compiled")
+
+    def __init__(self, locale: str, messages: Dict[str, str]):
+        self.locale = locale
+        self.messages = messages
+        self._compiled = {key: Message(text) for key, text in messages.items()}
+        self.bundle = json.dumps(
+            {"locale": locale, "messages": messages}, ensure_ascii=False, sort_keys=True, separators=(",", ":"),
+        ).encode()
+        self.etag = f'"{hashlib.sha1(self.bundle).hexdigest()[:20]}"'
+
+    def t(self, key: str, /, **values) -> str:
+        """Translated string; the key itself when the catalog has no entry"""
+        message = self._compiled.get(key)
+        if message is None:
+            return key
+        return message.format(values)
+
+
+class TranslationLoader:
+    def __init__(self, directory: Path = LOCALES_DIR, locales: Iterable[str] = LOCALIZATION_LOCALES,
+                 default_locale: str = LOCALIZATION_DEFAULT_LOCALE):
+        self.directory = directory
+        self.default_locale = default_locale.lower()
+        self.locales = list(dict.fromkeys([self.default_locale, *locales]))
+        self.compiles = 0
+        self._files: Dict[str, Dict[str, str]] = {}
+        self._catalogs: Dict[str, Catalog] = {}
+        self._loading: Dict[str, asyncio.Task] = {}
+        # Bumped by invalidate(); a compile that started before it is not cached
+        self._generation = 0
+
+    def resolve(self, locale: Optional[str]) -> str:
+        """Supported locale for a request: "fr-CA" -> "fr", unknown -> default"""
+        if locale:
+            locale = locale.strip().lower().replace("_", "-")
+            for candidate in (locale, locale.split("-")[0]):
+                if candidate in self.locales:
+                    return candidate
+        return self.default_locale
+
+    def _file(self, locale: str) -> Dict[str, str]:
+        flat = self._files.get(locale)
+        if flat is None:
+            path = self.directory / f"{locale}.json"
+            text = path.read_text(encoding="utf-8") if path.is_file() else ""
+            flat = self._files[locale] = flatten(json.loads(text)) if text.strip() else {}
+        return flat
+
+    def keys(self) -> Iterable[str]:
+        """Keys that can be translated: those of the default locale's file"""
+        return self._file(self.default_locale).keys()
+
+    async def _compile(self, locale: str) -> Catalog:
+        generation = self._generation
+        if locale == self.default_locale:
+            messages = dict(self._file(locale))
+        else:
+            messages = dict((await self.catalog(self.default_locale)).messages)
+            messages.update(self._file(locale))
+        messages.update(await translation_crud.get_overrides(locale))
+        catalog = Catalog(locale, messages)
+        self.compiles += 1
+        if generation == self._generation:
+            self._catalogs[locale] = catalog
+        return catalog
+
+    async def catalog(self, locale: Optional[str] = None) -> Catalog:
+        """Compiled catalog, built on first use; concurrent first uses share one compile"""
+        locale = self.resolve(locale)
+        catalog = self._catalogs.get(locale)
+        if catalog is not None:
+            return catalog
+        task = self._loading.get(locale)
+        if task is None:
+            task = self._loading[locale] = asyncio.ensure_future(self._compile(locale))
+            task.add_done_callback(lambda done: self._loading.pop(locale, None) if self._loading.get(locale) is done else None)
+        return await asyncio.shield(task)
+
+    async def translate(self, locale: Optional[str], key: str, /, **values) -> str:
+        return (await self.catalog(locale)).t(key, **values)
+
+    def invalidate(self, locale: Optional[str] = None):
+        """Forget compiled catalogs; the default locale's changes reach every locale"""
+        self._generation += 1
+        if locale is None or self.resolve(locale) == self.default_locale:
+            self._catalogs.clear()
+            self._loading.clear()
+        else:
+            self._catalogs.pop(self.resolve(locale), None)
+            self._loading.pop(self.resolve(locale), None)
+
+    def on_translation_changed(self, payload: Dict[str, Any]):
+        self.invalidate(payload.get("locale"))
+
+    def _check(self, locale: str, key: str) -> str:
+        locale = locale.lower()
+        if locale not in self.locales:
+            raise HTTPException(status_code=404, detail=f"Unsupported locale: {locale}")
+        if key not in self.keys():
+            raise HTTPException(status_code=404, detail=f"Unknown translation key: {key}")
+        return locale
+
+    async def set_override(self, locale: str, key: str, value: str, updated_by: Optional[str] = None):
+        locale = self._check(locale, key)
+        await translation_crud.set_override(locale, key, value, updated_by)
+        await publish(TRANSLATION_CHANGED, {"locale": locale, "key": key})
+
+    async def delete_override(self, locale: str, key: str) -> bool:
+        locale = self._check(locale, key)
+        deleted = await translation_crud.delete_override(locale, key)
+        if deleted:
+            await publish(TRANSLATION_CHANGED, {"locale": locale, "key": key})
+        return deleted
+
+    def stats(self) -> dict:
+        return {
+            "default": self.default_locale,
+            "locales": self.locales,
+            "loaded": {locale: catalog.etag for locale, catalog in self._catalogs.items()},
+            "compiles": self.compiles,
+        }
+
+
+translator = TranslationLoader()
@@ -0,0 +1,38 @@
+# app/services/notifications/config.py
+
+import os
+
+NOTIFICATIONS_ENABLED = os.getenv("NOTIFICATIONS_ENABLED", "true").lower() == "true"
+NOTIFICATIONS_FROM = os.getenv("NOTIFICATIONS_FROM", "Nadaen <no-reply@nadaen.local>")
+NOTIFICATIONS_APP_URL = os.getenv("NOTIFICATIONS_APP_URL", "http://localhost:5173")
+
+# ✅ Templates: compiled once at startup; auto-reload re-reads a file when its mtime changes (development)
+NOTIFICATIONS_DEFAULT_LOCALE = os.getenv("NOTIFICATIONS_DEFAULT_LOCALE", "en")
+NOTIFICATIONS_TEMPLATE_AUTO_RELOAD = os.getenv("NOTIFICATIONS_TEMPLATE_AUTO_RELOAD", "false").lower() == "true"
+
+# ✅ Delivery provider: file | smtp
+NOTIFICATIONS_PROVIDER = os.getenv("NOTIFICATIONS_PROVIDER", "file")
+NOTIFICATIONS_FILE_SINK_DIR = os.getenv("NOTIFICATIONS_FILE_SINK_DIR", "data/mail")
+NOTIFICATIONS_SMTP_HOST = os.getenv("NOTIFICATIONS_SMTP_HOST", "localhost")
+NOTIFICATIONS_SMTP_PORT = int(os.getenv("NOTIFICATIONS_SMTP_PORT", "1025"))
+NOTIFICATIONS_SMTP_USERNAME = os.getenv("NOTIFICATIONS_SMTP_USERNAME")
+NOTIFICATIONS_SMTP_PASSWORD = os.getenv("NOTIFICATIONS_SMTP_PASSWORD")
+NOTIFICATIONS_SMTP_STARTTLS = os.getenv("NOTIFICATIONS_SMTP_STARTTLS", "false").lower() == "true"
+NOTIFICATIONS_SMTP_TIMEOUT_SECONDS = float(os.getenv("NOTIFICATIONS_SMTP_TIMEOUT_SECONDS", "10"))
+
+# Emails of the accounts allowed to read the outbox stats
+NOTIFICATIONS_ADMINS = {
+    email.strip().lower() for email in os.getenv("NOTIFICATIONS_ADMINS", "").split(",") if email.strip()
+}
+
+# ✅ Outbox: write messages in the domain write's transaction (needs a replica set). On a standalone
+# server startup logs an error and falls back to plain writes: a crash between the two writes loses the message.
+OUTBOX_USE_TRANSACTIONS = os.getenv("OUTBOX_USE_TRANSACTIONS", "true").lower() == "true"
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "100"))
+OUTBOX_CONCURRENCY = int(os.getenv("OUTBOX_CONCURRENCY", "10"))
+OUTBOX_POLL_INTERVAL_SECONDS = float(os.getenv("OUTBOX_POLL_INTERVAL_SECONDS", "2"))
+OUTBOX_LEASE_SECONDS = float(os.getenv("OUTBOX_LEASE_SECONDS", "120"))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "6"))
+OUTBOX_RETRY_BASE_SECONDS = float(os.getenv("OUTBOX_RETRY_BASE_SECONDS", "5"))
+OUTBOX_RETRY_MAX_SECONDS = float(os.getenv("OUTBOX_RETRY_MAX_SECONDS", "900"))
+OUTBOX_SENT_RETENTION_DAYS = int(os.getenv("OUTBOX_SENT_RETENTION_DAYS", "7"))
@@ -0,0 +1,53 @@
+# app/services/notifications/event_handlers/application_events.py
+"""application.submitted -> "new application" email to the job's employer"""
+from typing import Any, Dict, List, Optional
+
+from app.services.notifications.config import NOTIFICATIONS_APP_URL
+from app.services.notifications.models.email_payload import EmailPayload
+from app.services.notifications.services.template_engine import engine
+
+EVENT = "application.submitted"
+TEMPLATE = "application_received"
+
+
+def outbox_payload(application) -> Dict[str, Any]:
+    """What the outbox keeps: ids only, so the write path needs no extra reads"""
+    return {
+        "application_id": str(application.id),
+        "job_id": application.job_id,
+        "candidate_id": application.candidate_id,
+        "employer_id": application.employer_id,
+        "applied_at": application.applied_at,
+    }
+
+
+def _prepare(payload: Dict[str, Any], users: Dict[str, dict], jobs: Dict[str, dict]) -> Optional[Dict[str, Any]]:
+    employer = users.get(payload["employer_id"])
+    if not employer:
+        return None  # account removed: nothing to send
+    candidate = users.get(payload["candidate_id"], {})
+    job = jobs.get(payload["job_id"], {})
+    return {
+        "to": employer["email"],
+        "locale": employer.get("locale"),
+        "employer_name": employer.get("full_name") or employer["email"],
+        "candidate_name": candidate.get("full_name") or "A candidate",
+        "job_title": job.get("title", "your job"),
+        "company": job.get("company", ""),
+        "applied_at": f"{payload['applied_at']:%d %b %Y}",
+    }
+
+
+def render_batch(payloads: List[Dict[str, Any]], users: Dict[str, dict],
+                 jobs: Dict[str, dict]) -> List[Optional[EmailPayload]]:
+    """One email (or None) per payload; subjects and bodies are rendered in a single pass"""
+    prepared = [_prepare(payload, users, jobs) for payload in payloads]
+    emails = iter(engine.render_emails(
+        TEMPLATE,
+        [(values["locale"], values) for values in prepared if values],
+        shared={"inbox_url": f"{NOTIFICATIONS_APP_URL}/dashboard"},
+    ))
+    return [
+        None if values is None else EmailPayload(to=values["to"], **next(emails))
+        for values in prepared
+    ]
@@ -0,0 +1,55 @@
+# app/services/notifications/event_handlers/status_events.py
+"""application.status_changed -> "your application was updated" email to the candidate"""
+from typing import Any, Dict, List, Optional
+
+from app.services.notifications.config import NOTIFICATIONS_APP_URL
+from app.services.notifications.models.email_payload import EmailPayload
+from app.services.notifications.services.template_engine import engine
+
+EVENT = "application.status_changed"
+TEMPLATE = "status_update"
+
+
+def outbox_payload(application, previous_status: str) -> Dict[str, Any]:
+    return {
+        "application_id": str(application.id),
+        "job_id": application.job_id,
+        "candidate_id": application.candidate_id,
+        "employer_id": application.employer_id,
+        "status": application.status,
+        "previous_status": previous_status,
+    }
+
+
+def status_label(status: str) -> str:
+    return status.replace("_", " ")
+
+
+def _prepare(payload: Dict[str, Any], users: Dict[str, dict], jobs: Dict[str, dict]) -> Optional[Dict[str, Any]]:
+    candidate = users.get(payload["candidate_id"])
+    if not candidate:
+        return None
+    job = jobs.get(payload["job_id"], {})
+    return {
+        "to": candidate["email"],
+        "locale": candidate.get("locale"),
+        "candidate_name": candidate.get("full_name") or candidate["email"],
+        "job_title": job.get("title", "a job"),
+        "company": job.get("company", ""),
+        "status_label": status_label(payload["status"]),
+    }
+
+
+def render_batch(payloads: List[Dict[str, Any]], users: Dict[str, dict],
+                 jobs: Dict[str, dict]) -> List[Optional[EmailPayload]]:
+    """One email (or None) per payload; a bulk status change renders in a single pass"""
+    prepared = [_prepare(payload, users, jobs) for payload in payloads]
+    emails = iter(engine.render_emails(
+        TEMPLATE,
+        [(values["locale"], values) for values in prepared if values],
+        shared={"applications_url": f"{NOTIFICATIONS_APP_URL}/dashboard"},
+    ))
+    return [
+        None if values is None else EmailPayload(to=values["to"], **next(emails))
+        for values in prepared
+    ]
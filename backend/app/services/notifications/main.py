@@ -0,0 +1,15 @@
+# app/services/notifications/main.py
+
+from app.services.notifications.services import outbox
+from app.services.notifications.services.email_dispatcher import dispatcher
+from app.services.notifications.services.template_engine import engine
+
+
+async def startup():
+    await outbox.check_transactions()
+    engine.load()
+    dispatcher.start()
+
+
+async def shutdown():
+    await dispatcher.stop()
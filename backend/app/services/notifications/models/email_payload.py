@@ -0,0 +1,11 @@
+# app/services/notifications/models/email_payload.py
+
+from pydantic import BaseModel
+from typing import Optional
+
+class EmailPayload(BaseModel):
+    """One rendered email, ready for a provider"""
+    to: str
+    subject: str
+    html: str
+    text: Optional[str] = None
@@ -0,0 +1,42 @@
+# app/services/notifications/models/outbox.py
+
+from beanie import Document
+from pydantic import Field
+from typing import Any, Dict, Optional
+from datetime import datetime
+from enum import Enum
+from pymongo import ASCENDING, IndexModel
+from app.services.notifications.config import OUTBOX_SENT_RETENTION_DAYS
+
+class OutboxStatus(str, Enum):
+    PENDING = "pending"
+    SENDING = "sending"  # claimed by a dispatcher until locked_until
+    SENT = "sent"
+    FAILED = "failed"  # gave up after OUTBOX_MAX_ATTEMPTS
+
+class OutboxMessage(Document):
+    event: str  # e.g. "application.submitted"
+    payload: Dict[str, Any] = {}  # ids only; recipients and content are resolved when sending
+    status: OutboxStatus = OutboxStatus.PENDING
+    attempts: int = 0
+    next_attempt_at: datetime = Field(default_factory=datetime.utcnow)
+    claimed_by: Optional[str] = None
+    locked_until: Optional[datetime] = None
+    last_error: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    sent_at: Optional[datetime] = None
+
+    class Settings:
+        name = "notification_outbox"
+        indexes = [
+            # Dispatcher claims: due pending messages and expired leases
+            IndexModel([("status", ASCENDING), ("next_attempt_at", ASCENDING)], name="status_next_attempt"),
+            IndexModel([("status", ASCENDING), ("locked_until", ASCENDING)], name="status_locked_until"),
+            IndexModel([("claimed_by", ASCENDING)], name="claimed_by", sparse=True),
+            # Delivered messages are removed after the retention period
+            IndexModel(
+                [("sent_at", ASCENDING)],
+                name="sent_at_ttl",
+                expireAfterSeconds=OUTBOX_SENT_RETENTION_DAYS * 86400,
+            ),
+        ]
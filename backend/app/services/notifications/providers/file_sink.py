@@ -0,0 +1,34 @@
+# app/services/notifications/providers/file_sink.py
+"""Writes each email as an .eml file; for local development and tests"""
+import asyncio
+import uuid
+from datetime import datetime
+from email.message import EmailMessage
+from pathlib import Path
+
+from app.services.notifications.config import NOTIFICATIONS_FILE_SINK_DIR, NOTIFICATIONS_FROM
+from app.services.notifications.models.email_payload import EmailPayload
+
+
+def build_message(email: EmailPayload, sender: str = NOTIFICATIONS_FROM) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = sender
+    message["To"] = email.to
+    message["Subject"] = email.subject
+    message.set_content(email.text or "This message is best viewed as HTML.")
+    message.add_alternative(email.html, subtype="html")
+    return message
+
+
+class FileSinkProvider:
+    def __init__(self, directory: str = NOTIFICATIONS_FILE_SINK_DIR):
+        self.directory = Path(directory)
+
+    def _write(self, email: EmailPayload) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{datetime.utcnow():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}.eml"
+        path.write_bytes(bytes(build_message(email)))
+        return path
+
+    async def send(self, email: EmailPayload):
+        await asyncio.to_thread(self._write, email)
@@ -0,0 +1,41 @@
+# app/services/notifications/providers/smtp_client.py
+"""
+SMTP delivery with the standard library, run in a worker thread. Defaults
+point at a local catcher such as MailHog/Mailpit on localhost:1025.
+"""
+import asyncio
+import smtplib
+
+from app.services.notifications.config import (
+    NOTIFICATIONS_SMTP_HOST,
+    NOTIFICATIONS_SMTP_PASSWORD,
+    NOTIFICATIONS_SMTP_PORT,
+    NOTIFICATIONS_SMTP_STARTTLS,
+    NOTIFICATIONS_SMTP_TIMEOUT_SECONDS,
+    NOTIFICATIONS_SMTP_USERNAME,
+)
+from app.services.notifications.models.email_payload import EmailPayload
+from app.services.notifications.providers.file_sink import build_message
+
+
+class SmtpProvider:
+    def __init__(self, host: str = NOTIFICATIONS_SMTP_HOST, port: int = NOTIFICATIONS_SMTP_PORT,
+                 username: str = NOTIFICATIONS_SMTP_USERNAME, password: str = NOTIFICATIONS_SMTP_PASSWORD,
+                 starttls: bool = NOTIFICATIONS_SMTP_STARTTLS, timeout: float = NOTIFICATIONS_SMTP_TIMEOUT_SECONDS):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+
+    def _send(self, email: EmailPayload):
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as client:
+            if self.starttls:
+                client.starttls()
+            if self.username:
+                client.login(self.username, self.password or "")
+            client.send_message(build_message(email))
+
+    async def send(self, email: EmailPayload):
+        await asyncio.to_thread(self._send, email)
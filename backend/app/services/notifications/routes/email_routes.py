@@ -0,0 +1,29 @@
+# app/services/notifications/routes/email_routes.py
+
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException
+from app.core.raw_reads import collection
+from app.services.auth_service.services.jwt_handler import get_current_user
+from app.services.notifications.config import NOTIFICATIONS_ADMINS
+from app.services.notifications.models.outbox import OutboxMessage, OutboxStatus
+from app.services.notifications.services.email_dispatcher import dispatcher
+from app.services.notifications.services.template_engine import engine
+
+router = APIRouter()
+
+def require_admin(user=Depends(get_current_user)):
+    if not user or user.get("email", "").lower() not in NOTIFICATIONS_ADMINS:
+        raise HTTPException(status_code=403, detail="Only notification admins can read the outbox.")
+    return user
+
+@router.get("/outbox")
+async def get_outbox_stats(user=Depends(require_admin)):
+    """Outbox depth per status, this worker's delivery counters and compiled templates"""
+    # One count per status, each answered from the status_* indexes
+    outbox = collection(OutboxMessage)
+    counts = await asyncio.gather(*(outbox.count_documents({"status": status.value}) for status in OutboxStatus))
+    return {
+        "messages": {status.value: count for status, count in zip(OutboxStatus, counts)},
+        "dispatcher": dispatcher.stats(),
+        "templates": engine.stats(),
+    }
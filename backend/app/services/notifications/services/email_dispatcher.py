@@ -0,0 +1,266 @@
+# app/services/notifications/services/email_dispatcher.py
+"""
+Background delivery of outbox messages.
+
+Each pass claims up to OUTBOX_BATCH_SIZE due messages (a lease that other
+workers respect until it expires), loads every user and job the batch
+mentions with one $in each, renders the emails one event type at a time
+(a single render_many pass per template) and sends them with at most
+OUTBOX_CONCURRENCY deliveries in flight. Outcomes are written back with one
+bulk_write: sent, or rescheduled with exponential backoff and jitter until
+OUTBOX_MAX_ATTEMPTS, after which the message is marked failed.
+"""
+import asyncio
+import logging
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Union
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import UpdateOne
+
+from app.core import raw_reads
+from app.services.auth_service.models.user import User
+from app.services.job.db import job_crud
+from app.services.notifications.config import (
+    NOTIFICATIONS_ENABLED,
+    NOTIFICATIONS_PROVIDER,
+    OUTBOX_BATCH_SIZE,
+    OUTBOX_CONCURRENCY,
+    OUTBOX_LEASE_SECONDS,
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_POLL_INTERVAL_SECONDS,
+    OUTBOX_RETRY_BASE_SECONDS,
+    OUTBOX_RETRY_MAX_SECONDS,
+)
+from app.services.notifications.event_handlers import application_events, status_events
+from app.services.notifications.models.email_payload import EmailPayload
+from app.services.notifications.models.outbox import OutboxMessage, OutboxStatus
+from app.services.notifications.providers.file_sink import FileSinkProvider
+from app.services.notifications.providers.smtp_client import SmtpProvider
+from app.services.notifications.services import outbox
+
+logger = logging.getLogger(__name__)
+
+# Provider name -> factory; other transports register themselves here
+EMAIL_PROVIDERS: Dict[str, Callable[[], object]] = {
+    "file": FileSinkProvider,
+    "smtp": SmtpProvider,
+}
+
+# Outbox event -> renderer(payloads, users, jobs) returning an EmailPayload or None per payload
+EVENT_RENDERERS = {
+    application_events.EVENT: application_events.render_batch,
+    status_events.EVENT: status_events.render_batch,
+}
+
+USER_ID_FIELDS = ("candidate_id", "employer_id")
+
+
+def register_email_provider(name: str, factory: Callable[[], object]):
+    EMAIL_PROVIDERS[name] = factory
+
+
+def retry_delay(attempts: int) -> float:
+    """Backoff after the given number of failed attempts, with jitter"""
+    delay = min(OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1), OUTBOX_RETRY_MAX_SECONDS)
+    return delay * random.uniform(0.5, 1.0)
+
+
+class EmailDispatcher:
+    def __init__(self, provider_name: str = NOTIFICATIONS_PROVIDER, batch_size: int = OUTBOX_BATCH_SIZE,
+                 concurrency: int = OUTBOX_CONCURRENCY, interval: float = OUTBOX_POLL_INTERVAL_SECONDS,
+                 enabled: bool = NOTIFICATIONS_ENABLED):
+        self.provider_name = provider_name
+        self.provider = None
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.interval = interval
+        self.enabled = enabled
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+        self.skipped = 0
+        self.last_batch_ms: Optional[float] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def notify(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    # -- one pass --------------------------------------------------------------
+
+    async def _claim(self) -> List[dict]:
+        now = datetime.utcnow()
+        token = uuid.uuid4().hex
+        due = {"$or": [
+            {"status": OutboxStatus.PENDING.value, "next_attempt_at": {"$lte": now}},
+            {"status": OutboxStatus.SENDING.value, "locked_until": {"$lt": now}},  # lease of a crashed worker
+        ]}
+        collection = raw_reads.collection(OutboxMessage)
+        ids = [doc["_id"] async for doc in
+               collection.find(due, {"_id": 1}).sort("next_attempt_at", 1).limit(self.batch_size)]
+        if not ids:
+            return []
+        await collection.update_many(
+            {"_id": {"$in": ids}, **due},
+            {"$set": {
+                "status": OutboxStatus.SENDING.value,
+                "claimed_by": token,
+                "locked_until": now + timedelta(seconds=OUTBOX_LEASE_SECONDS),
+            }},
+        )
+        return await collection.find({"claimed_by": token, "status": OutboxStatus.SENDING.value}).to_list(length=None)
+
+    async def _lookups(self, messages: List[dict]):
+        user_ids, job_ids = set(), set()
+        for message in messages:
+            payload = message.get("payload", {})
+            user_ids.update(payload[field] for field in USER_ID_FIELDS if payload.get(field))
+            if payload.get("job_id"):
+                job_ids.add(payload["job_id"])
+        object_ids = []
+        for user_id in user_ids:
+            try:
+                object_ids.append(ObjectId(user_id))
+            except (InvalidId, TypeError):
+                continue
+        users = {}
+        if object_ids:
+            docs = raw_reads.stream(User, {"_id": {"$in": object_ids}}, fields=("email", "full_name", "locale"))
+            users = {str(doc["_id"]): doc async for doc in docs}
+        jobs = await job_crud.get_job_summaries(job_ids, fields=("title", "company"))
+        return users, jobs
+
+    def _render(self, messages: List[dict], users: Dict[str, dict],
+                jobs: Dict[str, dict]) -> List[Union[EmailPayload, str, None]]:
+        """Per message: the email, None when there is nothing to send, or an error string"""
+        by_event: Dict[str, List[int]] = {}
+        for position, message in enumerate(messages):
+            by_event.setdefault(message["event"], []).append(position)
+        rendered: List[Union[EmailPayload, str, None]] = [None] * len(messages)
+        for event, positions in by_event.items():
+            renderer = EVENT_RENDERERS.get(event)
+            if renderer is None:
+                outcomes = [f"No renderer for {event}"] * len(positions)
+            else:
+                try:
+                    outcomes = renderer([messages[i].get("payload", {}) for i in positions], users, jobs)
+                except Exception as e:
+                    logger.warning("Rendering %d %s emails failed: %s", len(positions), event, e)
+                    outcomes = [f"{type(e).__name__}: {e}"] * len(positions)
+            for position, outcome in zip(positions, outcomes):
+                rendered[position] = outcome
+        return rendered
+
+    async def _deliver(self, message: dict, email: Union[EmailPayload, str, None],
+                       limit: asyncio.Semaphore) -> Optional[str]:
+        """None when delivered (or nothing to send), else the error"""
+        if isinstance(email, str):
+            return email
+        if email is None:
+            self.skipped += 1
+            return None
+        try:
+            async with limit:
+                await self.provider.send(email)
+            return None
+        except Exception as e:
+            logger.warning("Delivery of outbox message %s failed: %s", message["_id"], e)
+            return f"{type(e).__name__}: {e}"
+
+    async def dispatch_once(self) -> int:
+        """Claim and deliver one batch; returns messages processed"""
+        if self.provider is None:
+            self.provider = EMAIL_PROVIDERS[self.provider_name]()
+        messages = await self._claim()
+        if not messages:
+            return 0
+        started = time.perf_counter()
+        users, jobs = await self._lookups(messages)
+        emails = self._render(messages, users, jobs)
+        limit = asyncio.Semaphore(self.concurrency)
+        errors = await asyncio.gather(*(self._deliver(message, email, limit) for message, email in zip(messages, emails)))
+
+        now = datetime.utcnow()
+        operations = []
+        for message, error in zip(messages, errors):
+            claim = {"_id": message["_id"], "claimed_by": message["claimed_by"]}
+            release = {"claimed_by": "", "locked_until": ""}
+            if error is None:
+                self.sent += 1
+                operations.append(UpdateOne(claim, {
+                    "$set": {"status": OutboxStatus.SENT.value, "sent_at": now, "last_error": None},
+                    "$unset": release,
+                }))
+                continue
+            attempts = message.get("attempts", 0) + 1
+            if attempts >= OUTBOX_MAX_ATTEMPTS:
+                self.failed += 1
+                update = {"status": OutboxStatus.FAILED.value}
+            else:
+                self.retried += 1
+                update = {
+                    "status": OutboxStatus.PENDING.value,
+                    "next_attempt_at": now + timedelta(seconds=retry_delay(attempts)),
+                }
+            operations.append(UpdateOne(claim, {
+                "$set": {**update, "attempts": attempts, "last_error": error[:500]},
+                "$unset": release,
+            }))
+        await raw_reads.collection(OutboxMessage).bulk_write(operations, ordered=False)
+        self.last_batch_ms = round((time.perf_counter() - started) * 1000, 3)
+        return len(messages)
+
+    # -- background task -------------------------------------------------------
+
+    async def run(self):
+        self._wakeup = asyncio.Event()
+        while True:
+            try:
+                processed = await self.dispatch_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Outbox dispatch failed")
+                processed = 0
+            if processed >= self.batch_size:
+                continue  # backlog: keep draining
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def start(self):
+        if self.enabled and self._task is None:
+            outbox.on_enqueued(self.notify)
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        outbox.remove_listener(self.notify)
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "provider": self.provider_name,
+            "sent": self.sent,
+            "retried": self.retried,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "last_batch_ms": self.last_batch_ms,
+        }
+
+
+dispatcher = EmailDispatcher()
@@ -0,0 +1,86 @@
+# app/services/notifications/services/outbox.py
+"""
+Transactional outbox for notifications.
+
+Write paths open a unit of work and enqueue their messages inside it. With
+OUTBOX_USE_TRANSACTIONS the domain write and the outbox insert share one
+MongoDB transaction, so a message exists exactly when the change it
+announces was committed. Transactions need a replica set: on a standalone
+server (or with OUTBOX_USE_TRANSACTIONS=false) startup logs an error and
+the insert directly follows the domain write, so a crash in between loses
+the message. With NOTIFICATIONS_ENABLED=false no transaction is opened.
+Delivery happens later in email_dispatcher, never in the request.
+"""
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, Iterable, List
+
+from app.services.notifications.config import NOTIFICATIONS_ENABLED, OUTBOX_USE_TRANSACTIONS
+from app.services.notifications.models.outbox import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+# Turned off at startup when the server cannot run transactions
+_use_transactions = NOTIFICATIONS_ENABLED and OUTBOX_USE_TRANSACTIONS
+
+# Called after messages were committed (the dispatcher wakes up early)
+_listeners: List[Callable[[], Any]] = []
+
+
+def on_enqueued(listener: Callable[[], Any]):
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def remove_listener(listener: Callable[[], Any]):
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def _notify():
+    for listener in _listeners:
+        listener()
+
+
+async def check_transactions():
+    """Fall back to plain writes, loudly, when the server is standalone"""
+    global _use_transactions
+    if not NOTIFICATIONS_ENABLED:
+        return
+    if not OUTBOX_USE_TRANSACTIONS:
+        logger.warning("OUTBOX_USE_TRANSACTIONS is off: notifications can be lost if a write path crashes")
+        return
+    from app.core import db as core_db
+
+    hello = await core_db.db.command("hello")
+    if "setName" not in hello and hello.get("msg") != "isdbgrid":
+        _use_transactions = False
+        logger.error(
+            "MongoDB is a standalone server, so the notification outbox cannot use transactions: "
+            "notifications can be lost if a write path crashes. Run a replica set (see MONGODB_URL in app/core/db.py)."
+        )
+
+
+@asynccontextmanager
+async def unit_of_work():
+    """Yields the session to pass to every write (None without transactions)"""
+    if not _use_transactions:
+        yield None
+        _notify()
+        return
+    from app.core import db as core_db
+
+    async with await core_db.client.start_session() as session:
+        async with session.start_transaction():
+            yield session
+    _notify()
+
+
+async def enqueue(event: str, payloads: Iterable[Dict[str, Any]], session=None) -> int:
+    if not NOTIFICATIONS_ENABLED:
+        return 0
+    messages = [OutboxMessage(event=event, payload=payload) for payload in payloads]
+    if not messages:
+        return 0
+    await OutboxMessage.insert_many(messages, session=session)
+    return len(messages)
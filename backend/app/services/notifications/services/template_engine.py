@@ -0,0 +1,217 @@
+# app/services/notifications/services/template_engine.py
+"""
+Compiled email templates.
+
+Templates live in ./templates: <name>.html is the default-locale version and
+<locale>/<name>.html a translation, for each locale of LOCALIZATION_LOCALES.
+An email's subject and plain-text body are <name>.subject.txt and
+<name>.text.txt next to it; .txt templates are not HTML-escaped. Each file
+is parsed once into its literal segments and placeholder slots (${name}, $$
+for a literal dollar) and cached by (template, locale), so rendering is a
+single join, and render_many escapes the values shared by a batch only once.
+With auto_reload a file is recompiled when its mtime changes, otherwise the
+disk is never read again.
+"""
+import html
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.services.localization.config import LOCALIZATION_LOCALES
+from app.services.notifications.config import NOTIFICATIONS_DEFAULT_LOCALE, NOTIFICATIONS_TEMPLATE_AUTO_RELOAD
+
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+# Suffix -> whether values are HTML-escaped
+TEMPLATE_SUFFIXES = {".html": True, ".txt": False}
+
+PLACEHOLDER_RE = re.compile(r"\$(?:\{([A-Za-z_][A-Za-z0-9_]*)\}|(\$))")
+
+
+@lru_cache(maxsize=4096)
+def _escape_text(value: str) -> str:
+    return html.escape(value)
+
+
+def escape(value: Any) -> str:
+    # Job titles, companies and status labels repeat across a batch: memoised
+    return _escape_text(value if isinstance(value, str) else str(value))
+
+
+def plain(value: Any) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+class CompiledTemplate:
+    __slots__ = ("name", "locale", "path", "mtime", "fields", "escape", "_parts", "_slots")
+
+    def __init__(self, name: str, locale: str, path: Path):
+        self.name = name
+        self.locale = locale
+        self.path = path
+        self.escape = escape if TEMPLATE_SUFFIXES[path.suffix] else plain
+        self.mtime = path.stat().st_mtime_ns
+        source = path.read_text(encoding="utf-8")
+        parts, slots, position = [], [], 0
+        for match in PLACEHOLDER_RE.finditer(source):
+            parts.append(source[position:match.start()])
+            if match.group(1):
+                slots.append((len(parts), match.group(1)))
+                parts.append("")
+            else:
+                parts.append("$")
+            position = match.end()
+        parts.append(source[position:])
+        self.fields = frozenset(field for _, field in slots)
+        self._parts = parts
+        self._slots = tuple(slots)
+
+    def escaped(self, values: Dict[str, Any], into: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Escape the values this template uses, on top of `into` (already escaped)"""
+        escaped = dict(into) if into else {}
+        fields, escape_value = self.fields, self.escape
+        for key, value in values.items():
+            if key in fields:
+                escaped[key] = escape_value(value)
+        return escaped
+
+    def render_escaped(self, values: Dict[str, str]) -> str:
+        """Fill the slots with already-escaped values; missing ones render empty"""
+        parts = self._parts.copy()
+        get = values.get
+        for index, field in self._slots:
+            parts[index] = get(field, "")
+        return "".join(parts)
+
+    def render(self, values: Dict[str, Any]) -> str:
+        return self.render_escaped(self.escaped(values))
+
+
+class TemplateEngine:
+    def __init__(self, directory: Path = TEMPLATE_DIR, default_locale: str = NOTIFICATIONS_DEFAULT_LOCALE,
+                 auto_reload: bool = NOTIFICATIONS_TEMPLATE_AUTO_RELOAD, locales: Iterable[str] = LOCALIZATION_LOCALES):
+        self.directory = directory
+        self.default_locale = default_locale.lower()
+        self.locales = frozenset([self.default_locale, *(locale.lower() for locale in locales)])
+        self.auto_reload = auto_reload
+        self.compiles = 0
+        self.reloads = 0
+        self._compiled: Dict[Tuple[str, str], CompiledTemplate] = {}
+        # (name, supported locale) -> the compiled template it resolves to
+        self._resolved: Dict[Tuple[str, str], CompiledTemplate] = {}
+
+    def resolve(self, locale: Optional[str]) -> str:
+        """Supported locale for a recipient: "fr-CA" -> "fr", unknown -> default"""
+        if locale:
+            locale = locale.strip().lower().replace("_", "-")
+            for candidate in (locale, locale.split("-")[0]):
+                if candidate in self.locales:
+                    return candidate
+        return self.default_locale
+
+    def _path(self, name: str, locale: str) -> Optional[Path]:
+        # locale is always one of self.locales, never a raw value from the database
+        directory = self.directory if locale == self.default_locale else self.directory / locale
+        for suffix in TEMPLATE_SUFFIXES:
+            path = directory / f"{name}{suffix}"
+            if path.is_file():
+                return path
+        return None
+
+    def _compile(self, name: str, locale: str, path: Path) -> CompiledTemplate:
+        template = CompiledTemplate(name, locale, path)
+        self._compiled[(name, locale)] = template
+        self.compiles += 1
+        return template
+
+    def load(self) -> int:
+        """Compile every template on disk; returns how many were compiled"""
+        self._compiled.clear()
+        self._resolved.clear()
+        for path in sorted(self.directory.rglob("*")):
+            if path.suffix not in TEMPLATE_SUFFIXES:
+                continue
+            relative = path.relative_to(self.directory)
+            locale = relative.parts[0] if len(relative.parts) > 1 else self.default_locale
+            if locale in self.locales:
+                self._compile(path.stem, locale, path)
+        return len(self._compiled)
+
+    def _fresh(self, template: CompiledTemplate) -> CompiledTemplate:
+        try:
+            mtime = template.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return template  # deleted while running: keep serving the last version
+        if mtime == template.mtime:
+            return template
+        self.reloads += 1
+        return self._compile(template.name, template.locale, template.path)
+
+    def _lookup(self, name: str, locale: str) -> Optional[CompiledTemplate]:
+        template = self._compiled.get((name, locale))
+        if template is not None:
+            return self._fresh(template) if self.auto_reload else template
+        path = self._path(name, locale)
+        if path is not None:
+            return self._compile(name, locale, path)
+        return None
+
+    def get(self, name: str, locale: Optional[str] = None) -> CompiledTemplate:
+        """Template for a locale, falling back to its language ("fr-CA" -> "fr") and the default locale"""
+        locale = self.resolve(locale)
+        key = (name, locale)
+        template = None if self.auto_reload else self._resolved.get(key)
+        if template is None:
+            for candidate in dict.fromkeys((locale, locale.split("-")[0], self.default_locale)):
+                if candidate not in self.locales:
+                    continue
+                template = self._lookup(name, candidate)
+                if template is not None:
+                    break
+            else:
+                raise KeyError(f"No email template named {name!r}")
+            self._resolved[key] = template
+        return template
+
+    def render(self, name: str, values: Dict[str, Any], locale: Optional[str] = None) -> str:
+        return self.get(name, locale).render(values)
+
+    def render_many(self, name: str, recipients: Sequence[Tuple[Optional[str], Dict[str, Any]]],
+                    shared: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Render one template for many (locale, values) recipients. Templates are
+        resolved once per locale and `shared` values escaped once per template.
+        """
+        per_locale: Dict[Optional[str], Tuple[CompiledTemplate, Dict[str, str]]] = {}
+        rendered = []
+        for locale, values in recipients:
+            entry = per_locale.get(locale)
+            if entry is None:
+                template = self.get(name, locale)
+                entry = per_locale[locale] = (template, template.escaped(shared or {}))
+            template, common = entry
+            rendered.append(template.render_escaped(template.escaped(values, into=common)))
+        return rendered
+
+    def render_emails(self, name: str, recipients: Sequence[Tuple[Optional[str], Dict[str, Any]]],
+                      shared: Optional[Dict[str, Any]] = None) -> List[Dict[str, str]]:
+        """subject, text and html per recipient, from <name>.subject, <name>.text and <name> in their locale"""
+        subjects = self.render_many(f"{name}.subject", recipients, shared)
+        texts = self.render_many(f"{name}.text", recipients, shared)
+        bodies = self.render_many(name, recipients, shared)
+        # A subject is one header line whatever the values hold
+        return [
+            {"subject": " ".join(subject.split()), "text": text.strip(), "html": html}
+            for subject, text, html in zip(subjects, texts, bodies)
+        ]
+
+    def stats(self) -> dict:
+        return {
+            "templates": sorted(f"{name}:{locale}" for name, locale in self._compiled),
+            "compiles": self.compiles,
+            "reloads": self.reloads,
+            "auto_reload": self.auto_reload,
+        }
+
+
+engine = TemplateEngine()
@@ -2,6 +2,7 @@ from beanie import Document
 from pydantic import Field
 from typing import Optional, List
 from datetime import datetime
+from pymongo import ASCENDING, IndexModel
 
 class Experience(Document):
     company: str
@@ -38,6 +39,9 @@ class Profile(Document):
 
     class Settings:
         name = "profiles"
+        indexes = [
+            IndexModel([("user_id", ASCENDING)], name="user_id"),
+        ]
 
     model_config = {
         "json_schema_extra": {
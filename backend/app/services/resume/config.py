@@ -0,0 +1,14 @@
+# app/services/resume/config.py
+
+import os
+
+# Storage backend name registered in resume/services/storage.py
+RESUME_STORAGE_BACKEND = os.getenv("RESUME_STORAGE_BACKEND", "local")
+RESUME_UPLOAD_DIR = os.getenv("RESUME_UPLOAD_DIR", "uploads/resumes")
+RESUME_MAX_BYTES = int(os.getenv("RESUME_MAX_BYTES", str(10 * 1024 * 1024)))
+RESUME_CHUNK_SIZE = int(os.getenv("RESUME_CHUNK_SIZE", str(256 * 1024)))
+
+# An upload of content whose blob is being deleted waits for the delete, then writes it again
+RESUME_BLOB_WRITE_ATTEMPTS = int(os.getenv("RESUME_BLOB_WRITE_ATTEMPTS", "5"))
+# A delete tombstone older than this is from a crashed worker and may be taken over
+RESUME_BLOB_DELETE_LEASE_SECONDS = float(os.getenv("RESUME_BLOB_DELETE_LEASE_SECONDS", "60"))
@@ -0,0 +1,72 @@
+# app/services/resume/db/resume_crud.py
+"""
+Reference counting for content-addressed resume blobs.
+
+Removing the last reference tombstones the record (deleting=True) before
+the file is deleted and drops the record afterwards. While the tombstone
+exists no reference can be taken, so an upload of the same content cannot
+reuse, or write, a file that is about to disappear: it waits and rewrites.
+"""
+from datetime import datetime, timedelta
+from typing import Optional
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from app.services.resume.models.resume import ResumeBlob
+
+LIVE = {"deleting": {"$ne": True}}
+
+async def add_blob_reference(content_hash: str) -> bool:
+    """Take a reference on an existing blob; False when it is not stored (or being deleted)"""
+    result = await ResumeBlob.get_motor_collection().update_one(
+        {"_id": content_hash, **LIVE}, {"$inc": {"ref_count": 1}}
+    )
+    return result.matched_count == 1
+
+async def create_blob_reference(content_hash: str, storage_key: str, size: int, content_type: str) -> bool:
+    """
+    Record a freshly written blob (or join a concurrent writer of the same
+    content). False when a delete of this content is in progress: the file
+    just written may be removed by it, so the caller must wait and write again.
+    """
+    blob = ResumeBlob(id=content_hash, storage_key=storage_key, size=size, content_type=content_type)
+    on_insert = blob.model_dump(by_alias=True, exclude={"ref_count", "deleting"})
+    try:
+        await ResumeBlob.get_motor_collection().update_one(
+            {"_id": content_hash, **LIVE},
+            {"$inc": {"ref_count": 1}, "$setOnInsert": on_insert},
+            upsert=True,
+        )
+    except DuplicateKeyError:
+        return False  # the tombstone holds the _id
+    return True
+
+async def release_blob_reference(content_hash: str) -> Optional[str]:
+    """Drop a reference; returns the storage key when the caller must delete the file"""
+    collection = ResumeBlob.get_motor_collection()
+    blob = await collection.find_one_and_update(
+        {"_id": content_hash, **LIVE},
+        {"$inc": {"ref_count": -1}},
+        return_document=ReturnDocument.AFTER,
+    )
+    if blob is None or blob["ref_count"] > 0:
+        return None
+    # Only the caller that sets the tombstone deletes the file
+    claimed = await collection.find_one_and_update(
+        {"_id": content_hash, "ref_count": {"$lte": 0}, **LIVE},
+        {"$set": {"deleting": True, "deleting_at": datetime.utcnow()}},
+    )
+    return claimed["storage_key"] if claimed else None
+
+async def finish_blob_delete(content_hash: str):
+    """Drop the tombstone once the file is gone"""
+    await ResumeBlob.get_motor_collection().delete_one({"_id": content_hash, "deleting": True})
+
+async def clear_stale_tombstone(content_hash: str, lease_seconds: float):
+    """Drop a tombstone left by a worker that died between deleting the file and the record"""
+    await ResumeBlob.get_motor_collection().delete_one({
+        "_id": content_hash,
+        "deleting": True,
+        "deleting_at": {"$lt": datetime.utcnow() - timedelta(seconds=lease_seconds)},
+    })
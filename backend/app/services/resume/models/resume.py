@@ -2,6 +2,7 @@ from beanie import Document
 from pydantic import Field
 from typing import Optional
 from datetime import datetime
+from pymongo import ASCENDING, IndexModel
 
 class Resume(Document):
     user_id: str
@@ -9,11 +10,16 @@ class Resume(Document):
     file_url: str
     file_size: int
     content_type: str
+    storage_key: Optional[str] = None  # key in the storage backend
+    content_hash: Optional[str] = None  # SHA-256 of the file content, see ResumeBlob
     is_primary: bool = False
     uploaded_at: datetime = Field(default_factory=datetime.utcnow)
 
     class Settings:
         name = "resumes"
+        indexes = [
+            IndexModel([("user_id", ASCENDING)], name="user_id"),
+        ]
 
     model_config = {
         "json_schema_extra": {
@@ -25,4 +31,21 @@ class Resume(Document):
                 "content_type": "application/pdf"
             }
         }
-    }
\ No newline at end of file
+    }
+
+class ResumeBlob(Document):
+    """
+    One stored file, keyed by the SHA-256 of its content and shared by every
+    Resume with the same content_hash. ref_count tracks those references.
+    """
+    id: str  # SHA-256 hex digest
+    storage_key: str
+    size: int
+    content_type: str
+    ref_count: int = 0
+    deleting: bool = False  # tombstone: the file is being removed, no new references
+    deleting_at: Optional[datetime] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+    class Settings:
+        name = "resume_blobs"
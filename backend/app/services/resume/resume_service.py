@@ -1,49 +1,90 @@
 from typing import List, Dict, Any
-from fastapi import HTTPException
+from fastapi import HTTPException, UploadFile
 from app.services.resume.models.resume import Resume
+from app.services.resume.config import (
+    RESUME_BLOB_DELETE_LEASE_SECONDS,
+    RESUME_BLOB_WRITE_ATTEMPTS,
+    RESUME_CHUNK_SIZE,
+    RESUME_MAX_BYTES,
+)
+from app.services.resume.services.storage import blob_key, get_storage
+from app.services.resume.utils.file_utils import UploadStream
+from app.services.resume.db import resume_crud
+from app.core import raw_reads
+import asyncio
 import os
-import uuid
 from datetime import datetime
 
-async def upload_resume(file_data: Dict[str, Any], user_id: str = None) -> Dict[str, Any]:
-    """Upload a resume file"""
+# Fields returned by the resume list endpoint
+RESUME_FIELDS = ("id", "filename", "file_url", "file_size", "content_type", "is_primary", "uploaded_at")
+
+async def upload_resume(file: UploadFile, user_id: str = None) -> Dict[str, Any]:
+    """
+    Upload a resume file into content-addressed storage. Content that is
+    already stored only gets a new reference and a metadata insert.
+    """
     try:
-        # Create upload directory if it doesn't exist
-        upload_dir = "uploads/resumes"
-        os.makedirs(upload_dir, exist_ok=True)
-        
-        # Generate unique filename
-        file_extension = os.path.splitext(file_data["filename"])[1]
-        unique_filename = f"{uuid.uuid4()}{file_extension}"
-        file_path = os.path.join(upload_dir, unique_filename)
-        
-        # Save file (in production, this would be saved to cloud storage)
-        with open(file_path, "wb") as f:
-            f.write(file_data["content"])
+        storage = get_storage()
+
+        # First pass: size limit and SHA-256, nothing written yet
+        stream = UploadStream(file, chunk_size=RESUME_CHUNK_SIZE, max_bytes=RESUME_MAX_BYTES)
+        async for _ in stream:
+            pass
+        content_hash = stream.sha256
+        key = blob_key(content_hash)
+
+        for attempt in range(RESUME_BLOB_WRITE_ATTEMPTS):
+            if await resume_crud.add_blob_reference(content_hash):
+                break
+            # New content: second pass streams it into storage
+            await file.seek(0)
+            await storage.save(
+                UploadStream(file, chunk_size=RESUME_CHUNK_SIZE, max_bytes=RESUME_MAX_BYTES), key
+            )
+            if await resume_crud.create_blob_reference(content_hash, key, stream.size, file.content_type):
+                break
+            # The same content is being deleted: let that finish, then write it again
+            await resume_crud.clear_stale_tombstone(content_hash, RESUME_BLOB_DELETE_LEASE_SECONDS)
+            await asyncio.sleep(0.05 * (attempt + 1))
+        else:
+            raise HTTPException(status_code=503, detail="Resume storage is busy, please retry")
         
         # Create resume record
         resume = Resume(
             user_id=user_id or "anonymous",
-            filename=file_data["filename"],
-            file_url=f"/{file_path}",
-            file_size=len(file_data["content"]),
-            content_type=file_data["content_type"]
+            filename=file.filename,
+            file_url=storage.url(key),
+            file_size=stream.size,
+            content_type=file.content_type,
+            storage_key=key,
+            content_hash=content_hash
         )
         
-        await resume.insert()
+        try:
+            await resume.insert()
+        except Exception:
+            await _release_blob(content_hash)
+            raise
         
         return {
             "id": str(resume.id),
             "filename": resume.filename,
             "file_url": resume.file_url,
+            "file_size": resume.file_size,
             "uploaded_at": resume.uploaded_at,
             "message": "Resume uploaded successfully"
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to upload resume: {str(e)}")
 
 async def list_resumes(user_id: str) -> List[Dict[str, Any]]:
     """List all resumes for a user"""
+    if raw_reads.raw_reads_enabled("resumes"):
+        docs = raw_reads.stream(Resume, {"user_id": user_id}, fields=RESUME_FIELDS)
+        return [raw_reads.with_str_id(doc) async for doc in docs]
+
     resumes = await Resume.find(Resume.user_id == user_id).to_list()
     
     return [
@@ -83,13 +124,21 @@ async def delete_resume(resume_id: str, user_id: str) -> Dict[str, str]:
     if resume.user_id != user_id:
         raise HTTPException(status_code=403, detail="Not authorized to delete this resume")
     
-    # Delete file from storage
+    await resume.delete()
+    
+    # Delete file from storage once no other resume references it
     try:
-        if os.path.exists(resume.file_url.lstrip('/')):
+        if resume.content_hash:
+            await _release_blob(resume.content_hash)
+        elif os.path.exists(resume.file_url.lstrip('/')):
             os.remove(resume.file_url.lstrip('/'))
     except Exception:
         pass  # File might already be deleted
     
-    await resume.delete()
-    
-    return {"message": "Resume deleted successfully"}
\ No newline at end of file
+    return {"message": "Resume deleted successfully"}
+
+async def _release_blob(content_hash: str):
+    storage_key = await resume_crud.release_blob_reference(content_hash)
+    if storage_key:
+        await get_storage().delete(storage_key)
+        await resume_crud.finish_blob_delete(content_hash)
@@ -0,0 +1,48 @@
+# app/services/resume/services/local_storage.py
+
+import os
+import uuid
+from typing import AsyncIterable
+
+from fastapi.concurrency import run_in_threadpool
+
+
+class LocalStorage:
+    """Stores files in a local directory; disk I/O runs in the threadpool"""
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(self.root, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def url(self, key: str) -> str:
+        return f"/{self._path(key)}"
+
+    async def save(self, chunks: AsyncIterable[bytes], key: str) -> str:
+        """Write the chunks under key; nothing is left behind if the stream fails"""
+        path = self._path(key)
+        await run_in_threadpool(os.makedirs, os.path.dirname(path), exist_ok=True)
+        tmp_path = self._path(f".{uuid.uuid4().hex}.part")
+        f = await run_in_threadpool(open, tmp_path, "wb")
+        try:
+            async for chunk in chunks:
+                await run_in_threadpool(f.write, chunk)
+            await run_in_threadpool(f.close)
+            await run_in_threadpool(os.replace, tmp_path, path)
+        except BaseException:
+            await run_in_threadpool(f.close)
+            await run_in_threadpool(_remove_quietly, tmp_path)
+            raise
+        return key
+
+    async def delete(self, key: str) -> None:
+        await run_in_threadpool(_remove_quietly, self._path(key))
+
+
+def _remove_quietly(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,33 @@
+# app/services/resume/services/storage.py
+
+from typing import Callable, Dict
+
+from app.services.resume.config import RESUME_STORAGE_BACKEND, RESUME_UPLOAD_DIR
+from app.services.resume.services.local_storage import LocalStorage
+
+# Backend name -> factory; cloud backends register themselves here
+STORAGE_BACKENDS: Dict[str, Callable[[], object]] = {
+    "local": lambda: LocalStorage(RESUME_UPLOAD_DIR),
+}
+
+_storage = None
+
+
+def blob_key(content_hash: str) -> str:
+    """Content-addressed key, fanned out over 256 directories"""
+    return f"{content_hash[:2]}/{content_hash}"
+
+
+def register_storage(name: str, factory: Callable[[], object]):
+    STORAGE_BACKENDS[name] = factory
+
+
+def get_storage():
+    """
+    Storage backend selected by RESUME_STORAGE_BACKEND. A backend provides
+    ``save(chunks, key)``, ``delete(key)`` and ``url(key)``.
+    """
+    global _storage
+    if _storage is None:
+        _storage = STORAGE_BACKENDS[RESUME_STORAGE_BACKEND]()
+    return _storage
@@ -0,0 +1,39 @@
+# app/services/resume/utils/file_utils.py
+
+import hashlib
+from typing import AsyncIterator
+
+from fastapi import HTTPException, UploadFile
+
+
+class UploadStream:
+    """
+    Async iterator over an UploadFile in fixed-size chunks.
+    Size and SHA-256 are computed on the fly; exceeding max_bytes raises 413
+    as soon as the limit is crossed.
+    """
+
+    def __init__(self, upload: UploadFile, chunk_size: int, max_bytes: int):
+        self.upload = upload
+        self.chunk_size = chunk_size
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._digest = hashlib.sha256()
+
+    @property
+    def sha256(self) -> str:
+        return self._digest.hexdigest()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        while True:
+            chunk = await self.upload.read(self.chunk_size)
+            if not chunk:
+                break
+            self.size += len(chunk)
+            if self.size > self.max_bytes:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"File exceeds the {self.max_bytes} byte limit",
+                )
+            self._digest.update(chunk)
+            yield chunk
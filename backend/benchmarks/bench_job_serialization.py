@@ -0,0 +1,109 @@
+# benchmarks/bench_job_serialization.py
+"""
+Per-job cost of turning a stored job into response bytes.
+
+    cd backend && python -m benchmarks.bench_job_serialization [jobs] [repeat]
+
+"legacy" is the old path: hand-copied JobResponse(...) (validation #1),
+FastAPI's response_model re-validation (#2) and jsonable_encoder + json.dumps.
+"serializer" is app/services/job/serializers.py from a raw Motor document.
+No database is needed.
+"""
+import json
+import sys
+import time
+from datetime import datetime
+from typing import List
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.models.jobs import JobResponse
+from app.services.job.models.job import Job
+from app.services.job.serializers import encode_jobs, to_job_response
+
+
+def make_raw_jobs(count: int) -> List[dict]:
+    now = datetime.utcnow()
+    return [
+        {
+            "_id": ObjectId(),
+            "title": f"Senior Developer {i}",
+            "company": "TechCorp",
+            "location": "San Francisco, CA",
+            "salary": "$120,000 - $150,000",
+            "description": "We are seeking a skilled developer... " * 20,
+            "requirements": "5+ years experience",
+            "employment_type": "Full-time",
+            "remote": bool(i % 2),
+            "status": "active",
+            "employer_id": str(ObjectId()),
+            "skills_required": ["React", "TypeScript", "CSS"],
+            "benefits": "Health insurance, 401k",
+            "application_deadline": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(count)
+    ]
+
+
+def legacy(docs: List[Job]) -> bytes:
+    responses = [
+        JobResponse(
+            id=str(job.id),
+            title=job.title,
+            company=job.company,
+            location=job.location,
+            salary=job.salary,
+            description=job.description,
+            requirements=job.requirements,
+            employment_type=job.employment_type,
+            remote=job.remote,
+            status=job.status,
+            employer_id=job.employer_id,
+            skills_required=job.skills_required,
+            benefits=job.benefits,
+            application_deadline=job.application_deadline,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+        ) for job in docs
+    ]
+    validated = TypeAdapter(List[JobResponse]).validate_python(responses, from_attributes=True)
+    return json.dumps(jsonable_encoder(validated)).encode()
+
+
+def serializer(raw: List[dict]) -> bytes:
+    return encode_jobs([to_job_response(doc) for doc in raw])
+
+
+def bench(name: str, fn, arg, count: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - started)
+    per_job = best / count * 1e6
+    print(f"{name:<32} {best * 1000:9.2f} ms  {per_job:7.2f} us/job")
+    return per_job
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    raw = make_raw_jobs(count)
+    # Documents are built without Beanie's __init__ (which needs a database);
+    # hydration cost is therefore not included in the legacy numbers
+    docs = [Job.model_construct(id=doc["_id"], **{k: v for k, v in doc.items() if k != "_id"}) for doc in raw]
+
+    assert json.loads(legacy(docs[:50])) == json.loads(serializer(raw[:50]))
+
+    print(f"{count} jobs, best of {repeat}")
+    old = bench("legacy: copy + revalidate", legacy, docs, count, repeat)
+    new = bench("serializer: construct + dump", serializer, raw, count, repeat)
+    print(f"speedup: {old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
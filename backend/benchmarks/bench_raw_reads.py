@@ -0,0 +1,107 @@
+# benchmarks/bench_raw_reads.py
+"""
+Beanie document hydration vs the raw Motor read path (app/core/raw_reads.py)
+for list endpoints, on a 10k-row result.
+
+    cd backend && MONGODB_URL=mongodb://localhost:27017 python -m benchmarks.bench_raw_reads [rows] [repeat]
+
+Seeds a scratch database (MONGODB_BENCH_DB, default "jobboard_bench") and
+drops it afterwards.
+"""
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+from app.core import db as core_db
+from app.core import raw_reads
+from app.services.application.db import application_crud
+from app.services.job import job_service
+from app.services.job.serializers import encode_jobs
+
+BENCH_DB = os.getenv("MONGODB_BENCH_DB", "jobboard_bench")
+EMPLOYER_ID = "bench-employer"
+
+
+async def seed(rows: int):
+    now = datetime.utcnow()
+    await core_db.db.jobs.insert_many([
+        {
+            "title": f"Senior Developer {i}",
+            "company": "TechCorp",
+            "location": "San Francisco, CA",
+            "salary": "$120,000 - $150,000",
+            "description": "We are seeking a skilled developer... " * 20,
+            "requirements": "5+ years experience",
+            "employment_type": "Full-time",
+            "remote": bool(i % 2),
+            "status": "active",
+            "employer_id": EMPLOYER_ID,
+            "skills_required": ["React", "TypeScript", "CSS"],
+            "benefits": "Health insurance, 401k",
+            "application_deadline": None,
+            "created_at": now - timedelta(seconds=i),
+            "updated_at": now,
+        }
+        for i in range(rows)
+    ])
+    await core_db.db.applications.insert_many([
+        {
+            "candidate_id": str(ObjectId()),
+            "job_id": str(ObjectId()),
+            "employer_id": EMPLOYER_ID,
+            "resume_url": "/uploads/resumes/cv.pdf",
+            "cover_letter": "Dear hiring manager... " * 10,
+            "status": "pending",
+            "applied_at": now - timedelta(seconds=i),
+            "updated_at": now,
+        }
+        for i in range(rows)
+    ])
+
+
+async def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+async def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    core_db.db = core_db.client[BENCH_DB]
+    await core_db.client.drop_database(BENCH_DB)
+    await core_db.init_db()
+    await seed(rows)
+
+    cases = {
+        "employer_jobs": lambda: job_service.get_employer_jobs(EMPLOYER_ID),
+        "employer_jobs + encode": lambda: _encoded_employer_jobs(),
+        "employer_applications": lambda: application_crud.get_applications_by_employer(EMPLOYER_ID),
+    }
+    print(f"{rows} rows, best of {repeat}")
+    try:
+        for name, fn in cases.items():
+            results = {}
+            for mode in ("none", "all"):
+                raw_reads.RAW_READ_ENDPOINTS.clear()
+                raw_reads.RAW_READ_ENDPOINTS.add(mode)
+                results[mode] = await timed(fn, repeat)
+            beanie, raw = results["none"], results["all"]
+            print(f"{name:<24} beanie {beanie * 1000:8.1f} ms   raw {raw * 1000:8.1f} ms   {beanie / raw:4.1f}x")
+    finally:
+        await core_db.client.drop_database(BENCH_DB)
+
+
+async def _encoded_employer_jobs():
+    return encode_jobs(await job_service.get_employer_jobs(EMPLOYER_ID))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,74 @@
+# tests/test_bulk_import.py
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from app.services.job.services import bulk_import
+from app.services.job.services.bulk_import import BulkBodyError, iter_json_array, iter_ndjson
+
+
+class ChunkedRequest:
+    """Stands in for a Request whose body arrives in fixed-size chunks"""
+
+    def __init__(self, body: bytes, size: int):
+        self.chunks = [body[i:i + size] for i in range(0, len(body), size)]
+
+    async def stream(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+def collect(iterator):
+    async def run():
+        rows = []
+        try:
+            async for row in iterator:
+                rows.append(row)
+        except BulkBodyError as e:
+            rows.append(e)
+        return rows
+    return asyncio.run(run())
+
+
+ROWS = [{"title": "Dev ü", "n": 12345}, 7, [1, 2], "x, ]", {"nested": {"a": [None, True]}}]
+
+
+@pytest.mark.parametrize("size", [1, 3, 64, 10_000])
+def test_json_array_streams_rows_across_chunks(size):
+    body = json.dumps(ROWS, ensure_ascii=False).encode()
+    assert collect(iter_json_array(ChunkedRequest(body, size))) == ROWS
+
+
+@pytest.mark.parametrize("body", [b"", b"  ", b'{"title": "x"}', b"nope"])
+def test_json_array_rejects_non_array_before_any_row(body):
+    with pytest.raises(HTTPException) as e:
+        collect(iter_json_array(ChunkedRequest(body, 4)))
+    assert e.value.status_code == 400
+
+
+@pytest.mark.parametrize("body", [b'[{"a": 1}, {"a": ', b'[{"a": 1} {"a": 2}]', b'[{"a": 1}, '])
+def test_json_array_stops_where_the_body_breaks(body):
+    rows = collect(iter_json_array(ChunkedRequest(body, 5)))
+    assert rows[0] == {"a": 1}
+    assert isinstance(rows[1], BulkBodyError) and len(rows) == 2
+
+
+def test_empty_array():
+    assert collect(iter_json_array(ChunkedRequest(b" [ ] ", 2))) == []
+
+
+def test_rows_over_the_size_limit_stop_the_stream(monkeypatch):
+    monkeypatch.setattr(bulk_import, "JOB_BULK_MAX_ROW_BYTES", 32)
+    big = json.dumps({"title": "x" * 100}).encode()
+    rows = collect(iter_json_array(ChunkedRequest(b'[{"a": 1}, ' + big + b"]", 8)))
+    assert rows[0] == {"a": 1} and isinstance(rows[1], BulkBodyError)
+
+    rows = collect(iter_ndjson(ChunkedRequest(b'{"a": 1}\n' + big + b"\n", 8)))
+    assert rows[0] == b'{"a": 1}' and isinstance(rows[1], BulkBodyError)
+
+
+def test_ndjson_lines_across_chunks():
+    body = b'{"a": 1}\n\n{"a": 2}\r\n{"a": 3}'
+    assert [json.loads(row) for row in collect(iter_ndjson(ChunkedRequest(body, 3)))] == [{"a": 1}, {"a": 2}, {"a": 3}]
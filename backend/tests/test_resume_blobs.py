@@ -0,0 +1,125 @@
+# tests/test_resume_blobs.py
+import asyncio
+import hashlib
+import io
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from beanie import init_beanie
+from fastapi import UploadFile
+from mongomock_motor import AsyncMongoMockClient
+from starlette.datastructures import Headers
+
+from app.services.resume import resume_service
+from app.services.resume.config import RESUME_BLOB_DELETE_LEASE_SECONDS
+from app.services.resume.db import resume_crud
+from app.services.resume.models.resume import Resume, ResumeBlob
+from app.services.resume.services import storage as storage_module
+from app.services.resume.services.local_storage import LocalStorage
+from app.services.resume.services.storage import blob_key
+
+CONTENT = b"%PDF-1.4 resume body"
+CONTENT_HASH = hashlib.sha256(CONTENT).hexdigest()
+
+
+class RecordingStorage(LocalStorage):
+    """LocalStorage that signals every completed save"""
+
+    def __init__(self, root: str):
+        super().__init__(root)
+        self.saves = 0
+        self.saved = asyncio.Event()
+
+    async def save(self, chunks, key):
+        await super().save(chunks, key)
+        self.saves += 1
+        self.saved.set()
+        return key
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    storage = RecordingStorage(str(tmp_path))
+    monkeypatch.setattr(storage_module, "_storage", storage)
+    return storage
+
+
+def run(test):
+    async def main():
+        await init_beanie(database=AsyncMongoMockClient()["jobboard"], document_models=[Resume, ResumeBlob])
+        await test()
+    asyncio.run(main())
+
+
+def upload(user_id: str, content: bytes = CONTENT):
+    file = UploadFile(io.BytesIO(content), filename="cv.pdf", headers=Headers({"content-type": "application/pdf"}))
+    return resume_service.upload_resume(file, user_id)
+
+
+def stored(storage) -> bool:
+    return os.path.exists(storage._path(blob_key(CONTENT_HASH)))
+
+
+def test_same_content_is_stored_once(storage):
+    async def test():
+        first = await upload("u1")
+        second = await upload("u2")
+        assert first["file_url"] == second["file_url"]
+        blob = await ResumeBlob.get(CONTENT_HASH)
+        assert blob.ref_count == 2 and not blob.deleting
+        assert storage.saves == 1 and stored(storage)
+    run(test)
+
+
+def test_file_is_kept_until_the_last_reference_goes(storage):
+    async def test():
+        first = await upload("u1")
+        second = await upload("u2")
+
+        await resume_service.delete_resume(first["id"], "u1")
+        assert (await ResumeBlob.get(CONTENT_HASH)).ref_count == 1
+        assert stored(storage)
+
+        await resume_service.delete_resume(second["id"], "u2")
+        assert await ResumeBlob.get(CONTENT_HASH) is None
+        assert not stored(storage)
+        assert await Resume.count() == 0
+    run(test)
+
+
+def test_upload_racing_a_tombstone_rewrites_the_file(storage):
+    async def test():
+        # A delete of this content has tombstoned the record but not yet removed the file
+        await ResumeBlob(
+            id=CONTENT_HASH, storage_key=blob_key(CONTENT_HASH), size=len(CONTENT),
+            content_type="application/pdf", deleting=True,
+        ).insert()
+
+        async def finish_delete():
+            await storage.saved.wait()  # the upload has written the file the delete is about to remove
+            await storage.delete(blob_key(CONTENT_HASH))
+            await resume_crud.finish_blob_delete(CONTENT_HASH)
+
+        result, _ = await asyncio.gather(upload("u1"), finish_delete())
+
+        assert storage.saves == 2 and stored(storage)
+        blob = await ResumeBlob.get(CONTENT_HASH)
+        assert blob.ref_count == 1 and not blob.deleting
+        assert (await Resume.get(result["id"])).content_hash == CONTENT_HASH
+    run(test)
+
+
+def test_stale_tombstone_is_taken_over(storage):
+    async def test():
+        # The deleting worker died: the tombstone is never finished
+        await ResumeBlob(
+            id=CONTENT_HASH, storage_key=blob_key(CONTENT_HASH), size=len(CONTENT),
+            content_type="application/pdf", deleting=True,
+            deleting_at=datetime.utcnow() - timedelta(seconds=RESUME_BLOB_DELETE_LEASE_SECONDS + 1),
+        ).insert()
+        await upload("u1")
+        blob = await ResumeBlob.get(CONTENT_HASH)
+        assert blob.ref_count == 1 and not blob.deleting
+        assert stored(storage)
+    run(test)
@@ -0,0 +1,80 @@
+# tests/test_salary.py
+import mongomock
+import pytest
+
+from app.services.job.utils.salary import parse_salary, salary_fields, salary_in_range, salary_range_query
+
+
+@pytest.mark.parametrize("text, currency, low, high, period", [
+    ("$120,000 - $150,000", "USD", 120000, 150000, "year"),
+    ("120-150k", "USD", 120000, 150000, "year"),
+    ("£45k", "GBP", 45000, 45000, "year"),
+    ("Up to 90k EUR", "EUR", None, 90000, "year"),
+    ("$100k+", "USD", 100000, None, "year"),
+    ("From $60,000", "USD", 60000, None, "year"),
+    ("10-15 LPA", "INR", 1000000, 1500000, "year"),
+    ("12,00,000 INR", "INR", 1200000, 1200000, "year"),
+    ("1.2 crore", "INR", 12000000, 12000000, "year"),
+    ("€30-35/hour", "EUR", 30, 35, "hour"),
+    ("$25/hr", "USD", 25, 25, "hour"),
+    ("EUR 30 to 35 an hour", "EUR", 30, 35, "hour"),
+    ("$1,200 per week", "USD", 1200, 1200, "week"),
+    ("$6,000 monthly", "USD", 6000, 6000, "month"),
+    ("85000", "USD", 85000, 85000, "year"),
+    # Figures that are not amounts are skipped
+    ("2023 graduates, $80k", "USD", 80000, 80000, "year"),
+    ("Team of 12, salary 95,000 USD", "USD", 95000, 95000, "year"),
+    ("3 months contract 40k", "USD", 40000, 40000, "year"),
+])
+def test_parse_salary(text, currency, low, high, period):
+    assert parse_salary(text) == (currency, low, high, period)
+
+
+@pytest.mark.parametrize("text", [None, "", "Competitive", "Negotiable, 2023 start"])
+def test_parse_salary_without_amount(text):
+    assert parse_salary(text) is None
+
+
+def test_salary_fields_are_annualised():
+    fields = salary_fields("€30-35/hour")
+    assert fields["salary_annual_min"] == 30 * 2080
+    assert fields["salary_annual_max"] == 35 * 2080
+
+
+JOBS = {
+    "range": "$100,000 - $150,000",
+    "hourly": "$50/hour",  # 104,000 a year
+    "open_max": "$130k+",
+    "open_min": "Up to $90k",
+    "euro": "€120k",
+    "unparsed": "Competitive",
+}
+
+
+@pytest.fixture
+def jobs():
+    collection = mongomock.MongoClient().db.jobs
+    collection.insert_many([{"_id": name, **salary_fields(text)} for name, text in JOBS.items()])
+    return collection
+
+
+@pytest.mark.parametrize("bounds, expected", [
+    ((120000, None, None), {"range", "open_max"}),
+    ((None, 105000, None), {"range", "hourly", "open_min"}),
+    ((None, 95000, None), {"open_min"}),
+    ((100000, 110000, None), {"range", "hourly"}),
+    ((200000, None, None), set()),
+    # Bounds without a currency are USD: the euro job is never compared
+    ((110000, 130000, None), {"range", "open_max"}),
+    ((110000, 130000, "eur"), {"euro"}),
+    ((None, None, "EUR"), {"euro"}),
+])
+def test_salary_range_query_overlaps(jobs, bounds, expected):
+    assert {doc["_id"] for doc in jobs.find(salary_range_query(*bounds))} == expected
+    # The in-memory twin agrees with the query
+    assert {name for name, text in JOBS.items() if salary_in_range(salary_fields(text), *bounds)} == expected
+
+
+def test_salary_range_query_without_bounds_matches_everything():
+    assert salary_range_query() == {}
+    assert salary_in_range(salary_fields("Competitive"))
@@ -4,17 +4,24 @@ Comprehensive Backend API Test Suite
 Tests the FastAPI authentication and job endpoints for the job platform
 """
 
+import os
 import requests
 import json
 import sys
 import time
+from datetime import datetime
 from typing import Dict, Any
 import uuid
 
+from pymongo import MongoClient
+
 # Backend URL from frontend .env
 BACKEND_URL = "http://localhost:8001"
 API_BASE = f"{BACKEND_URL}/api"
 
+# The backend's database, used to seed rows the API can no longer create (legacy statuses)
+MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
+
 class BackendTester:
     def __init__(self):
         self.session = requests.Session()
@@ -249,7 +256,7 @@ class BackendTester:
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = response.json().get("items")
                 if isinstance(data, list):
                     self.log_test(test_name, True, f"Successfully retrieved {len(data)} jobs")
                     return True, data
@@ -405,6 +412,127 @@ class BackendTester:
             self.log_test(test_name, False, f"Network error during candidate restriction test: {str(e)}")
             return False, {"error": str(e)}
     
+    def _auth(self, email: str) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.tokens[email]}", "Content-Type": "application/json"}
+
+    def _apply(self, candidate_email: str, job_id: str) -> str:
+        response = self.session.post(
+            f"{API_BASE}/jobs/{job_id}/apply",
+            json={"resume_url": "https://example.com/resume.pdf", "cover_letter": "I would love to join."},
+            headers=self._auth(candidate_email),
+            timeout=10
+        )
+        response.raise_for_status()
+        return response.json()["application_id"]
+
+    def _insert_legacy_application(self, employer_id: str, job_id: str) -> str:
+        """An application stored with the pre-validation status "pending" """
+        client = MongoClient(MONGODB_URL)
+        try:
+            now = datetime.utcnow()
+            result = client["jobboard"]["applications"].insert_one({
+                "candidate_id": f"legacy-{uuid.uuid4().hex[:8]}",
+                "job_id": job_id,
+                "employer_id": employer_id,
+                "resume_url": "https://example.com/legacy.pdf",
+                "cover_letter": "Applied before statuses were validated.",
+                "status": "pending",
+                "applied_at": now,
+                "updated_at": now,
+            })
+            return str(result.inserted_id)
+        finally:
+            client.close()
+
+    def _check(self, test_name: str, response, expected_status: int, expected: Dict[str, Any] = None) -> bool:
+        """Pass when the status code matches and every expected key has the expected value"""
+        try:
+            data = response.json()
+        except ValueError:
+            data = {"raw_response": response.text}
+        mismatched = {key: data.get(key) for key, value in (expected or {}).items() if data.get(key) != value}
+        if response.status_code == expected_status and not mismatched:
+            self.log_test(test_name, True, f"Got {response.status_code} as expected")
+            return True
+        self.log_test(test_name, False, f"Expected {expected_status}, got {response.status_code}",
+                      {"response": data, "mismatched": mismatched})
+        return False
+
+    def test_application_status_updates(self):
+        """Test PUT /api/applications/update-status and /bulk-status transitions and outcomes"""
+        test_name = "Application Status Updates"
+        unique_id = str(uuid.uuid4())[:8]
+        employer_email = f"status_employer_{unique_id}@example.com"
+        other_employer_email = f"status_other_employer_{unique_id}@example.com"
+        candidate_emails = [f"status_candidate_{i}_{unique_id}@example.com" for i in range(3)]
+
+        try:
+            ok, employer = self.test_user_signup(employer_email, "password123", f"Status Employer {unique_id}", "employer")
+            ok = ok and self.test_user_signup(other_employer_email, "password123", f"Other Employer {unique_id}", "employer")[0]
+            for index, email in enumerate(candidate_emails):
+                ok = ok and self.test_user_signup(email, "password123", f"Status Candidate {index} {unique_id}", "candidate")[0]
+            job_ok, job = self.test_create_job(employer_email)
+            other_ok, other_job = self.test_create_job(other_employer_email)
+            if not (ok and job_ok and other_ok):
+                self.log_test(test_name, False, "Setup failed (signup or job creation)")
+                return False
+
+            allowed_id = self._apply(candidate_emails[0], job["id"])
+            disallowed_id = self._apply(candidate_emails[1], job["id"])
+            other_id = self._apply(candidate_emails[2], other_job["id"])
+            legacy_id = self._insert_legacy_application(employer["id"], job["id"])
+            update_url = f"{API_BASE}/applications/update-status"
+            bulk_url = f"{API_BASE}/applications/bulk-status"
+            headers = self._auth(employer_email)
+
+            results = [
+                # submitted -> under_review is allowed
+                self._check("Status Update (allowed transition)", self.session.put(
+                    update_url, json={"application_id": allowed_id, "new_status": "under_review"},
+                    headers=headers, timeout=10), 200),
+                # submitted -> accepted skips the review
+                self._check("Status Update (disallowed transition)", self.session.put(
+                    update_url, json={"application_id": disallowed_id, "new_status": "accepted"},
+                    headers=headers, timeout=10), 409),
+                # another employer's application looks missing
+                self._check("Status Update (other employer's application)", self.session.put(
+                    update_url, json={"application_id": other_id, "new_status": "under_review"},
+                    headers=headers, timeout=10), 404),
+                # the legacy "pending" row counts as submitted
+                self._check("Status Update (legacy pending row)", self.session.put(
+                    update_url, json={"application_id": legacy_id, "new_status": "under_review"},
+                    headers=headers, timeout=10), 200),
+            ]
+
+            response = self.session.put(bulk_url, json={"changes": [
+                {"application_id": allowed_id, "new_status": "interview_scheduled"},
+                {"application_id": allowed_id, "new_status": "rejected"},
+                {"application_id": disallowed_id, "new_status": "interviewed"},
+                {"application_id": other_id, "new_status": "rejected"},
+                {"application_id": legacy_id, "new_status": "accepted"},
+            ]}, headers=headers, timeout=10)
+            results.append(self._check("Bulk Status Update (counts)", response, 200, {
+                "updated": 2, "duplicate": 1, "invalid_transition": 1, "not_found": 1,
+            }))
+            outcomes = [result.get("outcome") for result in response.json().get("results", [])]
+            expected_outcomes = ["updated", "duplicate", "invalid_transition", "not_found", "updated"]
+            results.append(outcomes == expected_outcomes)
+            self.log_test("Bulk Status Update (per-change outcomes)", outcomes == expected_outcomes,
+                          f"Outcomes {outcomes}", {"expected": expected_outcomes})
+
+            # The other employer's application was not touched
+            response = self.session.put(update_url, json={"application_id": other_id, "new_status": "under_review"},
+                                        headers=self._auth(other_employer_email), timeout=10)
+            results.append(self._check("Status Update (untouched by another employer)", response, 200))
+
+            success = all(results)
+            self.log_test(test_name, success, "All status update checks passed" if success else "Some status update checks failed")
+            return success
+
+        except (requests.exceptions.RequestException, KeyError) as e:
+            self.log_test(test_name, False, f"Error during status update tests: {str(e)}")
+            return False
+
     def test_integration_flow(self):
         """Test complete integration flow: employer signup → login → job posting → verification"""
         test_name = "Integration Test - Complete Job Board Flow"
@@ -529,6 +657,9 @@ class BackendTester:
         # Test candidate restriction
         self.test_candidate_job_creation_restriction("sarah.johnson@example.com")
         
+        print("\n📋 Testing Application Status Updates...")
+        self.test_application_status_updates()
+        
         print("\n🔄 Testing Integration Flow...")
         # Test complete integration
         self.test_integration_flow()
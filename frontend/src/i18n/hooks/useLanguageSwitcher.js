@@ -0,0 +1,13 @@
+import { useCallback, useSyncExternalStore } from "react";
+import { getLanguage, getVersion, setLanguage, subscribe, t } from "../index";
+import { LANGUAGES } from "../languages";
+
+// Re-renders the caller when the language (or its bundle) changes
+export const useLanguageSwitcher = () => {
+  useSyncExternalStore(subscribe, getVersion);
+  const language = getLanguage();
+  const changeLanguage = useCallback((code) => setLanguage(code), []);
+  return { language, languages: LANGUAGES, changeLanguage, t };
+};
+
+export default useLanguageSwitcher;
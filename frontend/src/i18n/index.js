@@ -0,0 +1,72 @@
+import API from "../services/api";
+import { DEFAULT_LANGUAGE, isSupported } from "./languages";
+
+// Bundles are flat key -> string maps compiled by the backend. Each one is
+// kept in localStorage with its ETag, so a reload revalidates with
+// If-None-Match and only downloads the bundle again after it changed.
+const STORAGE_KEY = "i18n:bundle:";
+const LANGUAGE_KEY = "i18n:language";
+
+const bundles = {};
+const listeners = new Set();
+let version = 0;
+let language = localStorage.getItem(LANGUAGE_KEY) || DEFAULT_LANGUAGE;
+
+const readStored = (code) => {
+  try {
+    return JSON.parse(localStorage.getItem(STORAGE_KEY + code));
+  } catch {
+    return null;
+  }
+};
+
+const notify = () => {
+  version += 1;
+  listeners.forEach((listener) => listener());
+};
+
+export const loadBundle = async (code) => {
+  const stored = bundles[code] || readStored(code);
+  const res = await API.get(`/localization/${code}`, {
+    headers: stored?.etag ? { "If-None-Match": stored.etag } : {},
+    validateStatus: (status) => status === 200 || status === 304,
+  });
+  if (res.status === 304 && stored) {
+    bundles[code] = stored;
+  } else {
+    bundles[code] = { etag: res.headers.etag, messages: res.data.messages };
+    localStorage.setItem(STORAGE_KEY + code, JSON.stringify(bundles[code]));
+  }
+  return bundles[code];
+};
+
+export const getLanguage = () => language;
+
+// Changes whenever the language or its bundle does (for useSyncExternalStore)
+export const getVersion = () => version;
+
+export const setLanguage = async (code) => {
+  const next = isSupported(code) ? code : DEFAULT_LANGUAGE;
+  await loadBundle(next);
+  language = next;
+  localStorage.setItem(LANGUAGE_KEY, next);
+  document.documentElement.lang = next;
+  notify();
+};
+
+export const subscribe = (listener) => {
+  listeners.add(listener);
+  return () => listeners.delete(listener);
+};
+
+// t("jobs.count", { count: 3 }) -> "3 jobs found"; unknown keys render as the key
+export const t = (key, values) => {
+  const messages = (bundles[language] || readStored(language))?.messages || {};
+  const text = messages[key] ?? key;
+  if (!values) return text;
+  return text.replace(/\{\{\s*(\w+)\s*\}\}/g, (match, name) =>
+    name in values ? String(values[name]) : match
+  );
+};
+
+export const initI18n = () => setLanguage(language).catch(() => notify());
@@ -0,0 +1,10 @@
+// Locales served by GET /api/localization/{locale}
+export const DEFAULT_LANGUAGE = "en";
+
+export const LANGUAGES = [
+  { code: "en", label: "English" },
+  { code: "fr", label: "Français" },
+  { code: "hi", label: "हिन्दी" },
+];
+
+export const isSupported = (code) => LANGUAGES.some((language) => language.code === code);
@@ -38,6 +38,7 @@ const Jobs = () => {
   const [employmentType, setEmploymentType] = useState("");
   const [remoteOnly, setRemoteOnly] = useState(false);
   const [showFilters, setShowFilters] = useState(false);
+  const [facets, setFacets] = useState(null);
 
   const employmentTypes = [
     "All",
@@ -48,13 +49,30 @@ const Jobs = () => {
     "Internship",
   ];
   const salaryRanges = ["All", "$0-50k", "$50k-100k", "$100k-150k", "$150k+"];
+  // Annual USD bounds sent as salary_min / salary_max
+  const salaryBounds = {
+    "$0-50k": [0, 50000],
+    "$50k-100k": [50000, 100000],
+    "$100k-150k": [100000, 150000],
+    "$150k+": [150000, ""],
+  };
 
+  // Location, type, remote and salary are filtered server-side; the
+  // response also carries the facet counts shown next to each option
   useEffect(() => {
     const getJobs = async () => {
+      const [salaryMin, salaryMax] = salaryBounds[salaryRange] || ["", ""];
       try {
-        const data = await fetchJobs();
-        setJobs(data);
-        setFilteredJobs(data);
+        const data = await fetchJobs({
+          location: locationFilter,
+          employment_type: employmentType,
+          remote: remoteOnly,
+          salary_min: salaryMin,
+          salary_max: salaryMax,
+          facets: true,
+        });
+        setJobs(data.items);
+        setFacets(data.facets);
       } catch (error) {
         console.error("Failed to fetch jobs:", error);
       } finally {
@@ -63,7 +81,10 @@ const Jobs = () => {
     };
 
     getJobs();
-  }, []);
+  }, [locationFilter, employmentType, remoteOnly, salaryRange]);
+
+  const facetCount = (facet, value) =>
+    facets?.[facet]?.find((entry) => entry.value === value)?.count ?? 0;
 
   // Handle URL parameters
   useEffect(() => {
@@ -82,81 +103,12 @@ const Jobs = () => {
         (job) =>
           job.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
           job.company.toLowerCase().includes(searchTerm.toLowerCase()) ||
-          job.description.toLowerCase().includes(searchTerm.toLowerCase())
-      );
-    }
-
-    // Location filter
-    if (locationFilter) {
-      filtered = filtered.filter((job) =>
-        job.location.toLowerCase().includes(locationFilter.toLowerCase())
-      );
-    }
-
-    // Employment type filter
-    if (employmentType && employmentType !== "All") {
-      filtered = filtered.filter(
-        (job) => job.employment_type === employmentType
+          job.description?.toLowerCase().includes(searchTerm.toLowerCase())
       );
     }
 
-    // Remote filter
-    if (remoteOnly) {
-      filtered = filtered.filter((job) => job.remote === true);
-    }
-
-    // Salary range filter (simplified)
-    if (salaryRange && salaryRange !== "All") {
-      // This would need more sophisticated parsing in a real app
-      filtered = filtered.filter((job) => {
-        // Simple keyword matching for demo
-        const salary = job.salary.toLowerCase();
-        switch (salaryRange) {
-          case "$0-50k":
-            return (
-              salary.includes("50") ||
-              salary.includes("40") ||
-              salary.includes("30")
-            );
-          case "$50k-100k":
-            return (
-              salary.includes("50") ||
-              salary.includes("60") ||
-              salary.includes("70") ||
-              salary.includes("80") ||
-              salary.includes("90")
-            );
-          case "$100k-150k":
-            return (
-              salary.includes("100") ||
-              salary.includes("110") ||
-              salary.includes("120") ||
-              salary.includes("130") ||
-              salary.includes("140")
-            );
-          case "$150k+":
-            return (
-              salary.includes("150") ||
-              salary.includes("160") ||
-              salary.includes("170") ||
-              salary.includes("180") ||
-              salary.includes("200")
-            );
-          default:
-            return true;
-        }
-      });
-    }
-
     setFilteredJobs(filtered);
-  }, [
-    jobs,
-    searchTerm,
-    locationFilter,
-    employmentType,
-    remoteOnly,
-    salaryRange,
-  ]);
+  }, [jobs, searchTerm]);
 
   const clearFilters = () => {
     setSearchTerm("");
@@ -258,7 +210,9 @@ const Jobs = () => {
                       >
                         {employmentTypes.map((type) => (
                           <option key={type} value={type === "All" ? "" : type}>
-                            {type}
+                            {type === "All" || !facets
+                              ? type
+                              : `${type} (${facetCount("employment_type", type)})`}
                           </option>
                         ))}
                       </select>
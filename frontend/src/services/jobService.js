@@ -5,8 +5,18 @@ export const fetchSampleJobs = async () => {
   return res.data;
 };
 
+// Filters are applied server-side; empty values are dropped and arrays
+// (skills) are sent as repeated keys: ?skills=react&skills=css
 export const fetchJobs = async (filters = {}) => {
-  const res = await API.get("/jobs/", { params: filters });
+  const params = Object.fromEntries(
+    Object.entries(filters).filter(
+      ([, value]) => value !== "" && value !== null && value !== undefined && value !== false
+    )
+  );
+  const res = await API.get("/jobs/", {
+    params,
+    paramsSerializer: { indexes: null },
+  });
   return res.data;
 };
 
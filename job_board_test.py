@@ -188,7 +188,7 @@ class JobBoardTester:
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = response.json().get("items")
                 if isinstance(data, list):
                     self.log_test(test_name, True, f"Retrieved {len(data)} jobs successfully")
                     return True, data